@@ -5,13 +5,24 @@ Lists all Load Balancers (ALB, NLB, CLB) and allows safe deletion with cost anal
 Load balancers can cost $18-20+ per month each, making them expensive if unused.
 """
 
-import boto3
-import argparse
 import sys
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Any
+# boto3, botocore.config and argparse are imported lazily (see setup_aws_session and main) since
+# importing the module should stay cheap; the exception classes are needed by the except clauses below
 from botocore.exceptions import ClientError, NoCredentialsError, EndpointConnectionError
 import time
+import os
+import re
+import pickle
+import hashlib
+import io
+import shutil
+import threading
+import math
+import operator
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 class Colors:
     """ANSI color codes for terminal output"""
@@ -22,16 +33,125 @@ class Colors:
     BOLD = '\033[1m'
     END = '\033[0m'
 
+# Invariant separator lines, headers and money formatters used by the reports
+SEP_BLUE_50 = f"{Colors.BLUE}{'='*50}{Colors.END}"
+SEP_BLUE_60 = f"{Colors.BLUE}{'='*60}{Colors.END}"
+SEP_BLUE_70 = f"{Colors.BLUE}{'='*70}{Colors.END}"
+SEP_BLUE_140 = f"{Colors.BLUE}{'='*140}{Colors.END}"
+SEP_RED_70 = f"{Colors.RED}{'='*70}{Colors.END}"
+SEP_YELLOW = f"{Colors.YELLOW}{'='*50}{Colors.END}"
+HDR_DELETION_OPTIONS = f"\n{Colors.YELLOW}⚠️  DELETION OPTIONS{Colors.END}"
+fmt_money = f"{Colors.YELLOW}${{:.2f}}{Colors.END}".format
+fmt_savings = f"{Colors.GREEN}${{:.2f}}{Colors.END}".format
+
+# Rough monthly base cost estimates per load balancer type (varies by region)
+COST_ESTIMATES = {
+    'application': 22.50,  # ALB: ~$22.50/month base
+    'network': 22.50,      # NLB: ~$22.50/month base
+    'classic': 18.00       # CLB: ~$18.00/month base
+}
+
+# Some regions are more expensive
+EXPENSIVE_REGIONS = frozenset(['ap-south-1', 'ap-southeast-1', 'sa-east-1'])
+
+# Name fragments that suggest a load balancer is important ('production' subsumes 'prod')
+IMPORTANT_NAME_RE = re.compile(r'(prod(?:uction)?|api|public|main|primary|critical|live|web|app|frontend)')
+
+# Target groups per describe_target_health work item, bounding fan-out in huge accounts
+TARGET_GROUP_CHUNK_SIZE = 20
+
+# On-disk cache of AWS responses used with --cache; TTLs are in seconds
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'alb_cleanup')
+REGION_CACHE_TTL = 300
+LB_LIST_CACHE_TTL = 300
+METRICS_CACHE_TTL = 60
+
+# GetMetricData limit on metric queries per request
+METRIC_QUERIES_PER_REQUEST = 500
+
+# Concurrent DeleteLoadBalancer calls allowed per region
+DELETE_CONCURRENCY_PER_REGION = 5
+
+# Error codes AWS returns when a request is rate limited
+THROTTLING_ERROR_CODES = frozenset(['Throttling', 'ThrottlingException', 'RequestLimitExceeded', 'TooManyRequestsException'])
+
+# Regions probed and scanned by the tool
+SCAN_REGIONS = (
+    'us-east-1', 'us-west-2', 'ap-south-1',
+    'ap-southeast-1', 'eu-west-1', 'eu-central-1'
+)
+
+# Monthly cost per (lb_type, region), precomputed for every type and scanned region
+MONTHLY_COST_TABLE = {
+    (lb_type, region): base_cost * (1.2 if region in EXPENSIVE_REGIONS else 1.0)
+    for lb_type, base_cost in COST_ESTIMATES.items()
+    for region in SCAN_REGIONS
+}
+
+def monthly_cost_estimate(lb_type: str, region: str) -> float:
+    """Estimate monthly cost for load balancer type in a region"""
+    cost = MONTHLY_COST_TABLE.get((lb_type, region))
+    if cost is None:
+        multiplier = 1.2 if region in EXPENSIVE_REGIONS else 1.0
+        cost = COST_ESTIMATES.get(lb_type, 20.00) * multiplier
+    return cost
+
 class LoadBalancerCleaner:
-    def __init__(self, profile_name: str = None):
+    # CloudWatch namespace, metric, dimension and statistic used as the activity signal per LB type
+    ACTIVITY_METRICS = {
+        'application': ('AWS/ApplicationELB', 'RequestCount', 'LoadBalancer', 'Sum'),
+        'network': ('AWS/NetworkELB', 'ActiveFlowCount_TCP', 'LoadBalancer', 'Average'),
+        'classic': ('AWS/ELB', 'RequestCount', 'LoadBalancerName', 'Sum')
+    }
+    
+    def __init__(self, profile_name: str = None, max_workers: int = 16,
+                 use_cache: bool = False, fresh: bool = False):
         """Initialize the AWS Load Balancer cleaner"""
         self.profile_name = profile_name
+        self.max_workers = max(1, max_workers)
+        # --fresh ignores cached responses but still refreshes the cache
+        self.use_cache = use_cache or fresh
+        self.fresh = fresh
         self.session = None
+        self.account_info = None
         self.accessible_regions = []
+        # One client per (service, region); boto3 sessions are not thread-safe, so creation is serialized
+        self._clients: Dict[tuple, Any] = {}
+        self._client_lock = threading.Lock()
+        from botocore.config import Config
+        
+        # Larger keep-alive pool so concurrent calls don't queue on the default 10 connections, short
+        # connect/read timeouts instead of the 60s defaults, and adaptive retries (client-side rate
+        # limiting with backoff) to absorb throttling during bursty scans
+        self._boto_config = Config(
+            max_pool_connections=64,
+            retries={'max_attempts': 10, 'mode': 'adaptive'},
+            connect_timeout=3,
+            read_timeout=10,
+            tcp_keepalive=True
+        )
+        # Region probes fail fast instead of waiting out the scan's read timeout and retries,
+        # but still get a couple of retries so one throttled call doesn't drop a region
+        self._probe_config = self._boto_config.merge(Config(
+            read_timeout=5,
+            retries={'max_attempts': 3, 'mode': 'standard'}
+        ))
+        # Shared pool for leaf API calls (target health); capped to stay within the connection pool
+        self._api_executor = ThreadPoolExecutor(max_workers=min(32, self.max_workers * 2))
+        # Regions that hit API throttling; their target health calls are serialized through the lock
+        self._throttled_regions: Dict[str, threading.Lock] = {}
+        self._throttle_lock = threading.Lock()
+        # Accessible regions whose connectivity probe found no ALB/NLBs
+        self._regions_without_elbv2 = set()
+        # Listed load balancers indexed by name, rebuilt by run()
+        self._lb_by_name: Dict[str, List[Dict[str, Any]]] = {}
+        self.start_scan_clock()
         self.setup_aws_session()
         
     def setup_aws_session(self):
         """Setup AWS session with the specified profile"""
+        import boto3
+        
         try:
             if self.profile_name:
                 self.session = boto3.Session(profile_name=self.profile_name)
@@ -41,8 +161,9 @@ class LoadBalancerCleaner:
                 print(f"{Colors.BLUE}Using default AWS profile{Colors.END}")
             
             # Test credentials
-            sts = self.session.client('sts')
+            sts = self._client('sts')
             identity = sts.get_caller_identity()
+            self.account_info = identity
             
             print(f"{Colors.GREEN}✓ Connected to AWS Account: {identity['Account']}{Colors.END}")
             print(f"{Colors.GREEN}✓ User/Role: {identity['Arn']}{Colors.END}")
@@ -55,26 +176,103 @@ class LoadBalancerCleaner:
             print(f"{Colors.RED}Error: {e}{Colors.END}")
             sys.exit(1)
     
+    def start_scan_clock(self):
+        """Fix the reference time and 30-day metrics window shared by every LB in a scan"""
+        self._scan_start_time = datetime.now(timezone.utc)
+        self._scan_metric_window = (self._scan_start_time - timedelta(days=30), self._scan_start_time)
+    
+    def _client(self, service: str, region: str = None, probe: bool = False):
+        """Get the client for a service and region, creating it on first use"""
+        key = (service, region, probe)
+        with self._client_lock:
+            client = self._clients.get(key)
+            if client is None:
+                config = self._probe_config if probe else self._boto_config
+                client = self.session.client(service, region_name=region, config=config)
+                self._clients[key] = client
+            return client
+    
+    def _cache_path(self, key: tuple) -> str:
+        """Cache file for a response key, scoped to the profile and account"""
+        digest = hashlib.sha256(repr((self.account_info['Account'],) + key).encode()).hexdigest()[:32]
+        return os.path.join(CACHE_DIR, self.profile_name or 'default', f"{key[0]}-{digest}.pickle")
+    
+    def cached_call(self, key: tuple, ttl: int, fn):
+        """Return fn(), reusing a result cached on disk by an earlier run when --cache is on"""
+        if not self.use_cache:
+            return fn()
+        
+        path = self._cache_path(key)
+        if not self.fresh:
+            try:
+                if time.time() - os.path.getmtime(path) < ttl:
+                    with open(path, 'rb') as f:
+                        return pickle.load(f)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                pass
+        
+        result = fn()
+        try:
+            os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(result, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+        return result
+    
+    def clear_cache(self):
+        """Drop cached responses for this profile (they're stale once anything is deleted)"""
+        shutil.rmtree(os.path.join(CACHE_DIR, self.profile_name or 'default'), ignore_errors=True)
+    
     def test_region_connectivity(self) -> List[str]:
         """Test connectivity to different AWS regions"""
-        test_regions = [
-            'us-east-1', 'us-west-2', 'ap-south-1', 
-            'ap-southeast-1', 'eu-west-1', 'eu-central-1'
-        ]
+        test_regions = list(SCAN_REGIONS)
         
-        accessible_regions = []
         print(f"\n{Colors.BLUE}Testing region connectivity...{Colors.END}")
         
-        for region in test_regions:
+        def probe_region(region: str):
             try:
-                elbv2 = self.session.client('elbv2', region_name=region)
-                elbv2.describe_load_balancers(PageSize=1)
+                elbv2 = self._client('elbv2', region, probe=True)
+                # A one-item listing is as cheap as any elbv2 call and also tells whether the
+                # region has ALB/NLBs at all (account limits only report quotas, not usage)
+                response = elbv2.describe_load_balancers(PageSize=1)
+                return True, None, bool(response['LoadBalancers'])
+            except ClientError as e:
+                # Throttling or a server error says nothing about access, so the region is scanned anyway
+                error = e.response.get('Error', {}).get('Code')
+                if error in THROTTLING_ERROR_CODES or e.response.get('ResponseMetadata', {}).get('HTTPStatusCode', 0) >= 500:
+                    return True, error, True
+                return False, None, False
+            except EndpointConnectionError:
+                return False, None, False
+            except Exception as e:
+                return False, str(e), False
+        
+        def probe_all_regions():
+            # Probe all regions at once, then report in the original region order
+            with ThreadPoolExecutor(max_workers=len(test_regions)) as executor:
+                return dict(zip(test_regions, executor.map(probe_region, test_regions)))
+        
+        probe_results = self.cached_call(('region_probe', tuple(test_regions)), REGION_CACHE_TTL, probe_all_regions)
+        
+        accessible_regions = []
+        self._regions_without_elbv2 = set()
+        for region in test_regions:
+            ok, error, has_elbv2 = probe_results[region]
+            if ok and error:
+                print(f"{Colors.YELLOW}? {region} - probe failed ({error}), scanning anyway{Colors.END}")
+                accessible_regions.append(region)
+            elif ok:
                 print(f"{Colors.GREEN}✓ {region} - accessible{Colors.END}")
                 accessible_regions.append(region)
-            except (EndpointConnectionError, ClientError) as e:
+                if not has_elbv2:
+                    self._regions_without_elbv2.add(region)
+            elif error is None:
                 print(f"{Colors.RED}✗ {region} - not accessible{Colors.END}")
-            except Exception as e:
-                print(f"{Colors.RED}✗ {region} - error: {str(e)[:50]}...{Colors.END}")
+            else:
+                print(f"{Colors.RED}✗ {region} - error: {error[:50]}...{Colors.END}")
         
         if not accessible_regions:
             print(f"{Colors.RED}Error: No accessible regions found!{Colors.END}")
@@ -83,90 +281,88 @@ class LoadBalancerCleaner:
         self.accessible_regions = accessible_regions
         return accessible_regions
     
-    def get_lb_metrics(self, lb_name: str, lb_type: str, region: str) -> Dict[str, Any]:
-        """Get CloudWatch metrics for load balancer"""
+    def needs_activity_metrics(self, created_time: datetime, target_count: int) -> bool:
+        """LBs created less than a day ago with no targets have no meaningful 30-day activity"""
+        return target_count > 0 or (self._scan_start_time - created_time).days >= 1
+    
+    def fetch_metrics_bulk(self, lbs: List[tuple], region: str, window: tuple) -> Dict[str, Dict[str, Any]]:
+        """Get CloudWatch metrics for (dimension_value, lb_type) pairs, keyed by dimension_value"""
+        if not lbs:
+            return {}
+        
+        # Every query uses the same scan-wide 30-day window
+        start_time, end_time = window
+        
+        queries = []
+        for i, (lb_id, lb_type) in enumerate(lbs):
+            namespace, metric_name, dimension_name, stat = self.ACTIVITY_METRICS[lb_type]
+            queries.append({
+                'Id': f"m{i}",
+                'MetricStat': {
+                    'Metric': {
+                        'Namespace': namespace,
+                        'MetricName': metric_name,
+                        'Dimensions': [{'Name': dimension_name, 'Value': lb_id}]
+                    },
+                    'Period': 86400,
+                    'Stat': stat
+                },
+                'ReturnData': True
+            })
+        
+        def fetch_batch(batch: List[Dict[str, Any]]) -> Dict[str, List[float]]:
+            batch_datapoints = {}
+            paginator = self._client('cloudwatch', region).get_paginator('get_metric_data')
+            for page in paginator.paginate(MetricDataQueries=batch, StartTime=start_time, EndTime=end_time):
+                for result in page['MetricDataResults']:
+                    batch_datapoints.setdefault(result['Id'], []).extend(result['Values'])
+            return batch_datapoints
+        
+        datapoints = {}
         try:
-            cloudwatch = self.session.client('cloudwatch', region_name=region)
-            
-            # Get metrics for the last 30 days
-            end_time = datetime.now(timezone.utc)
-            start_time = end_time - timedelta(days=30)
-            
-            metrics = {}
-            
-            if lb_type in ['application', 'network']:
-                # ALB/NLB metrics
-                namespace = 'AWS/ApplicationELB' if lb_type == 'application' else 'AWS/NetworkELB'
-                
-                # Request count
-                request_response = cloudwatch.get_metric_statistics(
-                    Namespace=namespace,
-                    MetricName='RequestCount' if lb_type == 'application' else 'ActiveFlowCount_TCP',
-                    Dimensions=[{'Name': 'LoadBalancer', 'Value': lb_name}],
-                    StartTime=start_time,
-                    EndTime=end_time,
-                    Period=86400,
-                    Statistics=['Sum'] if lb_type == 'application' else ['Average']
-                )
-                
-                if request_response['Datapoints']:
-                    if lb_type == 'application':
-                        metrics['total_requests'] = sum(point['Sum'] for point in request_response['Datapoints'])
-                    else:
-                        metrics['avg_active_flows'] = max(point['Average'] for point in request_response['Datapoints'])
-                else:
-                    metrics['total_requests'] = 0 if lb_type == 'application' else 0
-                    metrics['avg_active_flows'] = 0 if lb_type == 'network' else 0
-                
+            # GetMetricData accepts at most 500 queries per request; large regions issue the
+            # batches concurrently on the shared executor
+            batches = [queries[start:start + METRIC_QUERIES_PER_REQUEST]
+                       for start in range(0, len(queries), METRIC_QUERIES_PER_REQUEST)]
+            if len(batches) == 1:
+                datapoints = fetch_batch(batches[0])
             else:
-                # Classic Load Balancer metrics
-                request_response = cloudwatch.get_metric_statistics(
-                    Namespace='AWS/ELB',
-                    MetricName='RequestCount',
-                    Dimensions=[{'Name': 'LoadBalancerName', 'Value': lb_name}],
-                    StartTime=start_time,
-                    EndTime=end_time,
-                    Period=86400,
-                    Statistics=['Sum']
-                )
-                
-                metrics['total_requests'] = sum(point['Sum'] for point in request_response['Datapoints']) if request_response['Datapoints'] else 0
-            
-            return metrics
-            
+                for future in [self._api_executor.submit(fetch_batch, batch) for batch in batches]:
+                    datapoints.update(future.result())
+                        
         except ClientError as e:
-            return {'error': str(e), 'total_requests': 0}
+            return {lb_id: {'error': str(e), 'total_requests': 0} for lb_id, _ in lbs}
+        
+        metrics = {}
+        for i, (lb_id, lb_type) in enumerate(lbs):
+            values = datapoints.get(f"m{i}", [])
+            if not values and lb_type != 'classic':
+                metrics[lb_id] = {'total_requests': 0, 'avg_active_flows': 0}
+            elif lb_type == 'network':
+                metrics[lb_id] = {'avg_active_flows': max(values)}
+            else:
+                metrics[lb_id] = {'total_requests': sum(values)}
+        
+        return metrics
     
     def get_monthly_cost_estimate(self, lb_type: str, region: str) -> float:
         """Estimate monthly cost for load balancer type"""
-        # Rough cost estimates (varies by region)
-        cost_estimates = {
-            'application': 22.50,  # ALB: ~$22.50/month base
-            'network': 22.50,      # NLB: ~$22.50/month base  
-            'classic': 18.00       # CLB: ~$18.00/month base
-        }
-        
-        # Some regions are more expensive
-        expensive_regions = ['ap-south-1', 'ap-southeast-1', 'sa-east-1']
-        multiplier = 1.2 if region in expensive_regions else 1.0
-        
-        return cost_estimates.get(lb_type, 20.00) * multiplier
+        return monthly_cost_estimate(lb_type, region)
     
-    def check_lb_safety(self, lb_info: Dict[str, Any]) -> Dict[str, Any]:
+    def check_lb_safety(self, lb_info: Dict[str, Any], now: datetime) -> Dict[str, Any]:
         """Check if load balancer appears to be important or in use"""
         lb_name = lb_info['name']
         safety_warnings = []
         
-        # Check for important patterns in name
-        important_patterns = [
-            'prod', 'production', 'api', 'public', 'main', 'primary',
-            'critical', 'live', 'web', 'app', 'frontend'
-        ]
+        # Listed first so the short warning listings never cut it
+        if not lb_info['targets_checked']:
+            safety_warnings.append("Target count unknown (target health lookup failed)")
         
+        # Check for important patterns in name (single regex pass, one warning per distinct match)
         name_lower = lb_name.lower()
-        for pattern in important_patterns:
-            if pattern in name_lower:
-                safety_warnings.append(f"Name contains '{pattern}' - might be important")
+        matches = dict.fromkeys(m.group(1) for m in IMPORTANT_NAME_RE.finditer(name_lower))
+        for pattern in matches:
+            safety_warnings.append(f"Name contains '{pattern}' - might be important")
         
         # Check if LB has targets
         target_count = lb_info.get('target_count', 0)
@@ -186,7 +382,7 @@ class LoadBalancerCleaner:
         
         # Check if recently created (within 7 days)
         created_time = lb_info['created_time']
-        days_since_created = (datetime.now(timezone.utc) - created_time).days
+        days_since_created = (now - created_time).days
         if days_since_created <= 7:
             safety_warnings.append(f"Recently created ({days_since_created} days ago)")
         
@@ -196,41 +392,104 @@ class LoadBalancerCleaner:
             'days_since_created': days_since_created
         }
     
-    def get_target_group_info(self, lb_arn: str, region: str) -> Dict[str, int]:
-        """Get target group information for ALB/NLB"""
+    def get_region_target_info(self, region: str, lb_arns: List[str]) -> Dict[str, Dict[str, int]]:
+        """Get target group information for a region's ALB/NLBs, keyed by load balancer ARN"""
+        elbv2 = self._client('elbv2', region)
+        
+        # List every target group in the region once and map it onto the listed load balancers
+        tgs_by_lb = {lb_arn: [] for lb_arn in lb_arns}
         try:
-            elbv2 = self.session.client('elbv2', region_name=region)
-            
-            # Get target groups for this load balancer
-            tg_response = elbv2.describe_target_groups(LoadBalancerArn=lb_arn)
-            
-            total_targets = 0
-            healthy_targets = 0
-            
-            for tg in tg_response['TargetGroups']:
-                tg_arn = tg['TargetGroupArn']
-                
-                # Get target health
-                health_response = elbv2.describe_target_health(TargetGroupArn=tg_arn)
-                
-                for target in health_response['TargetHealthDescriptions']:
-                    total_targets += 1
-                    if target['TargetHealth']['State'] == 'healthy':
-                        healthy_targets += 1
-            
-            return {
-                'target_count': total_targets,
-                'healthy_target_count': healthy_targets,
-                'target_group_count': len(tg_response['TargetGroups'])
+            target_groups = self.describe_target_groups(region)
+        except ClientError:
+            # Without the target groups no LB's targets are known, which is not the same as having none
+            unknown = {'target_count': 0, 'healthy_target_count': 0, 'target_group_count': 0, 'targets_checked': False}
+            return {lb_arn: dict(unknown) for lb_arn in lb_arns}
+        for tg in target_groups:
+            for lb_arn in tg['LoadBalancerArns']:
+                if lb_arn in tgs_by_lb:
+                    tgs_by_lb[lb_arn].append(tg['TargetGroupArn'])
+        
+        # Target health is fetched once per attached target group, in chunks, concurrently on the shared client
+        tg_arns = list(dict.fromkeys(tg_arn for arns in tgs_by_lb.values() for tg_arn in arns))
+        chunks = [tg_arns[i:i + TARGET_GROUP_CHUNK_SIZE] for i in range(0, len(tg_arns), TARGET_GROUP_CHUNK_SIZE)]
+        
+        if region in self._throttled_regions:
+            chunk_counts = [self._count_target_health_chunk(elbv2, chunk, region) for chunk in chunks]
+        else:
+            chunk_futures = [
+                self._api_executor.submit(self._count_target_health_chunk, elbv2, chunk, region)
+                for chunk in chunks
+            ]
+            chunk_counts = [future.result() for future in chunk_futures]
+        
+        health_by_tg = dict(zip(tg_arns, (counts for chunk in chunk_counts for counts in chunk)))
+        
+        # A target group whose health lookup failed leaves its load balancers' counts unknown
+        targets_by_arn = {}
+        for lb_arn, lb_tg_arns in tgs_by_lb.items():
+            lb_counts = [health_by_tg[tg_arn] for tg_arn in lb_tg_arns]
+            known_counts = [counts for counts in lb_counts if counts is not None]
+            targets_by_arn[lb_arn] = {
+                'target_count': sum(counts[0] for counts in known_counts),
+                'healthy_target_count': sum(counts[1] for counts in known_counts),
+                'target_group_count': len(lb_tg_arns),
+                'targets_checked': len(known_counts) == len(lb_counts)
             }
+        return targets_by_arn
+    
+    def _note_throttle(self, region: str):
+        """Switch a region to serialized target health lookups after a throttling error"""
+        with self._throttle_lock:
+            if region in self._throttled_regions:
+                return
+            self._throttled_regions[region] = threading.Lock()
+        print(f"{Colors.YELLOW}⚠ ELB API throttling in {region} - serializing target health lookups "
+              f"(consider a lower --max-workers){Colors.END}")
+    
+    def _count_target_health_chunk(self, elbv2, tg_arns: List[str], region: str) -> List[tuple]:
+        """Return (total, healthy) target counts for each target group in a chunk, None where the lookup failed"""
+        counts = []
+        
+        for tg_arn in tg_arns:
+            try:
+                try:
+                    tg_counts = self._count_target_health(elbv2, tg_arn, region)
+                except ClientError as e:
+                    if e.response['Error']['Code'] not in THROTTLING_ERROR_CODES:
+                        raise
+                    # Retries were exhausted; retry once more on the region's serial path
+                    self._note_throttle(region)
+                    tg_counts = self._count_target_health(elbv2, tg_arn, region)
+            except ClientError:
+                # e.g. a target group deleted since it was listed, or throttled again
+                tg_counts = None
             
-        except ClientError:
-            return {'target_count': 0, 'healthy_target_count': 0, 'target_group_count': 0}
+            counts.append(tg_counts)
+        
+        return counts
+    
+    def _count_target_health(self, elbv2, tg_arn: str, region: str) -> tuple:
+        """Return (total, healthy) target counts for a target group"""
+        serial_lock = self._throttled_regions.get(region)
+        if serial_lock is None:
+            health_response = elbv2.describe_target_health(TargetGroupArn=tg_arn)
+        else:
+            with serial_lock:
+                health_response = elbv2.describe_target_health(TargetGroupArn=tg_arn)
+        
+        total_targets = 0
+        healthy_targets = 0
+        for target in health_response['TargetHealthDescriptions']:
+            total_targets += 1
+            if target['TargetHealth']['State'] == 'healthy':
+                healthy_targets += 1
+        
+        return total_targets, healthy_targets
     
     def get_clb_instances(self, lb_name: str, region: str) -> Dict[str, int]:
         """Get instance information for Classic Load Balancer"""
         try:
-            elb = self.session.client('elb', region_name=region)
+            elb = self._client('elb', region)
             
             # Get instance health
             health_response = elb.describe_instance_health(LoadBalancerName=lb_name)
@@ -241,57 +500,127 @@ class LoadBalancerCleaner:
             
             return {
                 'target_count': total_instances,
-                'healthy_target_count': healthy_instances
+                'healthy_target_count': healthy_instances,
+                'targets_checked': True
             }
             
         except ClientError:
-            return {'target_count': 0, 'healthy_target_count': 0}
+            return {'target_count': 0, 'healthy_target_count': 0, 'targets_checked': False}
+    
+    def describe_load_balancers(self, service: str, region: str) -> List[Dict[str, Any]]:
+        """Return the raw load balancer descriptions from the 'elbv2' or classic 'elb' API"""
+        result_key = 'LoadBalancers' if service == 'elbv2' else 'LoadBalancerDescriptions'
+        paginator = self._client(service, region).get_paginator('describe_load_balancers')
+        
+        raw_lbs = []
+        # 400 is the maximum page size the ELB APIs accept; botocore still follows NextMarker
+        for page in paginator.paginate(PaginationConfig={'PageSize': 400}):
+            raw_lbs.extend(page[result_key])
+        return raw_lbs
+    
+    def finalize_lb_info(self, lb_info: Dict[str, Any]):
+        """Add the safety check plus flags and cost strings derived once per load balancer"""
+        lb_info['safety'] = self.check_lb_safety(lb_info, self._scan_start_time)
+        
+        # Flat flags for the summary and selection menu
+        lb_info['_risky'] = lb_info['safety']['is_risky']
+        lb_info['_unused'] = (lb_info['targets_checked'] and lb_info['target_count'] == 0
+                              and lb_info['metrics'].get('total_requests', 0) == 0)
+        
+        lb_info['annual_cost'] = lb_info['monthly_cost'] * 12
+        lb_info['monthly_cost_str'] = f"${lb_info['monthly_cost']:.2f}"
+        lb_info['annual_cost_str'] = f"${lb_info['annual_cost']:.2f}"
+    
+    def fetch_targets_and_metrics(self, region: str, lbs: List[tuple], targets_key: tuple, fetch_targets) -> tuple:
+        """Look up targets and activity metrics for (key, dimension_value, lb_type, created_time) entries"""
+        def fetch_metrics(metric_lbs: List[tuple]) -> Dict[str, Dict[str, Any]]:
+            if not metric_lbs:
+                return {}
+            return self.cached_call(
+                ('metrics', region, tuple(metric_lbs)), METRICS_CACHE_TTL,
+                lambda: self.fetch_metrics_bulk(metric_lbs, region, self._scan_metric_window)
+            )
+        
+        # Metrics for LBs at least a day old are needed whatever their targets, so they are
+        # fetched while the target lookups run
+        established = [(dimension, lb_type) for _, dimension, lb_type, created_time in lbs
+                       if self.needs_activity_metrics(created_time, 0)]
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            established_future = executor.submit(fetch_metrics, established)
+            targets_by_key = self.cached_call(targets_key, LB_LIST_CACHE_TTL, fetch_targets)
+            
+            # Recently created LBs only have meaningful activity once they have targets
+            recent = [(dimension, lb_type) for key, dimension, lb_type, created_time in lbs
+                      if not self.needs_activity_metrics(created_time, 0)
+                      and self.needs_activity_metrics(created_time, targets_by_key[key]['target_count'])]
+            metrics = fetch_metrics(recent)
+            metrics.update(established_future.result())
+        
+        return targets_by_key, metrics
+    
+    def describe_target_groups(self, region: str, **kwargs) -> List[Dict[str, Any]]:
+        """Return all target groups matching the given filters, following pagination"""
+        paginator = self._client('elbv2', region).get_paginator('describe_target_groups')
+        
+        target_groups = []
+        for page in paginator.paginate(PaginationConfig={'PageSize': 400}, **kwargs):
+            target_groups.extend(page['TargetGroups'])
+        return target_groups
     
     def list_alb_nlb_in_region(self, region: str) -> List[Dict[str, Any]]:
         """List Application and Network Load Balancers in a region"""
+        # The connectivity probe already showed this region has none
+        if region in self._regions_without_elbv2:
+            return []
+        
         try:
-            elbv2 = self.session.client('elbv2', region_name=region)
+            raw_lbs = self.cached_call(('describe_load_balancers', 'elbv2', region), LB_LIST_CACHE_TTL,
+                                       lambda: self.describe_load_balancers('elbv2', region))
             
-            load_balancers = []
-            paginator = elbv2.get_paginator('describe_load_balancers')
+            if not raw_lbs:
+                return []
             
-            for page in paginator.paginate():
-                for lb in page['LoadBalancers']:
-                    lb_name = lb['LoadBalancerName']
-                    lb_arn = lb['LoadBalancerArn']
-                    lb_type = lb['Type']  # 'application' or 'network'
-                    
-                    # Get metrics
-                    # For ALB/NLB, the LoadBalancer dimension uses the full ARN suffix
-                    lb_dimension_name = '/'.join(lb_arn.split('/')[-3:])
-                    metrics = self.get_lb_metrics(lb_dimension_name, lb_type, region)
-                    
-                    # Get target information
-                    target_info = self.get_target_group_info(lb_arn, region)
-                    
-                    # Estimate cost
-                    monthly_cost = self.get_monthly_cost_estimate(lb_type, region)
-                    
-                    lb_info = {
-                        'name': lb_name,
-                        'arn': lb_arn,
-                        'type': lb_type,
-                        'region': region,
-                        'scheme': lb['Scheme'],
-                        'state': lb['State']['Code'],
-                        'created_time': lb['CreatedTime'],
-                        'dns_name': lb['DNSName'],
-                        'vpc_id': lb['VpcId'],
-                        'availability_zones': [az['ZoneName'] for az in lb['AvailabilityZones']],
-                        'metrics': metrics,
-                        'monthly_cost': monthly_cost,
-                        **target_info
-                    }
-                    
-                    # Add safety check
-                    lb_info['safety'] = self.check_lb_safety(lb_info)
-                    
-                    load_balancers.append(lb_info)
+            # For ALB/NLB, the LoadBalancer dimension uses the full ARN suffix
+            dimensions = {lb['LoadBalancerArn']: '/'.join(lb['LoadBalancerArn'].split('/')[-3:]) for lb in raw_lbs}
+            
+            lb_arns = [lb['LoadBalancerArn'] for lb in raw_lbs]
+            
+            targets_by_arn, metrics_by_dimension = self.fetch_targets_and_metrics(
+                region,
+                [(lb['LoadBalancerArn'], dimensions[lb['LoadBalancerArn']], lb['Type'], lb['CreatedTime']) for lb in raw_lbs],
+                ('targets', region, tuple(lb_arns)),
+                lambda: self.get_region_target_info(region, lb_arns)
+            )
+            
+            load_balancers = []
+            for lb in raw_lbs:
+                lb_name = lb['LoadBalancerName']
+                lb_arn = lb['LoadBalancerArn']
+                lb_type = lb['Type']  # 'application' or 'network'
+                
+                # Estimate cost
+                monthly_cost = self.get_monthly_cost_estimate(lb_type, region)
+                
+                lb_info = {
+                    'name': lb_name,
+                    'arn': lb_arn,
+                    'type': lb_type,
+                    'region': region,
+                    'scheme': lb['Scheme'],
+                    'state': lb['State']['Code'],
+                    'created_time': lb['CreatedTime'],
+                    'dns_name': lb['DNSName'],
+                    'vpc_id': lb['VpcId'],
+                    'availability_zones': [az['ZoneName'] for az in lb['AvailabilityZones']],
+                    'metrics': metrics_by_dimension.get(dimensions[lb_arn], {'total_requests': 0, 'avg_active_flows': 0}),
+                    'monthly_cost': monthly_cost,
+                    **targets_by_arn[lb_arn]
+                }
+                
+                # Add safety check and derived display fields
+                self.finalize_lb_info(lb_info)
+                
+                load_balancers.append(lb_info)
             
             return load_balancers
             
@@ -302,43 +631,51 @@ class LoadBalancerCleaner:
     def list_clb_in_region(self, region: str) -> List[Dict[str, Any]]:
         """List Classic Load Balancers in a region"""
         try:
-            elb = self.session.client('elb', region_name=region)
+            raw_lbs = self.cached_call(('describe_load_balancers', 'elb', region), LB_LIST_CACHE_TTL,
+                                       lambda: self.describe_load_balancers('elb', region))
             
-            load_balancers = []
-            paginator = elb.get_paginator('describe_load_balancers')
+            if not raw_lbs:
+                return []
             
-            for page in paginator.paginate():
-                for lb in page['LoadBalancers']:
-                    lb_name = lb['LoadBalancerName']
-                    
-                    # Get metrics
-                    metrics = self.get_lb_metrics(lb_name, 'classic', region)
-                    
-                    # Get instance information
-                    instance_info = self.get_clb_instances(lb_name, region)
-                    
-                    # Estimate cost
-                    monthly_cost = self.get_monthly_cost_estimate('classic', region)
-                    
-                    lb_info = {
-                        'name': lb_name,
-                        'type': 'classic',
-                        'region': region,
-                        'scheme': lb['Scheme'],
-                        'state': 'active',  # CLBs don't have explicit state
-                        'created_time': lb['CreatedTime'],
-                        'dns_name': lb['DNSName'],
-                        'vpc_id': lb.get('VPCId', 'EC2-Classic'),
-                        'availability_zones': lb['AvailabilityZones'],
-                        'metrics': metrics,
-                        'monthly_cost': monthly_cost,
-                        **instance_info
-                    }
-                    
-                    # Add safety check
-                    lb_info['safety'] = self.check_lb_safety(lb_info)
-                    
-                    load_balancers.append(lb_info)
+            lb_names = [lb['LoadBalancerName'] for lb in raw_lbs]
+            
+            def fetch_instances():
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(lb_names))) as executor:
+                    return dict(zip(lb_names, executor.map(lambda name: self.get_clb_instances(name, region), lb_names)))
+            
+            instances_by_name, metrics_by_name = self.fetch_targets_and_metrics(
+                region,
+                [(lb['LoadBalancerName'], lb['LoadBalancerName'], 'classic', lb['CreatedTime']) for lb in raw_lbs],
+                ('instances', region, tuple(lb_names)),
+                fetch_instances
+            )
+            
+            load_balancers = []
+            for lb in raw_lbs:
+                lb_name = lb['LoadBalancerName']
+                
+                # Estimate cost
+                monthly_cost = self.get_monthly_cost_estimate('classic', region)
+                
+                lb_info = {
+                    'name': lb_name,
+                    'type': 'classic',
+                    'region': region,
+                    'scheme': lb['Scheme'],
+                    'state': 'active',  # CLBs don't have explicit state
+                    'created_time': lb['CreatedTime'],
+                    'dns_name': lb['DNSName'],
+                    'vpc_id': lb.get('VPCId', 'EC2-Classic'),
+                    'availability_zones': lb['AvailabilityZones'],
+                    'metrics': metrics_by_name.get(lb_name, {'total_requests': 0}),
+                    'monthly_cost': monthly_cost,
+                    **instances_by_name[lb_name]
+                }
+                
+                # Add safety check and derived display fields
+                self.finalize_lb_info(lb_info)
+                
+                load_balancers.append(lb_info)
             
             return load_balancers
             
@@ -346,7 +683,7 @@ class LoadBalancerCleaner:
             print(f"{Colors.RED}Error listing CLB in {region}: {e}{Colors.END}")
             return []
     
-    def format_lb_info(self, lb: Dict[str, Any]) -> str:
+    def format_lb_info(self, lb: Dict[str, Any], now: datetime) -> str:
         """Format load balancer information for display"""
         name = lb['name'][:20] if len(lb['name']) > 20 else lb['name']
         region = lb['region']
@@ -354,8 +691,10 @@ class LoadBalancerCleaner:
         scheme = lb['scheme'][:8]
         state = lb['state']
         
-        target_count = lb['target_count']
-        healthy_count = lb['healthy_target_count']
+        if lb['targets_checked']:
+            targets = f"{lb['target_count']:>2}/{lb['healthy_target_count']:<2}"
+        else:
+            targets = " ?/? "
         monthly_cost = lb['monthly_cost']
         
         # Activity indicator
@@ -366,7 +705,7 @@ class LoadBalancerCleaner:
             activity = f"{total_requests:,} reqs" if total_requests > 0 else "No activity"
         
         created_time = lb['created_time']
-        days_ago = (datetime.now(timezone.utc) - created_time).days
+        days_ago = (now - created_time).days
         
         # Safety indicator
         if lb['safety']['is_risky']:
@@ -374,100 +713,145 @@ class LoadBalancerCleaner:
         else:
             safety_indicator = f"{Colors.GREEN}✓{Colors.END}"
         
-        return f"  {name:<20} | {region:<12} | {lb_type:<7} | {scheme:<8} | {state:<10} | {target_count:>2}/{healthy_count:<2} | {activity:<12} | ${monthly_cost:>5.1f} | {days_ago:>3}d | {safety_indicator}"
+        return f"  {name:<20} | {region:<12} | {lb_type:<7} | {scheme:<8} | {state:<10} | {targets} | {activity:<12} | ${monthly_cost:>5.1f} | {days_ago:>3}d | {safety_indicator}"
+    
+    def summarize_load_balancers(self, load_balancers: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Aggregate cost, warning/unused counts and the per-type breakdown in a single pass"""
+        costs = []
+        risky_count = 0
+        unused_count = 0
+        type_counts = Counter()
+        types = {}
+        
+        for lb in load_balancers:
+            lb_type = lb['type']
+            is_unused = lb['_unused']
+            
+            costs.append(lb['monthly_cost'])
+            type_counts[lb_type] += 1
+            if lb['_risky']:
+                risky_count += 1
+            if is_unused:
+                unused_count += 1
+            
+            if lb_type not in types:
+                types[lb_type] = {'count': 0, 'cost': 0, 'unused': 0}
+            types[lb_type]['count'] += 1
+            types[lb_type]['cost'] += lb['monthly_cost']
+            if is_unused:
+                types[lb_type]['unused'] += 1
+        
+        return {
+            'total_cost': math.fsum(costs),
+            'risky_count': risky_count,
+            'unused_count': unused_count,
+            'type_counts': type_counts,
+            'types': types
+        }
     
     def list_all_load_balancers(self) -> List[Dict[str, Any]]:
         """List all load balancers across accessible regions"""
-        print(f"\n{Colors.BLUE}{'='*140}{Colors.END}")
+        print("\n" + SEP_BLUE_140)
         print(f"{Colors.BLUE}Scanning Load Balancers across regions...{Colors.END}")
-        print(f"{Colors.BLUE}{'='*140}{Colors.END}")
+        print(SEP_BLUE_140)
         
         all_load_balancers = []
-        total_cost = 0
         
-        for region in self.accessible_regions:
-            print(f"\n{Colors.YELLOW}Checking region: {region}{Colors.END}")
-            
-            # Get ALBs and NLBs
-            alb_nlb = self.list_alb_nlb_in_region(region)
+        # One task per (region, LB family) so ELBv2 and classic ELB listings overlap too;
+        # output is printed in region order afterwards
+        listers = (self.list_alb_nlb_in_region, self.list_clb_in_region)
+        region_results = {region: ([], []) for region in self.accessible_regions}
+        workers = min(self.max_workers, len(self.accessible_regions) * len(listers)) or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            future_to_task = {
+                executor.submit(lister, region): (region, index)
+                for region in self.accessible_regions
+                for index, lister in enumerate(listers)
+            }
             
-            # Get Classic Load Balancers
-            clb = self.list_clb_in_region(region)
+            for future in as_completed(future_to_task):
+                region, index = future_to_task[future]
+                try:
+                    region_results[region][index].extend(future.result())
+                except Exception as e:
+                    print(f"{Colors.RED}Error scanning {region}: {e}{Colors.END}")
+        
+        # The whole report is rendered into one buffer and written with a single call
+        out = io.StringIO()
+        
+        for region in self.accessible_regions:
+            print(f"\n{Colors.YELLOW}Checking region: {region}{Colors.END}", file=out)
             
+            alb_nlb, clb = region_results[region]
             region_lbs = alb_nlb + clb
             
             if region_lbs:
                 region_cost = sum(lb['monthly_cost'] for lb in region_lbs)
                 region_targets = sum(lb['target_count'] for lb in region_lbs)
+                unknown_targets = sum(1 for lb in region_lbs if not lb['targets_checked'])
                 
-                print(f"{Colors.GREEN}Found {len(region_lbs)} load balancers{Colors.END}")
-                print(f"  ALB/NLB: {len(alb_nlb)}, CLB: {len(clb)}")
-                print(f"  Total targets: {region_targets}")
-                print(f"  Estimated monthly cost: ${region_cost:.2f}")
+                print(f"{Colors.GREEN}Found {len(region_lbs)} load balancers{Colors.END}", file=out)
+                print(f"  ALB/NLB: {len(alb_nlb)}, CLB: {len(clb)}", file=out)
+                print(f"  Total targets: {region_targets}", file=out)
+                if unknown_targets:
+                    print(f"  {Colors.YELLOW}⚠ Target counts unknown for {unknown_targets} load balancers "
+                          f"(lookup failed; not treated as unused){Colors.END}", file=out)
+                print(f"  Estimated monthly cost: ${region_cost:.2f}", file=out)
                 
-                total_cost += region_cost
                 all_load_balancers.extend(region_lbs)
             else:
-                print(f"{Colors.GREEN}No load balancers found{Colors.END}")
-        
-        # Display summary
-        risky_count = sum(1 for lb in all_load_balancers if lb['safety']['is_risky'])
-        unused_count = sum(1 for lb in all_load_balancers if lb['metrics'].get('total_requests', 0) == 0 and lb['target_count'] == 0)
-        
-        # Count by type
-        alb_count = sum(1 for lb in all_load_balancers if lb['type'] == 'application')
-        nlb_count = sum(1 for lb in all_load_balancers if lb['type'] == 'network')
-        clb_count = sum(1 for lb in all_load_balancers if lb['type'] == 'classic')
-        
-        print(f"\n{Colors.BOLD}LOAD BALANCER SUMMARY{Colors.END}")
-        print(f"{Colors.BLUE}{'='*140}{Colors.END}")
-        
-        # Get current account info
-        sts = self.session.client('sts')
-        account_info = sts.get_caller_identity()
-        
-        print(f"AWS Account ID: {Colors.YELLOW}{account_info['Account']}{Colors.END}")
-        print(f"Total load balancers: {Colors.YELLOW}{len(all_load_balancers)}{Colors.END}")
-        print(f"  Application (ALB): {Colors.BLUE}{alb_count}{Colors.END}")
-        print(f"  Network (NLB): {Colors.BLUE}{nlb_count}{Colors.END}")
-        print(f"  Classic (CLB): {Colors.BLUE}{clb_count}{Colors.END}")
-        print(f"Load balancers with warnings: {Colors.RED}{risky_count}{Colors.END}")
-        print(f"Potentially unused load balancers: {Colors.YELLOW}{unused_count}{Colors.END}")
-        print(f"Total estimated monthly cost: {Colors.YELLOW}${total_cost:.2f}{Colors.END}")
-        print(f"Total estimated annual cost: {Colors.YELLOW}${total_cost * 12:.2f}{Colors.END}")
-        print(f"Regions scanned: {Colors.YELLOW}{', '.join(self.accessible_regions)}{Colors.END}")
+                print(f"{Colors.GREEN}No load balancers found{Colors.END}", file=out)
+        
+        summary = self.summarize_load_balancers(all_load_balancers)
+        total_cost = summary['total_cost']
+        risky_count = summary['risky_count']
+        unused_count = summary['unused_count']
+        types = summary['types']
+        
+        alb_count = summary['type_counts']['application']
+        nlb_count = summary['type_counts']['network']
+        clb_count = summary['type_counts']['classic']
+        
+        print(f"\n{Colors.BOLD}LOAD BALANCER SUMMARY{Colors.END}", file=out)
+        print(SEP_BLUE_140, file=out)
+        
+        print(f"AWS Account ID: {Colors.YELLOW}{self.account_info['Account']}{Colors.END}", file=out)
+        print(f"Total load balancers: {Colors.YELLOW}{len(all_load_balancers)}{Colors.END}", file=out)
+        print(f"  Application (ALB): {Colors.BLUE}{alb_count}{Colors.END}", file=out)
+        print(f"  Network (NLB): {Colors.BLUE}{nlb_count}{Colors.END}", file=out)
+        print(f"  Classic (CLB): {Colors.BLUE}{clb_count}{Colors.END}", file=out)
+        print(f"Load balancers with warnings: {Colors.RED}{risky_count}{Colors.END}", file=out)
+        print(f"Potentially unused load balancers: {Colors.YELLOW}{unused_count}{Colors.END}", file=out)
+        print(f"Total estimated monthly cost: {fmt_money(total_cost)}", file=out)
+        print(f"Total estimated annual cost: {fmt_money(total_cost * 12)}", file=out)
+        print(f"Regions scanned: {Colors.YELLOW}{', '.join(self.accessible_regions)}{Colors.END}", file=out)
         
         if all_load_balancers:
-            print(f"\n{Colors.BOLD}LOAD BALANCER DETAILS{Colors.END}")
-            print(f"{Colors.BLUE}{'='*140}{Colors.END}")
-            print(f"  {'Name':<20} | {'Region':<12} | {'Type':<7} | {'Scheme':<8} | {'State':<10} | {'Tgts':<5} | {'Activity':<12} | {'Cost':<6} | {'Age':<4} | Safe")
-            print(f"  {'-'*20} | {'-'*12} | {'-'*7} | {'-'*8} | {'-'*10} | {'-'*5} | {'-'*12} | {'-'*6} | {'-'*4} | {'-'*4}")
+            print(f"\n{Colors.BOLD}LOAD BALANCER DETAILS{Colors.END}", file=out)
+            print(SEP_BLUE_140, file=out)
+            print(f"  {'Name':<20} | {'Region':<12} | {'Type':<7} | {'Scheme':<8} | {'State':<10} | {'Tgts':<5} | {'Activity':<12} | {'Cost':<6} | {'Age':<4} | Safe", file=out)
+            print(f"  {'-'*20} | {'-'*12} | {'-'*7} | {'-'*8} | {'-'*10} | {'-'*5} | {'-'*12} | {'-'*6} | {'-'*4} | {'-'*4}", file=out)
             
             # Sort by cost (highest first), then by type
-            sorted_lbs = sorted(all_load_balancers, key=lambda x: (-x['monthly_cost'], x['type']))
+            for lb in all_load_balancers:
+                lb['_neg_cost'] = -lb['monthly_cost']
+            sorted_lbs = sorted(all_load_balancers, key=operator.itemgetter('_neg_cost', 'type'))
             
             for lb in sorted_lbs:
-                print(self.format_lb_info(lb))
+                print(self.format_lb_info(lb, self._scan_start_time), file=out)
                 
                 # Show safety warnings
                 if lb['safety']['warnings']:
                     for warning in lb['safety']['warnings'][:2]:
-                        print(f"    {Colors.YELLOW}⚠ {warning}{Colors.END}")
+                        print(f"    {Colors.YELLOW}⚠ {warning}{Colors.END}", file=out)
             
             # Show breakdown by type and region
-            print(f"\n{Colors.BOLD}BREAKDOWN BY TYPE{Colors.END}")
-            types = {}
-            for lb in all_load_balancers:
-                lb_type = lb['type']
-                if lb_type not in types:
-                    types[lb_type] = {'count': 0, 'cost': 0, 'unused': 0}
-                types[lb_type]['count'] += 1
-                types[lb_type]['cost'] += lb['monthly_cost']
-                if lb['metrics'].get('total_requests', 0) == 0 and lb['target_count'] == 0:
-                    types[lb_type]['unused'] += 1
-            
+            print(f"\n{Colors.BOLD}BREAKDOWN BY TYPE{Colors.END}", file=out)
             for lb_type, stats in sorted(types.items()):
-                print(f"  {lb_type.upper():<12}: {stats['count']} load balancers, ${stats['cost']:.2f}/month ({stats['unused']} potentially unused)")
+                print(f"  {lb_type.upper():<12}: {stats['count']} load balancers, ${stats['cost']:.2f}/month ({stats['unused']} potentially unused)", file=out)
+        
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
         
         return all_load_balancers
     
@@ -482,39 +866,52 @@ class LoadBalancerCleaner:
             else:
                 print(f"{Colors.RED}Please enter 'y' for yes or 'n' for no{Colors.END}")
     
+    def render_menu_row(self, index: int, lb: Dict[str, Any]) -> str:
+        """Format a selection menu row, memoized on the load balancer dict"""
+        rendered = lb.get('_rendered')
+        if rendered is not None and rendered[0] == index:
+            return rendered[1]
+        
+        safety_indicator = f"{Colors.RED}⚠{Colors.END}" if lb['_risky'] else f"{Colors.GREEN}✓{Colors.END}"
+        target_count = lb['target_count'] if lb['targets_checked'] else '?'
+        monthly_cost = lb['monthly_cost']
+        lb_type = lb['type'].upper()
+        
+        unused_indicator = f"{Colors.YELLOW}(UNUSED?){Colors.END}" if lb['_unused'] else ""
+        
+        row = f"{index:2d}. {lb['name']:<25} | {lb['region']:<12} | {lb_type:<7} | {target_count:>2} targets | ${monthly_cost:>5.1f}/mo | {safety_indicator} {unused_indicator}"
+        lb['_rendered'] = (index, row)
+        return row
+    
     def show_lb_selection_menu(self, load_balancers: List[Dict[str, Any]]) -> List[str]:
         """Show menu for load balancer selection"""
         if not load_balancers:
             return []
         
-        print(f"\n{Colors.BOLD}SELECT LOAD BALANCERS TO DELETE{Colors.END}")
-        print(f"{Colors.BLUE}{'='*60}{Colors.END}")
-        print("Enter load balancer numbers separated by commas (e.g., 1,3,5)")
-        print("Or enter 'all' to select all load balancers")
-        print("Or enter 'unused' to select potentially unused load balancers")
-        print("Or enter 'clb' to select only Classic Load Balancers")
-        print("Or enter 'safe' to select only load balancers without warnings")
-        print("")
+        sys.stdout.write("\n".join([
+            f"\n{Colors.BOLD}SELECT LOAD BALANCERS TO DELETE{Colors.END}",
+            SEP_BLUE_60,
+            "Enter load balancer numbers separated by commas (e.g., 1,3,5)",
+            "Or enter 'all' to select all load balancers",
+            "Or enter 'unused' to select potentially unused load balancers",
+            "Or enter 'clb' to select only Classic Load Balancers",
+            "Or enter 'safe' to select only load balancers without warnings",
+            "", ""
+        ]))
+        
+        # Show numbered list with a single write
+        rows = [self.render_menu_row(i, lb) for i, lb in enumerate(load_balancers, 1)]
+        sys.stdout.write('\n'.join(rows) + '\n')
+        sys.stdout.flush()
         
-        # Show numbered list
         unused_lbs = []
         safe_lbs = []
         clb_lbs = []
         
-        for i, lb in enumerate(load_balancers, 1):
-            safety_indicator = f"{Colors.RED}⚠{Colors.END}" if lb['safety']['is_risky'] else f"{Colors.GREEN}✓{Colors.END}"
-            target_count = lb['target_count']
-            monthly_cost = lb['monthly_cost']
-            lb_type = lb['type'].upper()
-            
-            total_requests = lb['metrics'].get('total_requests', 0)
-            unused_indicator = f"{Colors.YELLOW}(UNUSED?){Colors.END}" if total_requests == 0 and target_count == 0 else ""
-            
-            print(f"{i:2d}. {lb['name']:<25} | {lb['region']:<12} | {lb_type:<7} | {target_count:>2} targets | ${monthly_cost:>5.1f}/mo | {safety_indicator} {unused_indicator}")
-            
-            if total_requests == 0 and target_count == 0:
+        for lb in load_balancers:
+            if lb['_unused']:
                 unused_lbs.append(lb['name'])
-            if not lb['safety']['is_risky']:
+            if not lb['_risky']:
                 safe_lbs.append(lb['name'])
             if lb['type'] == 'classic':
                 clb_lbs.append(lb['name'])
@@ -561,39 +958,46 @@ class LoadBalancerCleaner:
                 except ValueError:
                     print(f"{Colors.RED}Invalid input. Please enter numbers separated by commas, 'all', 'unused', 'clb', or 'safe'{Colors.END}")
     
-    def delete_load_balancer(self, lb: Dict[str, Any], dry_run: bool = False) -> bool:
-        """Delete a single load balancer"""
+    def delete_load_balancer(self, lb: Dict[str, Any], dry_run: bool = False) -> tuple:
+        """Delete a single load balancer, returning (success, status message)"""
         lb_name = lb['name']
         lb_type = lb['type']
         region = lb['region']
         
         if dry_run:
-            print(f"  {Colors.BLUE}[DRY RUN] Would delete {lb_type.upper()} load balancer {lb_name}{Colors.END}")
-            return True
+            return True, f"{Colors.BLUE}[DRY RUN] Would delete {lb_type.upper()} load balancer {lb_name}{Colors.END}"
         
         try:
             if lb_type in ['application', 'network']:
                 # Delete ALB/NLB
-                elbv2 = self.session.client('elbv2', region_name=region)
+                elbv2 = self._client('elbv2', region)
                 elbv2.delete_load_balancer(LoadBalancerArn=lb['arn'])
             else:
                 # Delete CLB
-                elb = self.session.client('elb', region_name=region)
+                elb = self._client('elb', region)
                 elb.delete_load_balancer(LoadBalancerName=lb_name)
             
-            return True
+            return True, None
             
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == 'LoadBalancerNotFound':
-                print(f"  {Colors.YELLOW}Load balancer {lb_name} already deleted{Colors.END}")
-                return True
+                return True, f"{Colors.YELLOW}Load balancer {lb_name} already deleted{Colors.END}"
             else:
-                print(f"  {Colors.RED}Error deleting {lb_name}: {e}{Colors.END}")
-                return False
+                return False, f"{Colors.RED}Error deleting {lb_name}: {e}{Colors.END}"
+        except Exception as e:
+            # e.g. a read timeout; fail this load balancer rather than the whole batch
+            return False, f"{Colors.RED}Error deleting {lb_name}: {e}{Colors.END}"
+    
+    def delete_region_load_balancers(self, region_lbs: List[Dict[str, Any]], dry_run: bool = False) -> List[tuple]:
+        """Delete one region's load balancers with bounded concurrency"""
+        workers = min(DELETE_CONCURRENCY_PER_REGION, len(region_lbs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda lb: self.delete_load_balancer(lb, dry_run), region_lbs))
     
     def delete_load_balancers(self, load_balancers: List[Dict[str, Any]], selected_lb_names: List[str], dry_run: bool = False):
         """Delete selected load balancers"""
+        selected_lb_names = set(selected_lb_names)
         lbs_to_delete = [lb for lb in load_balancers if lb['name'] in selected_lb_names]
         
         if not lbs_to_delete:
@@ -601,11 +1005,27 @@ class LoadBalancerCleaner:
             return
         
         mode_text = "DRY RUN - " if dry_run else ""
-        print(f"\n{Colors.RED}{'='*70}{Colors.END}")
+        print("\n" + SEP_RED_70)
         print(f"{Colors.RED}{mode_text}DELETING LOAD BALANCERS{Colors.END}")
         if not dry_run:
             print(f"{Colors.RED}THIS CANNOT BE UNDONE!{Colors.END}")
-        print(f"{Colors.RED}{'='*70}{Colors.END}")
+        print(SEP_RED_70)
+        
+        # Regions are deleted side by side; the adaptive retry config absorbs throttling
+        by_region = {}
+        for lb in lbs_to_delete:
+            by_region.setdefault(lb['region'], []).append(lb)
+        
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(by_region))) as executor:
+            future_to_region = {
+                executor.submit(self.delete_region_load_balancers, region_lbs, dry_run): region
+                for region, region_lbs in by_region.items()
+            }
+            for future in as_completed(future_to_region):
+                region_lbs = by_region[future_to_region[future]]
+                for lb, result in zip(region_lbs, future.result()):
+                    results[id(lb)] = result
         
         deleted_count = 0
         failed_count = 0
@@ -616,17 +1036,21 @@ class LoadBalancerCleaner:
             region = lb['region']
             lb_type = lb['type'].upper()
             monthly_cost = lb['monthly_cost']
-            target_count = lb['target_count']
+            target_count = lb['target_count'] if lb['targets_checked'] else 'unknown'
+            success, message = results[id(lb)]
             
             print(f"\n[{i}/{len(lbs_to_delete)}] Processing {lb_type}: {lb_name}")
-            print(f"  Region: {region}, Targets: {target_count}, Cost: ${monthly_cost:.2f}/month")
+            print(f"  Region: {region}, Targets: {target_count}, Cost: {lb['monthly_cost_str']}/month")
             
             # Show warnings
             if lb['safety']['warnings']:
                 for warning in lb['safety']['warnings'][:3]:
                     print(f"  {Colors.YELLOW}⚠ {warning}{Colors.END}")
             
-            if self.delete_load_balancer(lb, dry_run):
+            if message:
+                print(f"  {message}")
+            
+            if success:
                 success_text = "Would delete" if dry_run else "Successfully deleted"
                 print(f"  {Colors.GREEN}✓ {success_text} {lb_name}{Colors.END}")
                 deleted_count += 1
@@ -634,32 +1058,32 @@ class LoadBalancerCleaner:
             else:
                 print(f"  {Colors.RED}✗ Failed to delete {lb_name}{Colors.END}")
                 failed_count += 1
-            
-            # Small delay to avoid rate limiting
-            if not dry_run:
-                time.sleep(2)  # LB deletion can be slow
         
         # Final summary
         print(f"\n{Colors.BOLD}{'DRY RUN ' if dry_run else ''}DELETION SUMMARY{Colors.END}")
-        print(f"{Colors.BLUE}{'='*50}{Colors.END}")
+        print(SEP_BLUE_50)
         success_text = "would be deleted" if dry_run else "deleted"
         print(f"Successfully {success_text}: {Colors.GREEN}{deleted_count} load balancers{Colors.END}")
         print(f"Failed: {Colors.RED}{failed_count} load balancers{Colors.END}")
-        print(f"Estimated monthly savings: {Colors.GREEN}${total_savings:.2f}{Colors.END}")
-        print(f"Estimated annual savings: {Colors.GREEN}${total_savings * 12:.2f}{Colors.END}")
+        print(f"Estimated monthly savings: {fmt_savings(total_savings)}")
+        print(f"Estimated annual savings: {fmt_savings(total_savings * 12)}")
         
         if not dry_run and deleted_count > 0:
+            self.clear_cache()
             print(f"\n{Colors.YELLOW}Note: Load balancer deletion may take several minutes to complete.{Colors.END}")
     
     def run(self, dry_run: bool = False):
         """Main execution flow"""
         mode_text = " (DRY RUN MODE)" if dry_run else ""
         print(f"{Colors.BOLD}AWS Load Balancer Cleanup Tool{mode_text}{Colors.END}")
-        print(f"{Colors.BLUE}{'='*70}{Colors.END}")
+        print(SEP_BLUE_70)
         
         if dry_run:
             print(f"{Colors.BLUE}Running in DRY RUN mode - no actual deletions will be performed{Colors.END}")
         
+        # One reference time for the whole scan
+        self.start_scan_clock()
+        
         # Test region connectivity
         accessible_regions = self.test_region_connectivity()
         print(f"\n{Colors.GREEN}Accessible regions: {', '.join(accessible_regions)}{Colors.END}")
@@ -671,21 +1095,30 @@ class LoadBalancerCleaner:
             print(f"\n{Colors.GREEN}No load balancers found! Nothing to delete.{Colors.END}")
             return
         
+        # Names are only unique per region, so each name maps to a list
+        self._lb_by_name = {}
+        for lb in load_balancers:
+            self._lb_by_name.setdefault(lb['name'], []).append(lb)
+        
         # Show deletion options
-        total_cost = sum(lb['monthly_cost'] for lb in load_balancers)
-        risky_count = sum(1 for lb in load_balancers if lb['safety']['is_risky'])
-        unused_count = sum(1 for lb in load_balancers if lb['metrics'].get('total_requests', 0) == 0 and lb['target_count'] == 0)
-        
-        print(f"\n{Colors.YELLOW}⚠️  DELETION OPTIONS{Colors.END}")
-        print(f"{Colors.YELLOW}{'='*50}{Colors.END}")
-        print(f"Total load balancers: {Colors.BLUE}{len(load_balancers)}{Colors.END}")
-        print(f"Load balancers with warnings: {Colors.RED}{risky_count}{Colors.END}")
-        print(f"Potentially unused load balancers: {Colors.YELLOW}{unused_count}{Colors.END}")
-        print(f"Total estimated monthly cost: {Colors.YELLOW}${total_cost:.2f}{Colors.END}")
-        print(f"Potential annual savings: {Colors.GREEN}${total_cost * 12:.2f}{Colors.END}")
+        summary = self.summarize_load_balancers(load_balancers)
+        total_cost = summary['total_cost']
+        risky_count = summary['risky_count']
+        unused_count = summary['unused_count']
+        
+        lines = [
+            HDR_DELETION_OPTIONS,
+            SEP_YELLOW,
+            f"Total load balancers: {Colors.BLUE}{len(load_balancers)}{Colors.END}",
+            f"Load balancers with warnings: {Colors.RED}{risky_count}{Colors.END}",
+            f"Potentially unused load balancers: {Colors.YELLOW}{unused_count}{Colors.END}",
+            f"Total estimated monthly cost: {fmt_money(total_cost)}",
+            f"Potential annual savings: {fmt_savings(total_cost * 12)}"
+        ]
         if not dry_run:
-            print(f"{Colors.RED}⚠️  Deletion will permanently remove selected load balancers!{Colors.END}")
-            print(f"{Colors.RED}⚠️  This action CANNOT be undone!{Colors.END}")
+            lines.append(f"{Colors.RED}⚠️  Deletion will permanently remove selected load balancers!{Colors.END}")
+            lines.append(f"{Colors.RED}⚠️  This action CANNOT be undone!{Colors.END}")
+        print("\n".join(lines))
         
         # Ask what user wants to do
         proceed_msg = "Do you want to proceed with load balancer selection?" if not dry_run else "Do you want to see what would be deleted?"
@@ -699,15 +1132,15 @@ class LoadBalancerCleaner:
             print(f"{Colors.BLUE}No load balancers selected. Exiting.{Colors.END}")
             return
         
-        selected_lbs = [lb for lb in load_balancers if lb['name'] in selected_lb_names]
-        selected_cost = sum(lb['monthly_cost'] for lb in selected_lbs)
+        selected_lbs = [lb for name in dict.fromkeys(selected_lb_names) for lb in self._lb_by_name.get(name, ())]
+        selected_cost = math.fsum(lb['monthly_cost'] for lb in selected_lbs)
         
         # Final confirmation
         confirmation_text = "DRY RUN CONFIRMATION" if dry_run else "FINAL CONFIRMATION"
         print(f"\n{Colors.RED}{confirmation_text}{Colors.END}")
         print(f"Selected load balancers: {Colors.YELLOW}{len(selected_lbs)}{Colors.END}")
-        print(f"Monthly savings: {Colors.GREEN}${selected_cost:.2f}{Colors.END}")
-        print(f"Annual savings: {Colors.GREEN}${selected_cost * 12:.2f}{Colors.END}")
+        print(f"Monthly savings: {fmt_savings(selected_cost)}")
+        print(f"Annual savings: {fmt_savings(selected_cost * 12)}")
         
         final_question = "Proceed with analysis?" if dry_run else "Are you absolutely sure you want to delete these load balancers?"
         if self.get_user_confirmation(final_question):
@@ -717,6 +1150,8 @@ class LoadBalancerCleaner:
 
 def main():
     """Main entry point"""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='AWS Load Balancer Cleanup Tool',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -725,6 +1160,8 @@ Examples:
   python3 loadbalancer_cleanup.py                 # Use default AWS profile
   python3 loadbalancer_cleanup.py --profile dev   # Use specific profile
   python3 loadbalancer_cleanup.py --dry-run       # Test mode - no actual deletions
+  python3 loadbalancer_cleanup.py --max-workers 8 # Limit concurrent AWS API calls
+  python3 loadbalancer_cleanup.py --cache         # Reuse recent scan results from disk
   
 Features:
   - Lists all Load Balancers (ALB, NLB, CLB) with cost estimates
@@ -747,10 +1184,30 @@ Features:
         help='Dry run mode - show what would be deleted without actually deleting'
     )
     
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Reuse AWS responses cached on disk by recent runs (LB lists 5 min, metrics 1 min)'
+    )
+    
+    parser.add_argument(
+        '--fresh',
+        action='store_true',
+        help='Ignore cached AWS responses and refresh the on-disk cache'
+    )
+    
+    parser.add_argument(
+        '--max-workers', '-w',
+        type=int,
+        default=16,
+        help='Maximum number of concurrent AWS API workers (default: 16)'
+    )
+    
     args = parser.parse_args()
     
     try:
-        cleaner = LoadBalancerCleaner(profile_name=args.profile)
+        cleaner = LoadBalancerCleaner(profile_name=args.profile, max_workers=args.max_workers,
+                                      use_cache=args.cache, fresh=args.fresh)
         cleaner.run(dry_run=args.dry_run)
     except KeyboardInterrupt:
         print(f"\n{Colors.YELLOW}Operation cancelled by user (Ctrl+C){Colors.END}")
@@ -8,10 +8,22 @@ EFS costs vary by storage class and can accumulate with unused file systems.
 import boto3
 import argparse
 import sys
+import io
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Any
-from botocore.exceptions import ClientError, NoCredentialsError, EndpointConnectionError
+from botocore.config import Config
+from botocore.exceptions import (ClientError, NoCredentialsError, EndpointConnectionError, ConnectTimeoutError,
+                                 ReadTimeoutError)
 import time
+import re
+import json
+import os
+import threading
+import functools
+import sqlite3
+from contextlib import closing
+import random
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 
 class Colors:
     """ANSI color codes for terminal output"""
@@ -22,12 +34,182 @@ class Colors:
     BOLD = '\033[1m'
     END = '\033[0m'
 
+# Separator bars and table headings, built once instead of on every print
+SEP_BLUE_50 = f"{Colors.BLUE}{'='*50}{Colors.END}"
+SEP_BLUE_60 = f"{Colors.BLUE}{'='*60}{Colors.END}"
+SEP_BLUE_70 = f"{Colors.BLUE}{'='*70}{Colors.END}"
+SEP_BLUE_180 = f"{Colors.BLUE}{'='*180}{Colors.END}"
+SEP_RED_80 = f"{Colors.RED}{'='*80}{Colors.END}"
+SEP_YELLOW = f"{Colors.YELLOW}{'='*50}{Colors.END}"
+DETAILS_HEADER = (f"  {'Name':<20} | {'File System ID':<17} | {'Region':<12} | {'Size':<8} | {'State':<10} | {'Perf':<8} | "
+                  f"{'Thru':<8} | {'MT':<2} | {'AP':<2} | {'Activity':<12} | {'Enc':<3} | {'Cost':<7} | {'Age':<4} | Safe")
+DETAILS_RULE = (f"  {'-'*20} | {'-'*17} | {'-'*12} | {'-'*8} | {'-'*10} | {'-'*8} | "
+                f"{'-'*8} | {'-'*2} | {'-'*2} | {'-'*12} | {'-'*3} | {'-'*7} | {'-'*4} | {'-'*4}")
+RESULTS_HEADER = f"  {'File System ID':<21} | {'Region':<14} | {'Size':<9} | {'Cost/month':>10} | Status"
+RESULTS_RULE = f"  {'-'*21} | {'-'*14} | {'-'*9} | {'-'*10} | {'-'*12}"
+
+# Summary blocks with the colors baked in; only the figures are formatted per call
+fmt_deletion_options = (
+    f"Total file systems: {Colors.BLUE}{{total}}{Colors.END}\n"
+    f"File systems with warnings: {Colors.RED}{{risky}}{Colors.END}\n"
+    f"Inactive file systems: {Colors.YELLOW}{{inactive}}{Colors.END}\n"
+    f"Unmounted file systems: {Colors.YELLOW}{{unmounted}}{Colors.END}\n"
+    f"Total estimated monthly cost: {Colors.YELLOW}${{cost:.2f}}{Colors.END}\n"
+    f"Potential annual savings: {Colors.GREEN}${{annual:.2f}}{Colors.END}"
+).format
+fmt_selection_summary = (
+    f"Selected file systems: {Colors.YELLOW}{{count}}{Colors.END}\n"
+    f"Monthly savings: {Colors.GREEN}${{monthly:.2f}}{Colors.END}\n"
+    f"Annual savings: {Colors.GREEN}${{annual:.2f}}{Colors.END}"
+).format
+fmt_deletion_summary = (
+    f"Successfully {{what}}: {Colors.GREEN}{{deleted}} file systems{Colors.END}\n"
+    f"Failed: {Colors.RED}{{failed}} file systems{Colors.END}\n"
+    f"Estimated monthly savings: {Colors.GREEN}${{monthly:.2f}}{Colors.END}\n"
+    f"Estimated annual savings: {Colors.GREEN}${{annual:.2f}}{Colors.END}"
+).format
+
+# Units for human readable sizes, each 1024 times the previous
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+@functools.lru_cache(maxsize=4096)
+def format_size(size_bytes: int) -> str:
+    """Format bytes into human readable format, memoized since many sizes repeat (e.g. empty file systems)"""
+    if size_bytes <= 0:
+        return "0 B"
+    
+    # Each unit is 2**10 of the previous one, so the bit length picks the unit directly
+    unit_index = min((size_bytes.bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * unit_index)):.1f} {SIZE_UNITS[unit_index]}"
+
+# Name fragments that suggest a file system is important, in reporting priority order
+# ('production' always contains 'prod', which takes priority, so it needs no entry)
+IMPORTANT_PATTERNS = ('prod', 'live', 'main', 'primary', 'shared', 'data', 'backup', 'content', 'web')
+# Zero-width lookahead so overlapping fragments (e.g. 'backuprod') are all found in one scan
+IMPORTANT_NAME_RE = re.compile(f"(?=({'|'.join(IMPORTANT_PATTERNS)}))")
+
+# Regions enabled for the account are listed through EC2 in this region; the defaults are used
+# if that call is not permitted. Candidate regions are then probed for EFS access concurrently
+REGION_DISCOVERY_REGION = 'us-east-1'
+REGION_PROBE_CONCURRENCY = 32
+DEFAULT_REGIONS = (
+    'us-east-1', 'us-west-2', 'ap-south-1',
+    'ap-southeast-1', 'eu-west-1', 'eu-central-1'
+)
+
+# Region probe errors that leave access undecided (the region is scanned but the region list isn't cached)
+PROBE_INCONCLUSIVE_ERRORS = frozenset(['Throttling', 'ThrottlingException', 'TooManyRequestsException',
+                                       'RequestLimitExceeded'])
+
+# Polling for mount target and access point deletion: starting interval, backoff cap and overall
+# limit (seconds)
+DELETE_POLL_INTERVAL = 2
+DELETE_POLL_MAX_INTERVAL = 16
+DELETE_WAIT_TIMEOUT = 120
+
+# Concurrent mount target / access point delete calls per file system
+DELETE_CONCURRENCY = 8
+
+# EFS errors retried around delete calls with decorrelated jitter: attempts, base and cap delay (seconds).
+# FileSystemInUse is transient while mount target deletion settles
+RETRYABLE_DELETE_ERRORS = {'ThrottlingException', 'TooManyRequestsException', 'FileSystemInUse'}
+DELETE_RETRY_ATTEMPTS = 6
+DELETE_RETRY_BASE_DELAY = 1.0
+DELETE_RETRY_MAX_DELAY = 20.0
+
+# File systems deleted concurrently, and the per-region token bucket pacing deletion starts:
+# a burst of DELETE_BURST, then DELETE_RATE per second
+DELETE_FS_CONCURRENCY = 8
+DELETE_RATE = 5.0
+DELETE_BURST = 5
+
+# DescribeFileSystems page size (EFS returns at most 100 per page)
+FILE_SYSTEMS_PER_PAGE = 100
+
+# GetMetricData limit on metric queries per request
+METRIC_QUERIES_PER_REQUEST = 500
+
+# Fallback EFS rates used when the Pricing API is unavailable
+DEFAULT_STORAGE_COST_PER_GB = 0.30          # Standard storage, per GB-month
+DEFAULT_THROUGHPUT_COST_PER_MIBPS = 6.00    # Provisioned throughput, per MB/s-month
+
+# Pricing API usage types for Standard storage and provisioned throughput (regions other than
+# us-east-1 carry a prefix such as 'EUW1-')
+STORAGE_USAGE_TYPE_RE = re.compile(r'(?:^|-)TimedStorage-ByteHrs$')
+THROUGHPUT_USAGE_TYPE_RE = re.compile(r'(?:^|-)ProvisionedTP-MiBpsHrs$')
+
+# The Pricing API is only served from a few regions
+PRICING_API_REGION = 'us-east-1'
+PRICING_LOAD_TIMEOUT = 15
+
+# Pricing API results are kept on disk so repeat runs within a day skip the API
+PRICING_CACHE_FILE = os.path.expanduser('~/.cache/aws-account-cleanup/efs-pricing.json')
+PRICING_CACHE_TTL = 86400
+
+# Accessible regions per profile and account, reused for a day unless --refresh-regions is given
+REGION_CACHE_FILE = os.path.expanduser('~/.cache/aws-account-cleanup/efs-regions.json')
+REGION_CACHE_TTL = 86400
+
+# Scanned file systems per account and region, reused for 10 minutes with --cache (e.g. a dry run
+# followed by the real run)
+SCAN_CACHE_FILE = os.path.expanduser('~/.cache/aws-account-cleanup/efs-scan.sqlite3')
+SCAN_CACHE_TTL = 600
+
+# Deletion journals (one JSON line per processed file system) for resuming interrupted runs
+JOURNAL_DIR = os.path.expanduser('~/.cache/aws-account-cleanup')
+
 class EFSCleaner:
-    def __init__(self, profile_name: str = None):
+    # GetMetricData query id, metric name and statistic for each activity metric
+    ACTIVITY_METRICS = (
+        ('connections_sum', 'ClientConnections', 'Sum'),
+        ('connections_avg', 'ClientConnections', 'Average'),
+        ('read_bytes', 'DataReadIOBytes', 'Sum'),
+        ('write_bytes', 'DataWriteIOBytes', 'Sum')
+    )
+    
+    def __init__(self, profile_name: str = None, max_workers: int = 16, refresh_pricing: bool = False,
+                 refresh_regions: bool = False, skip_metrics: bool = False, assume_yes: bool = False,
+                 use_cache: bool = False, resume_journal: str = None, select: str = None):
         """Initialize the AWS EFS cleaner"""
         self.profile_name = profile_name
+        self.refresh_pricing = refresh_pricing
+        self.refresh_regions = refresh_regions
+        self.skip_metrics = skip_metrics
+        self.assume_yes = assume_yes
+        self.use_cache = use_cache
+        self.resume_journal = resume_journal
+        self.select = select
+        self.max_workers = max(1, max_workers)
         self.session = None
+        self.account_info = None
         self.accessible_regions = []
+        # Per-region EFS rates from the Pricing API: {region: {'storage': ..., 'throughput': ...}}
+        self.pricing_cache: Dict[str, Dict[str, float]] = {}
+        # Clients are created under a lock because the shared session is not thread-safe
+        self._client_lock = threading.Lock()
+        self._clients: Dict[tuple, Any] = {}
+        # Deletion token buckets and current retry backoff per region, shared by the deletion workers
+        self._delete_pace_lock = threading.Lock()
+        self._delete_buckets: Dict[str, tuple] = {}
+        self._backoff: Dict[str, float] = {}
+        # Larger pool so concurrent per-file-system and deletion calls don't queue on the default 10
+        # connections, keepalive so pooled connections survive idle gaps (urllib3 already sets
+        # TCP_NODELAY), and adaptive retries (client-side rate limiting with jittered backoff)
+        self._boto_config = Config(
+            max_pool_connections=50,
+            tcp_keepalive=True,
+            retries={'max_attempts': 10, 'mode': 'adaptive'}
+        )
+        # Region probes and Pricing API lookups fail fast instead of waiting out the scan's retries,
+        # keeping a couple of attempts so one throttled call doesn't hide a region
+        self._probe_config = self._boto_config.merge(Config(
+            connect_timeout=3,
+            read_timeout=5,
+            retries={'max_attempts': 3, 'mode': 'standard'}
+        ))
+        # Shared pool for leaf API calls, bounding in-flight requests across all regions
+        self._api_executor = ThreadPoolExecutor(max_workers=min(32, self.max_workers * 2))
+        self.start_scan_clock()
         self.setup_aws_session()
         
     def setup_aws_session(self):
@@ -41,11 +223,11 @@ class EFSCleaner:
                 print(f"{Colors.BLUE}Using default AWS profile{Colors.END}")
             
             # Test credentials
-            sts = self.session.client('sts')
-            identity = sts.get_caller_identity()
+            sts = self._client('sts')
+            self.account_info = sts.get_caller_identity()
             
-            print(f"{Colors.GREEN}✓ Connected to AWS Account: {identity['Account']}{Colors.END}")
-            print(f"{Colors.GREEN}✓ User/Role: {identity['Arn']}{Colors.END}")
+            print(f"{Colors.GREEN}✓ Connected to AWS Account: {self.account_info['Account']}{Colors.END}")
+            print(f"{Colors.GREEN}✓ User/Role: {self.account_info['Arn']}{Colors.END}")
             
         except NoCredentialsError:
             print(f"{Colors.RED}Error: AWS credentials not found!{Colors.END}")
@@ -55,56 +237,244 @@ class EFSCleaner:
             print(f"{Colors.RED}Error: {e}{Colors.END}")
             sys.exit(1)
     
-    def test_region_connectivity(self) -> List[str]:
-        """Test connectivity to different AWS regions"""
-        test_regions = [
-            'us-east-1', 'us-west-2', 'ap-south-1', 
-            'ap-southeast-1', 'eu-west-1', 'eu-central-1'
-        ]
+    def start_scan_clock(self):
+        """Fix the reference time and 30-day metrics window shared by every file system in a scan"""
+        self._scan_start_time = datetime.now(timezone.utc)
+        self._scan_metric_window = (self._scan_start_time - timedelta(days=30), self._scan_start_time)
+    
+    def _client(self, service: str, region: str = None, probe: bool = False):
+        """Get a boto3 client, shared by every worker thread"""
+        key = (service, region, probe)
+        with self._client_lock:
+            client = self._clients.get(key)
+            if client is None:
+                config = self._probe_config if probe else self._boto_config
+                client = self.session.client(service, region_name=region, config=config)
+                self._clients[key] = client
+            return client
+    
+    def region_cache_key(self) -> str:
+        """Region cache entry for the current profile and account"""
+        return f"{self.profile_name or 'default'}:{self.account_info['Account']}"
+    
+    def read_region_cache(self) -> Dict[str, Any]:
+        """Return all cached region lists, or {} if the cache is missing or unreadable"""
+        try:
+            with open(REGION_CACHE_FILE) as f:
+                cached = json.load(f)
+            if isinstance(cached, dict):
+                return cached
+        except (OSError, ValueError):
+            pass
+        return {}
+    
+    def write_region_cache(self, regions: List[str]):
+        """Save the discovered regions for the current profile and account"""
+        cached = self.read_region_cache()
+        cached[self.region_cache_key()] = {'ts': time.time(), 'regions': regions}
+        try:
+            os.makedirs(os.path.dirname(REGION_CACHE_FILE), exist_ok=True)
+            tmp_path = f"{REGION_CACHE_FILE}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(cached, f)
+            os.replace(tmp_path, REGION_CACHE_FILE)
+        except OSError:
+            pass
+    
+    def probe_regions(self, regions: List[str]) -> tuple:
+        """Probe EFS access in all regions at once, reporting in region order; returns (regions, conclusive)"""
+        def probe_region(region: str):
+            try:
+                self._client('efs', region, probe=True).describe_file_systems(MaxItems=1)
+                return True, None
+            except ClientError as e:
+                # Throttling or a server error says nothing about access, so the region is scanned anyway
+                error = e.response.get('Error', {}).get('Code')
+                if error in PROBE_INCONCLUSIVE_ERRORS or e.response.get('ResponseMetadata', {}).get('HTTPStatusCode', 0) >= 500:
+                    return True, error
+                return False, None
+            except EndpointConnectionError:
+                return False, None
+            except (ConnectTimeoutError, ReadTimeoutError):
+                return True, "timed out"
+            except Exception as e:
+                return False, str(e)
         
-        accessible_regions = []
-        print(f"\n{Colors.BLUE}Testing region connectivity...{Colors.END}")
+        with ThreadPoolExecutor(max_workers=min(REGION_PROBE_CONCURRENCY, len(regions)) or 1) as executor:
+            results = list(executor.map(probe_region, regions))
         
-        for region in test_regions:
-            try:
-                efs = self.session.client('efs', region_name=region)
-                efs.describe_file_systems(MaxItems=1)
+        accessible_regions = []
+        conclusive = True
+        for region, (ok, error) in zip(regions, results):
+            if ok and error:
+                print(f"{Colors.YELLOW}? {region} - probe failed ({error}), scanning anyway{Colors.END}")
+                accessible_regions.append(region)
+                conclusive = False
+            elif ok:
                 print(f"{Colors.GREEN}✓ {region} - accessible{Colors.END}")
                 accessible_regions.append(region)
-            except (EndpointConnectionError, ClientError) as e:
+            elif error is None:
                 print(f"{Colors.RED}✗ {region} - not accessible{Colors.END}")
-            except Exception as e:
-                print(f"{Colors.RED}✗ {region} - error: {str(e)[:50]}...{Colors.END}")
+            else:
+                print(f"{Colors.RED}✗ {region} - error: {error[:50]}...{Colors.END}")
+        return accessible_regions, conclusive
+    
+    def discover_regions(self) -> List[str]:
+        """Discover the enabled regions where EFS is accessible, using the cached list when fresh"""
+        print(f"\n{Colors.BLUE}Discovering enabled regions...{Colors.END}")
+        
+        regions = None
+        if not self.refresh_regions:
+            entry = self.read_region_cache().get(self.region_cache_key())
+            try:
+                if time.time() - entry['ts'] < REGION_CACHE_TTL:
+                    regions = entry['regions']
+                    print(f"{Colors.GREEN}✓ Using cached region list{Colors.END}")
+            except (KeyError, TypeError):
+                pass
         
-        if not accessible_regions:
+        if regions is None:
+            try:
+                ec2 = self._client('ec2', REGION_DISCOVERY_REGION)
+                candidates = sorted(r['RegionName'] for r in ec2.describe_regions()['Regions'])
+                discovered = True
+            except (EndpointConnectionError, ClientError) as e:
+                print(f"{Colors.YELLOW}Could not list regions ({e}), using default region list{Colors.END}")
+                candidates = list(DEFAULT_REGIONS)
+                discovered = False
+            
+            regions, conclusive = self.probe_regions(candidates)
+            # A region list with inconclusive probes is used for this run only
+            if discovered and conclusive:
+                self.write_region_cache(regions)
+        
+        if not regions:
             print(f"{Colors.RED}Error: No accessible regions found!{Colors.END}")
             sys.exit(1)
             
-        self.accessible_regions = accessible_regions
-        return accessible_regions
+        self.accessible_regions = regions
+        return regions
+    
+    def fetch_region_pricing(self, region: str) -> Dict[str, float]:
+        """Fetch Standard storage and provisioned throughput rates for a region from the Pricing API"""
+        # The fail-fast probe config keeps a call still running after PRICING_LOAD_TIMEOUT short
+        pricing = self._client('pricing', PRICING_API_REGION, probe=True)
+        paginator = pricing.get_paginator('get_products')
+        
+        rates = {}
+        for page in paginator.paginate(
+            ServiceCode='AmazonEFS',
+            Filters=[{'Type': 'TERM_MATCH', 'Field': 'regionCode', 'Value': region}]
+        ):
+            for price_item in page['PriceList']:
+                product = json.loads(price_item)
+                usage_type = product['product'].get('attributes', {}).get('usagetype', '')
+                if STORAGE_USAGE_TYPE_RE.search(usage_type):
+                    key = 'storage'
+                elif THROUGHPUT_USAGE_TYPE_RE.search(usage_type):
+                    key = 'throughput'
+                else:
+                    continue
+                
+                for term in product.get('terms', {}).get('OnDemand', {}).values():
+                    for dimension in term['priceDimensions'].values():
+                        price = float(dimension['pricePerUnit'].get('USD', 0))
+                        if price > 0:
+                            rates[key] = price
+        
+        return rates
+    
+    def read_pricing_cache(self) -> Dict[str, Dict[str, float]]:
+        """Return rates saved by a recent run, or {} if missing, stale or unreadable"""
+        try:
+            with open(PRICING_CACHE_FILE) as f:
+                cached = json.load(f)
+            if time.time() - cached['ts'] < PRICING_CACHE_TTL:
+                return cached['rates']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return {}
+    
+    def write_pricing_cache(self):
+        """Save the loaded rates to disk, keeping other regions' cached rates"""
+        rates = self.read_pricing_cache()
+        rates.update(self.pricing_cache)
+        try:
+            os.makedirs(os.path.dirname(PRICING_CACHE_FILE), exist_ok=True)
+            tmp_path = f"{PRICING_CACHE_FILE}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({'ts': time.time(), 'rates': rates}, f)
+            os.replace(tmp_path, PRICING_CACHE_FILE)
+        except OSError:
+            pass
+    
+    def load_pricing(self, regions: List[str]):
+        """Load EFS rates for the given regions, falling back to built-in rates on failure"""
+        print(f"\n{Colors.BLUE}Loading EFS pricing...{Colors.END}")
+        
+        if not self.refresh_pricing:
+            cached_rates = self.read_pricing_cache()
+            self.pricing_cache.update({region: cached_rates[region] for region in regions if region in cached_rates})
+        
+        missing_regions = [region for region in regions if region not in self.pricing_cache]
+        if missing_regions:
+            executor = ThreadPoolExecutor(max_workers=min(8, len(missing_regions)))
+            future_to_region = {executor.submit(self.fetch_region_pricing, region): region for region in missing_regions}
+            done, not_done = wait(future_to_region, timeout=PRICING_LOAD_TIMEOUT)
+            # Don't hold up the scan for stragglers: queued lookups are cancelled and running ones
+            # end within one short-timeout call, so they don't delay interpreter exit either
+            for future in not_done:
+                future.cancel()
+            executor.shutdown(wait=False)
+            
+            fetched = False
+            for future in done:
+                try:
+                    rates = future.result()
+                except Exception:
+                    continue
+                if rates:
+                    self.pricing_cache[future_to_region[future]] = rates
+                    fetched = True
+            
+            if fetched:
+                self.write_pricing_cache()
+            
+            if not_done:
+                timed_out = sorted(future_to_region[future] for future in not_done)
+                print(f"{Colors.YELLOW}⚠ Pricing API timed out after {PRICING_LOAD_TIMEOUT}s for: "
+                      f"{', '.join(timed_out)}{Colors.END}")
+        
+        if len(self.pricing_cache) == len(regions):
+            source = "Pricing API" if missing_regions else "cache"
+            print(f"{Colors.GREEN}✓ Loaded EFS pricing for {len(regions)} regions ({source}){Colors.END}")
+        else:
+            print(f"{Colors.YELLOW}⚠ Pricing API unavailable for {len(regions) - len(self.pricing_cache)} regions - "
+                  f"using standard rates (${DEFAULT_STORAGE_COST_PER_GB:.2f}/GB-month){Colors.END}")
     
-    def get_efs_pricing(self, size_bytes: int, performance_mode: str, throughput_mode: str, provisioned_throughput: float = 0) -> float:
+    def get_efs_pricing(self, size_bytes: int, performance_mode: str, throughput_mode: str, provisioned_throughput: float = 0,
+                        region: str = None) -> float:
         """Calculate rough monthly cost for EFS file system"""
         # Convert bytes to GB
         size_gb = size_bytes / (1024**3) if size_bytes > 0 else 0
         
-        # EFS pricing (simplified - actual pricing varies by region and storage class)
+        # Regional rates from the Pricing API where loaded, otherwise the built-in fallbacks
         # Standard storage: ~$0.30/GB-month
-        # Standard-IA storage: ~$0.025/GB-month (for infrequently accessed files)
-        standard_cost_per_gb = 0.30
+        rates = self.pricing_cache.get(region, {})
+        standard_cost_per_gb = rates.get('storage', DEFAULT_STORAGE_COST_PER_GB)
         
         # Base storage cost
         storage_cost = size_gb * standard_cost_per_gb
         
         # Provisioned throughput cost
-        # $6.00 per MB/s per month for provisioned throughput above baseline
+        # ~$6.00 per MB/s per month for provisioned throughput above baseline
         throughput_cost = 0
         if throughput_mode == 'provisioned' and provisioned_throughput > 0:
             # Baseline throughput is free (50 MB/s per TB of storage)
             baseline_throughput = max(1, size_gb / 1024 * 50)  # MB/s
             if provisioned_throughput > baseline_throughput:
                 excess_throughput = provisioned_throughput - baseline_throughput
-                throughput_cost = excess_throughput * 6.00
+                throughput_cost = excess_throughput * rates.get('throughput', DEFAULT_THROUGHPUT_COST_PER_MIBPS)
         
         total_monthly_cost = storage_cost + throughput_cost
         
@@ -113,7 +483,7 @@ class EFSCleaner:
     def get_mount_targets(self, file_system_id: str, region: str) -> List[Dict[str, Any]]:
         """Get mount targets for an EFS file system"""
         try:
-            efs = self.session.client('efs', region_name=region)
+            efs = self._client('efs', region)
             
             mount_targets = efs.describe_mount_targets(FileSystemId=file_system_id)
             return mount_targets.get('MountTargets', [])
@@ -121,10 +491,21 @@ class EFSCleaner:
         except ClientError:
             return []
     
+    def get_lifecycle_policies(self, file_system_id: str, region: str) -> List[Dict[str, Any]]:
+        """Get lifecycle policies for an EFS file system"""
+        try:
+            efs = self._client('efs', region)
+            
+            lifecycle_response = efs.describe_lifecycle_configuration(FileSystemId=file_system_id)
+            return lifecycle_response.get('LifecyclePolicies', [])
+            
+        except ClientError:
+            return []
+    
     def get_access_points(self, file_system_id: str, region: str) -> List[Dict[str, Any]]:
         """Get access points for an EFS file system"""
         try:
-            efs = self.session.client('efs', region_name=region)
+            efs = self._client('efs', region)
             
             access_points = efs.describe_access_points(FileSystemId=file_system_id)
             return access_points.get('AccessPoints', [])
@@ -132,87 +513,94 @@ class EFSCleaner:
         except ClientError:
             return []
     
-    def get_efs_metrics(self, file_system_id: str, region: str) -> Dict[str, Any]:
-        """Get CloudWatch metrics for EFS file system"""
+    def empty_metrics(self, checked: bool = True) -> Dict[str, Any]:
+        """Metrics for a file system with no recorded activity, or whose activity was not checked"""
+        return {
+            'total_connections': 0,
+            'avg_connections': 0,
+            'total_read_bytes': 0,
+            'total_write_bytes': 0,
+            'has_activity': False,
+            'checked': checked
+        }
+    
+    def is_inactive(self, fs: Dict[str, Any]) -> bool:
+        """Whether a file system's activity was checked and none was found"""
+        return fs['metrics'].get('checked', True) and not fs['metrics'].get('has_activity', False)
+    
+    def get_efs_metrics_bulk(self, file_system_ids: List[str], cloudwatch, window: tuple) -> Dict[str, Dict[str, Any]]:
+        """Get CloudWatch metrics for a region's EFS file systems, keyed by file system ID"""
+        # Every query uses the same scan-wide 30-day window
+        start_time, end_time = window
+        
+        # Every file system contributes one daily query per activity metric; GetMetricData
+        # accepts at most 500 queries per request, so file systems are sent in whole batches
+        fs_per_request = METRIC_QUERIES_PER_REQUEST // len(self.ACTIVITY_METRICS)
+        
+        paginator = cloudwatch.get_paginator('get_metric_data')
+        values = {}
         try:
-            cloudwatch = self.session.client('cloudwatch', region_name=region)
-            
-            # Get metrics for the last 30 days
-            end_time = datetime.now(timezone.utc)
-            start_time = end_time - timedelta(days=30)
-            
-            # Client connections metric
-            connections_response = cloudwatch.get_metric_statistics(
-                Namespace='AWS/EFS',
-                MetricName='ClientConnections',
-                Dimensions=[{'Name': 'FileSystemId', 'Value': file_system_id}],
-                StartTime=start_time,
-                EndTime=end_time,
-                Period=86400,  # Daily
-                Statistics=['Sum', 'Average']
-            )
-            
-            # Data read/write metrics
-            read_response = cloudwatch.get_metric_statistics(
-                Namespace='AWS/EFS',
-                MetricName='DataReadIOBytes',
-                Dimensions=[{'Name': 'FileSystemId', 'Value': file_system_id}],
-                StartTime=start_time,
-                EndTime=end_time,
-                Period=86400,
-                Statistics=['Sum']
-            )
-            
-            write_response = cloudwatch.get_metric_statistics(
-                Namespace='AWS/EFS',
-                MetricName='DataWriteIOBytes',
-                Dimensions=[{'Name': 'FileSystemId', 'Value': file_system_id}],
-                StartTime=start_time,
-                EndTime=end_time,
-                Period=86400,
-                Statistics=['Sum']
-            )
-            
-            # Process metrics
-            total_connections = sum(point['Sum'] for point in connections_response['Datapoints'])
-            avg_connections = sum(point['Average'] for point in connections_response['Datapoints']) / len(connections_response['Datapoints']) if connections_response['Datapoints'] else 0
+            for start in range(0, len(file_system_ids), fs_per_request):
+                queries = [
+                    {
+                        'Id': f"{query_id}_{i}",
+                        'MetricStat': {
+                            'Metric': {
+                                'Namespace': 'AWS/EFS',
+                                'MetricName': metric_name,
+                                'Dimensions': [{'Name': 'FileSystemId', 'Value': file_system_id}]
+                            },
+                            'Period': 86400,  # Daily
+                            'Stat': stat
+                        }
+                    }
+                    for i, file_system_id in enumerate(file_system_ids[start:start + fs_per_request], start)
+                    for query_id, metric_name, stat in self.ACTIVITY_METRICS
+                ]
+                # Results for one query can span pages, so values are accumulated per query ID
+                for page in paginator.paginate(
+                    MetricDataQueries=queries,
+                    StartTime=start_time,
+                    EndTime=end_time
+                ):
+                    for result in page['MetricDataResults']:
+                        values.setdefault(result['Id'], []).extend(result['Values'])
+                    
+        except ClientError:
+            # A failed lookup says nothing about activity, so these are left unchecked rather than inactive
+            return {file_system_id: self.empty_metrics(checked=False) for file_system_id in file_system_ids}
+        
+        # Process metrics
+        metrics = {}
+        for i, file_system_id in enumerate(file_system_ids):
+            connection_averages = values.get(f"connections_avg_{i}", [])
+            total_connections = sum(values.get(f"connections_sum_{i}", []))
+            avg_connections = sum(connection_averages) / len(connection_averages) if connection_averages else 0
             
-            total_read_bytes = sum(point['Sum'] for point in read_response['Datapoints'])
-            total_write_bytes = sum(point['Sum'] for point in write_response['Datapoints'])
+            total_read_bytes = sum(values.get(f"read_bytes_{i}", []))
+            total_write_bytes = sum(values.get(f"write_bytes_{i}", []))
             
-            return {
+            metrics[file_system_id] = {
                 'total_connections': total_connections,
                 'avg_connections': avg_connections,
                 'total_read_bytes': total_read_bytes,
                 'total_write_bytes': total_write_bytes,
                 'has_activity': total_connections > 0 or total_read_bytes > 0 or total_write_bytes > 0
             }
-            
-        except ClientError:
-            return {
-                'total_connections': 0,
-                'avg_connections': 0,
-                'total_read_bytes': 0,
-                'total_write_bytes': 0,
-                'has_activity': False
-            }
+        
+        return metrics
     
-    def check_efs_safety(self, efs_info: Dict[str, Any]) -> Dict[str, Any]:
+    def check_efs_safety(self, efs_info: Dict[str, Any], now: datetime) -> Dict[str, Any]:
         """Check if EFS file system appears to be important or in use"""
         fs_name = efs_info.get('name', efs_info['file_system_id'])
         safety_warnings = []
         
-        # Check for important patterns in name
-        important_patterns = [
-            'prod', 'production', 'live', 'main', 'primary',
-            'shared', 'data', 'backup', 'content', 'web'
-        ]
-        
+        # Check for important patterns in name (single regex pass; the highest priority match is reported)
         name_lower = fs_name.lower()
-        for pattern in important_patterns:
-            if pattern in name_lower:
-                safety_warnings.append(f"Name contains '{pattern}' - might be important")
-                break
+        matches = {m.group(1) for m in IMPORTANT_NAME_RE.finditer(name_lower)}
+        if matches:
+            pattern = min(matches, key=IMPORTANT_PATTERNS.index)
+            safety_warnings.append(f"Name contains '{pattern}' - might be important")
         
         # Check if file system has mount targets (actively accessible)
         mount_target_count = efs_info.get('mount_target_count', 0)
@@ -226,7 +614,10 @@ class EFSCleaner:
         
         # Check if file system has recent activity
         metrics = efs_info.get('metrics', {})
-        if metrics.get('has_activity'):
+        if not metrics.get('checked', True):
+            reason = "--fast" if self.skip_metrics else "CloudWatch lookup failed"
+            safety_warnings.append(f"Recent activity not checked ({reason})")
+        elif metrics.get('has_activity'):
             if metrics.get('avg_connections', 0) > 0:
                 safety_warnings.append(f"Recent connections: {metrics['avg_connections']:.1f} avg/day")
             
@@ -251,7 +642,7 @@ class EFSCleaner:
         
         # Check if recently created (within 7 days)
         created_time = efs_info['creation_time']
-        days_since_created = (datetime.now(timezone.utc) - created_time).days
+        days_since_created = (now - created_time).days
         if days_since_created <= 7:
             safety_warnings.append(f"Recently created ({days_since_created} days ago)")
         
@@ -261,91 +652,104 @@ class EFSCleaner:
             'days_since_created': days_since_created
         }
     
-    def format_size(self, size_bytes: int) -> str:
-        """Format bytes into human readable format"""
-        if size_bytes == 0:
-            return "0 B"
-        
-        units = ['B', 'KB', 'MB', 'GB', 'TB']
-        unit_index = 0
-        size = float(size_bytes)
-        
-        while size >= 1024 and unit_index < len(units) - 1:
-            size /= 1024
-            unit_index += 1
-        
-        return f"{size:.1f} {units[unit_index]}"
+    def iter_file_systems(self, efs):
+        """Yield a region's file systems, following NextMarker directly rather than through a paginator"""
+        kwargs = {'MaxItems': FILE_SYSTEMS_PER_PAGE}
+        while True:
+            response = efs.describe_file_systems(**kwargs)
+            yield from response['FileSystems']
+            if not response.get('NextMarker'):
+                break
+            kwargs['Marker'] = response['NextMarker']
     
     def list_efs_in_region(self, region: str) -> List[Dict[str, Any]]:
         """List all EFS file systems in a specific region"""
         try:
-            efs = self.session.client('efs', region_name=region)
+            efs = self._client('efs', region)
             
-            file_systems = []
-            paginator = efs.get_paginator('describe_file_systems')
+            raw_file_systems = list(self.iter_file_systems(efs))
             
-            for page in paginator.paginate():
-                for fs in page['FileSystems']:
-                    file_system_id = fs['FileSystemId']
-                    
-                    # Get mount targets
-                    mount_targets = self.get_mount_targets(file_system_id, region)
-                    
-                    # Get access points
-                    access_points = self.get_access_points(file_system_id, region)
-                    
-                    # Get metrics
-                    metrics = self.get_efs_metrics(file_system_id, region)
-                    
-                    # Get lifecycle policies
-                    try:
-                        lifecycle_response = efs.describe_lifecycle_configuration(FileSystemId=file_system_id)
-                        lifecycle_policies = lifecycle_response.get('LifecyclePolicies', [])
-                    except ClientError:
-                        lifecycle_policies = []
-                    
-                    # Calculate pricing
-                    monthly_cost = self.get_efs_pricing(
-                        fs['SizeInBytes']['Value'],
-                        fs['PerformanceMode'],
-                        fs['ThroughputMode'],
-                        fs.get('ProvisionedThroughputInMibps', 0)
-                    )
-                    
-                    # Get name from tags
-                    name = file_system_id
-                    for tag in fs.get('Tags', []):
-                        if tag['Key'] == 'Name':
-                            name = tag['Value']
-                            break
-                    
-                    fs_info = {
-                        'file_system_id': file_system_id,
-                        'name': name,
-                        'region': region,
-                        'creation_time': fs['CreationTime'],
-                        'life_cycle_state': fs['LifeCycleState'],
-                        'number_of_mount_targets': fs['NumberOfMountTargets'],
-                        'size_bytes': fs['SizeInBytes']['Value'],
-                        'performance_mode': fs['PerformanceMode'],
-                        'throughput_mode': fs['ThroughputMode'],
-                        'provisioned_throughput_in_mibps': fs.get('ProvisionedThroughputInMibps', 0),
-                        'encrypted': fs.get('Encrypted', False),
-                        'kms_key_id': fs.get('KmsKeyId'),
-                        'availability_zone_name': fs.get('AvailabilityZoneName'),  # One Zone EFS
-                        'mount_targets': mount_targets,
-                        'mount_target_count': len(mount_targets),
-                        'access_points': access_points,
-                        'access_point_count': len(access_points),
-                        'lifecycle_policies': lifecycle_policies,
-                        'metrics': metrics,
-                        'monthly_cost': monthly_cost
-                    }
-                    
-                    # Add safety check
-                    fs_info['safety'] = self.check_efs_safety(fs_info)
-                    
-                    file_systems.append(fs_info)
+            if not raw_file_systems:
+                return []
+            
+            # Mount targets, access points and lifecycle policies are independent per file system,
+            # so fetch them concurrently on shared per-region clients, alongside the region-wide metrics.
+            # The shared executor only runs these leaf calls, so region workers can safely wait on it
+            file_system_ids = [fs['FileSystemId'] for fs in raw_file_systems]
+            # Empty, unmounted file systems cannot have recorded activity and ones that are not available
+            # are being created or deleted, so skip their metric queries; --fast skips CloudWatch entirely
+            active_ids = [] if self.skip_metrics else [
+                fs['FileSystemId'] for fs in raw_file_systems
+                if fs['LifeCycleState'] == 'available'
+                and (fs['SizeInBytes']['Value'] > 0 or fs['NumberOfMountTargets'] > 0)
+            ]
+            executor = self._api_executor
+            metrics_future = None
+            if active_ids:
+                # The CloudWatch client is only needed when the region has file systems worth querying
+                cloudwatch = self._client('cloudwatch', region)
+                metrics_future = executor.submit(self.get_efs_metrics_bulk, active_ids, cloudwatch, self._scan_metric_window)
+            futures = {}
+            for file_system_id in file_system_ids:
+                futures[file_system_id] = (
+                    executor.submit(self.get_mount_targets, file_system_id, region),
+                    executor.submit(self.get_access_points, file_system_id, region),
+                    executor.submit(self.get_lifecycle_policies, file_system_id, region)
+                )
+            
+            details_by_id = {fs_id: tuple(future.result() for future in fs_futures)
+                             for fs_id, fs_futures in futures.items()}
+            metrics_by_id = metrics_future.result() if metrics_future else {}
+            
+            file_systems = []
+            for fs in raw_file_systems:
+                file_system_id = fs['FileSystemId']
+                mount_targets, access_points, lifecycle_policies = details_by_id[file_system_id]
+                metrics = metrics_by_id.get(file_system_id) or self.empty_metrics(checked=not self.skip_metrics)
+                
+                # Calculate pricing
+                monthly_cost = self.get_efs_pricing(
+                    fs['SizeInBytes']['Value'],
+                    fs['PerformanceMode'],
+                    fs['ThroughputMode'],
+                    fs.get('ProvisionedThroughputInMibps', 0),
+                    region
+                )
+                
+                # Get name from tags
+                name = file_system_id
+                for tag in fs.get('Tags', []):
+                    if tag['Key'] == 'Name':
+                        name = tag['Value']
+                        break
+                
+                fs_info = {
+                    'file_system_id': file_system_id,
+                    'name': name,
+                    'region': region,
+                    'creation_time': fs['CreationTime'],
+                    'life_cycle_state': fs['LifeCycleState'],
+                    'number_of_mount_targets': fs['NumberOfMountTargets'],
+                    'size_bytes': fs['SizeInBytes']['Value'],
+                    'performance_mode': fs['PerformanceMode'],
+                    'throughput_mode': fs['ThroughputMode'],
+                    'provisioned_throughput_in_mibps': fs.get('ProvisionedThroughputInMibps', 0),
+                    'encrypted': fs.get('Encrypted', False),
+                    'kms_key_id': fs.get('KmsKeyId'),
+                    'availability_zone_name': fs.get('AvailabilityZoneName'),  # One Zone EFS
+                    'mount_targets': mount_targets,
+                    'mount_target_count': len(mount_targets),
+                    'access_points': access_points,
+                    'access_point_count': len(access_points),
+                    'lifecycle_policies': lifecycle_policies,
+                    'metrics': metrics,
+                    'monthly_cost': monthly_cost
+                }
+                
+                # Add safety check
+                fs_info['safety'] = self.check_efs_safety(fs_info, self._scan_start_time)
+                
+                file_systems.append(fs_info)
             
             return file_systems
             
@@ -353,12 +757,12 @@ class EFSCleaner:
             print(f"{Colors.RED}Error listing EFS file systems in {region}: {e}{Colors.END}")
             return []
     
-    def format_fs_info(self, fs: Dict[str, Any]) -> str:
+    def format_fs_info(self, fs: Dict[str, Any], now: datetime) -> str:
         """Format file system information for display"""
         name = fs['name'][:20] if len(fs['name']) > 20 else fs['name']
         fs_id = fs['file_system_id']
         region = fs['region']
-        size = self.format_size(fs['size_bytes'])
+        size = format_size(fs['size_bytes'])
         state = fs['life_cycle_state'][:10]
         
         performance_mode = fs['performance_mode'][:8]
@@ -372,11 +776,13 @@ class EFSCleaner:
         metrics = fs['metrics']
         if metrics.get('has_activity'):
             activity = f"{metrics['avg_connections']:.0f} conn"
+        elif not metrics.get('checked', True):
+            activity = "Not checked"
         else:
             activity = "No activity"
         
         created_time = fs['creation_time']
-        days_ago = (datetime.now(timezone.utc) - created_time).days
+        days_ago = (now - created_time).days
         
         # Encryption indicator
         encryption = "✓" if fs['encrypted'] else "✗"
@@ -389,97 +795,221 @@ class EFSCleaner:
         
         return f"  {name:<20} | {fs_id:<17} | {region:<12} | {size:<8} | {state:<10} | {performance_mode:<8} | {throughput_mode:<8} | {mount_targets:>2} | {access_points:>2} | {activity:<12} | {encryption:<3} | ${monthly_cost:>6.2f} | {days_ago:>3}d | {safety_indicator}"
     
+    def open_scan_cache(self) -> sqlite3.Connection:
+        """Open the scan cache database, creating it if needed"""
+        os.makedirs(os.path.dirname(SCAN_CACHE_FILE), exist_ok=True)
+        db = sqlite3.connect(SCAN_CACHE_FILE, timeout=5)
+        db.execute('CREATE TABLE IF NOT EXISTS fs_cache ('
+                   'account TEXT, region TEXT, ts REAL, payload TEXT, PRIMARY KEY (account, region))')
+        return db
+    
+    def read_scan_cache(self, regions: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Return file systems cached by a recent scan, keyed by region"""
+        try:
+            with closing(self.open_scan_cache()) as db:
+                rows = db.execute('SELECT region, payload FROM fs_cache WHERE account = ? AND ts > ?',
+                                  (self.account_info['Account'], time.time() - SCAN_CACHE_TTL)).fetchall()
+        except (OSError, sqlite3.Error):
+            return {}
+        
+        cached = {}
+        for region, payload in rows:
+            if region not in regions:
+                continue
+            try:
+                file_systems = json.loads(payload)
+            except ValueError:
+                continue
+            for fs in file_systems:
+                fs['creation_time'] = datetime.fromisoformat(fs['creation_time'])
+                # Safety warnings depend on the scan time, so they are recomputed
+                fs['safety'] = self.check_efs_safety(fs, self._scan_start_time)
+            cached[region] = file_systems
+        return cached
+    
+    def write_scan_cache(self, region_results: Dict[str, List[Dict[str, Any]]]):
+        """Save freshly scanned file systems per region"""
+        now = time.time()
+        rows = [
+            (self.account_info['Account'], region, now,
+             json.dumps([dict(fs, creation_time=fs['creation_time'].isoformat()) for fs in file_systems]))
+            for region, file_systems in region_results.items()
+        ]
+        try:
+            with closing(self.open_scan_cache()) as db, db:
+                db.executemany('INSERT OR REPLACE INTO fs_cache (account, region, ts, payload) VALUES (?, ?, ?, ?)', rows)
+        except (OSError, sqlite3.Error, TypeError, ValueError):
+            pass
+    
+    def clear_scan_cache(self):
+        """Drop this account's cached scan (it is stale once anything is deleted)"""
+        try:
+            with closing(self.open_scan_cache()) as db, db:
+                db.execute('DELETE FROM fs_cache WHERE account = ?', (self.account_info['Account'],))
+        except (OSError, sqlite3.Error):
+            pass
+    
     def list_all_file_systems(self) -> List[Dict[str, Any]]:
         """List all EFS file systems across accessible regions"""
-        print(f"\n{Colors.BLUE}{'='*180}{Colors.END}")
+        print("\n" + SEP_BLUE_180)
         print(f"{Colors.BLUE}Scanning EFS File Systems across regions...{Colors.END}")
-        print(f"{Colors.BLUE}{'='*180}{Colors.END}")
+        print(SEP_BLUE_180)
         
         all_file_systems = []
         total_cost = 0
         total_size = 0
         
+        # With --cache, regions scanned recently are reused (activity is not checked with --fast,
+        # so those scans are neither cached nor served from the cache)
+        use_cache = self.use_cache and not self.skip_metrics
+        region_results = self.read_scan_cache(self.accessible_regions) if use_cache else {}
+        if region_results:
+            print(f"{Colors.GREEN}✓ Using cached results for {len(region_results)} regions (--cache){Colors.END}")
+        regions_to_scan = [region for region in self.accessible_regions if region not in region_results]
+        scanned_results = {}
+        
+        # Regions are scanned in parallel; output is printed in region order afterwards
+        workers = min(self.max_workers, len(regions_to_scan)) or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            future_to_region = {executor.submit(self.list_efs_in_region, region): region for region in regions_to_scan}
+            
+            # On a terminal, show how many regions have finished while the slowest ones are still running
+            show_progress = sys.stdout.isatty()
+            for done, future in enumerate(as_completed(future_to_region), 1):
+                region = future_to_region[future]
+                try:
+                    scanned_results[region] = future.result()
+                except Exception as e:
+                    if show_progress:
+                        sys.stdout.write("\r\033[K")
+                    print(f"{Colors.RED}Error scanning {region}: {e}{Colors.END}")
+                    region_results[region] = []
+                if show_progress:
+                    sys.stdout.write(f"\r\033[KScanned {done}/{len(future_to_region)} regions...")
+                    sys.stdout.flush()
+            if show_progress:
+                sys.stdout.write("\r\033[K")
+        
+        if use_cache:
+            # Regions whose metrics lookup failed are rescanned next time rather than cached
+            cacheable = {region: file_systems for region, file_systems in scanned_results.items()
+                         if all(fs['metrics'].get('checked', True) for fs in file_systems)}
+            if cacheable:
+                self.write_scan_cache(cacheable)
+        region_results.update(scanned_results)
+        
+        # The whole report is rendered into one buffer and written with a single call
+        out = io.StringIO()
+        
         for region in self.accessible_regions:
-            print(f"\n{Colors.YELLOW}Checking region: {region}{Colors.END}")
+            print(f"\n{Colors.YELLOW}Checking region: {region}{Colors.END}", file=out)
             
-            file_systems = self.list_efs_in_region(region)
+            file_systems = region_results[region]
             
             if file_systems:
-                region_cost = sum(fs['monthly_cost'] for fs in file_systems)
-                region_size = sum(fs['size_bytes'] for fs in file_systems)
+                region_cost = 0
+                region_size = 0
+                mounted_count = 0
+                unchecked_count = 0
+                for fs in file_systems:
+                    region_cost += fs['monthly_cost']
+                    region_size += fs['size_bytes']
+                    if fs['mount_target_count'] > 0:
+                        mounted_count += 1
+                    if not fs['metrics'].get('checked', True):
+                        unchecked_count += 1
                 
-                mounted_count = sum(1 for fs in file_systems if fs['mount_target_count'] > 0)
-                
-                print(f"{Colors.GREEN}Found {len(file_systems)} file systems{Colors.END}")
-                print(f"  With mount targets: {mounted_count}")
-                print(f"  Total size: {self.format_size(region_size)}")
-                print(f"  Estimated monthly cost: ${region_cost:.2f}")
+                print(f"{Colors.GREEN}Found {len(file_systems)} file systems{Colors.END}", file=out)
+                print(f"  With mount targets: {mounted_count}", file=out)
+                print(f"  Total size: {format_size(region_size)}", file=out)
+                print(f"  Estimated monthly cost: ${region_cost:.2f}", file=out)
+                if unchecked_count and not self.skip_metrics:
+                    print(f"  {Colors.YELLOW}⚠ CloudWatch metrics unavailable for {unchecked_count} file systems "
+                          f"(activity unknown; not treated as inactive){Colors.END}", file=out)
                 
                 total_cost += region_cost
                 total_size += region_size
                 all_file_systems.extend(file_systems)
             else:
-                print(f"{Colors.GREEN}No file systems found{Colors.END}")
+                print(f"{Colors.GREEN}No file systems found{Colors.END}", file=out)
+        
+        # Aggregate summary counters and the performance mode breakdown in a single pass
+        risky_count = 0
+        inactive_count = 0
+        unmounted_count = 0
+        performance_modes = {}
+        for fs in all_file_systems:
+            if fs['safety']['is_risky']:
+                risky_count += 1
+            if self.is_inactive(fs):
+                inactive_count += 1
+            if fs['mount_target_count'] == 0:
+                unmounted_count += 1
+            
+            mode = fs['performance_mode']
+            if mode not in performance_modes:
+                performance_modes[mode] = {'count': 0, 'cost': 0, 'size': 0}
+            performance_modes[mode]['count'] += 1
+            performance_modes[mode]['cost'] += fs['monthly_cost']
+            performance_modes[mode]['size'] += fs['size_bytes']
         
         # Display summary
-        risky_count = sum(1 for fs in all_file_systems if fs['safety']['is_risky'])
-        inactive_count = sum(1 for fs in all_file_systems if not fs['metrics'].get('has_activity', False))
-        unmounted_count = sum(1 for fs in all_file_systems if fs['mount_target_count'] == 0)
-        
-        print(f"\n{Colors.BOLD}EFS FILE SYSTEMS SUMMARY{Colors.END}")
-        print(f"{Colors.BLUE}{'='*180}{Colors.END}")
-        
-        # Get current account info
-        sts = self.session.client('sts')
-        account_info = sts.get_caller_identity()
-        
-        print(f"AWS Account ID: {Colors.YELLOW}{account_info['Account']}{Colors.END}")
-        print(f"Total file systems found: {Colors.YELLOW}{len(all_file_systems)}{Colors.END}")
-        print(f"File systems with warnings: {Colors.RED}{risky_count}{Colors.END}")
-        print(f"Inactive file systems: {Colors.YELLOW}{inactive_count}{Colors.END}")
-        print(f"Unmounted file systems: {Colors.YELLOW}{unmounted_count}{Colors.END}")
-        print(f"Total storage size: {Colors.YELLOW}{self.format_size(total_size)}{Colors.END}")
-        print(f"Total estimated monthly cost: {Colors.YELLOW}${total_cost:.2f}{Colors.END}")
-        print(f"Total estimated annual cost: {Colors.YELLOW}${total_cost * 12:.2f}{Colors.END}")
-        print(f"Regions scanned: {Colors.YELLOW}{', '.join(self.accessible_regions)}{Colors.END}")
+        
+        print(f"\n{Colors.BOLD}EFS FILE SYSTEMS SUMMARY{Colors.END}", file=out)
+        print(SEP_BLUE_180, file=out)
+        
+        print(f"AWS Account ID: {Colors.YELLOW}{self.account_info['Account']}{Colors.END}", file=out)
+        print(f"Total file systems found: {Colors.YELLOW}{len(all_file_systems)}{Colors.END}", file=out)
+        print(f"File systems with warnings: {Colors.RED}{risky_count}{Colors.END}", file=out)
+        print(f"Inactive file systems: {Colors.YELLOW}{inactive_count}{Colors.END}", file=out)
+        print(f"Unmounted file systems: {Colors.YELLOW}{unmounted_count}{Colors.END}", file=out)
+        print(f"Total storage size: {Colors.YELLOW}{format_size(total_size)}{Colors.END}", file=out)
+        print(f"Total estimated monthly cost: {Colors.YELLOW}${total_cost:.2f}{Colors.END}", file=out)
+        print(f"Total estimated annual cost: {Colors.YELLOW}${total_cost * 12:.2f}{Colors.END}", file=out)
+        print(f"Regions scanned: {Colors.YELLOW}{', '.join(self.accessible_regions)}{Colors.END}", file=out)
         
         if all_file_systems:
-            print(f"\n{Colors.BOLD}FILE SYSTEM DETAILS{Colors.END}")
-            print(f"{Colors.BLUE}{'='*180}{Colors.END}")
-            print(f"  {'Name':<20} | {'File System ID':<17} | {'Region':<12} | {'Size':<8} | {'State':<10} | {'Perf':<8} | {'Thru':<8} | {'MT':<2} | {'AP':<2} | {'Activity':<12} | {'Enc':<3} | {'Cost':<7} | {'Age':<4} | Safe")
-            print(f"  {'-'*20} | {'-'*17} | {'-'*12} | {'-'*8} | {'-'*10} | {'-'*8} | {'-'*8} | {'-'*2} | {'-'*2} | {'-'*12} | {'-'*3} | {'-'*7} | {'-'*4} | {'-'*4}")
+            print(f"\n{Colors.BOLD}FILE SYSTEM DETAILS{Colors.END}", file=out)
+            print(SEP_BLUE_180, file=out)
+            print(DETAILS_HEADER, file=out)
+            print(DETAILS_RULE, file=out)
             
             # Sort by cost (highest first), then by safety risk
             sorted_file_systems = sorted(all_file_systems, key=lambda x: (-x['monthly_cost'], not x['safety']['is_risky']))
             
             for fs in sorted_file_systems:
-                print(self.format_fs_info(fs))
+                print(self.format_fs_info(fs, self._scan_start_time), file=out)
                 
                 # Show safety warnings
                 if fs['safety']['warnings']:
                     for warning in fs['safety']['warnings'][:2]:
-                        print(f"    {Colors.YELLOW}⚠ {warning}{Colors.END}")
+                        print(f"    {Colors.YELLOW}⚠ {warning}{Colors.END}", file=out)
             
             # Show breakdown by performance mode
-            print(f"\n{Colors.BOLD}BREAKDOWN BY PERFORMANCE MODE{Colors.END}")
-            performance_modes = {}
-            for fs in all_file_systems:
-                mode = fs['performance_mode']
-                if mode not in performance_modes:
-                    performance_modes[mode] = {'count': 0, 'cost': 0, 'size': 0}
-                performance_modes[mode]['count'] += 1
-                performance_modes[mode]['cost'] += fs['monthly_cost']
-                performance_modes[mode]['size'] += fs['size_bytes']
-            
+            print(f"\n{Colors.BOLD}BREAKDOWN BY PERFORMANCE MODE{Colors.END}", file=out)
             for mode, stats in sorted(performance_modes.items()):
-                print(f"  {mode:<15}: {stats['count']} file systems, {self.format_size(stats['size'])}, ${stats['cost']:.2f}/month")
+                print(f"  {mode:<15}: {stats['count']} file systems, {format_size(stats['size'])}, ${stats['cost']:.2f}/month", file=out)
+        
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
         
         return all_file_systems
     
     def get_user_confirmation(self, message: str) -> bool:
         """Get user confirmation"""
+        if self.assume_yes:
+            print(f"\n{Colors.YELLOW}{message} (y/n): {Colors.END}y (--yes)")
+            return True
+        # Without a terminal there is nobody to answer, so decline rather than wait on stdin
+        if not sys.stdin.isatty():
+            print(f"\n{Colors.YELLOW}{message} (y/n): {Colors.END}n (no terminal; use --yes to confirm)")
+            return False
         while True:
-            response = input(f"\n{Colors.YELLOW}{message} (y/n): {Colors.END}").lower().strip()
+            try:
+                response = input(f"\n{Colors.YELLOW}{message} (y/n): {Colors.END}").lower().strip()
+            except EOFError:
+                print()
+                return False
             if response in ['y', 'yes']:
                 return True
             elif response in ['n', 'no']:
@@ -492,14 +1022,17 @@ class EFSCleaner:
         if not file_systems:
             return []
         
-        print(f"\n{Colors.BOLD}SELECT FILE SYSTEMS TO DELETE{Colors.END}")
-        print(f"{Colors.BLUE}{'='*60}{Colors.END}")
-        print("Enter file system numbers separated by commas (e.g., 1,3,5)")
-        print("Or enter 'all' to select all file systems")
-        print("Or enter 'inactive' to select file systems with no recent activity")
-        print("Or enter 'unmounted' to select file systems with no mount targets")
-        print("Or enter 'safe' to select only file systems without warnings")
-        print("")
+        # The instructions and numbered list are rendered up front and written with a single call
+        lines = [
+            f"\n{Colors.BOLD}SELECT FILE SYSTEMS TO DELETE{Colors.END}",
+            SEP_BLUE_60,
+            "Enter file system numbers separated by commas (e.g., 1,3,5)",
+            "Or enter 'all' to select all file systems",
+            "Or enter 'inactive' to select file systems with no recent activity",
+            "Or enter 'unmounted' to select file systems with no mount targets",
+            "Or enter 'safe' to select only file systems without warnings",
+            ""
+        ]
         
         # Show numbered list
         inactive_fs = []
@@ -509,10 +1042,10 @@ class EFSCleaner:
         for i, fs in enumerate(file_systems, 1):
             safety_indicator = f"{Colors.RED}⚠{Colors.END}" if fs['safety']['is_risky'] else f"{Colors.GREEN}✓{Colors.END}"
             monthly_cost = fs['monthly_cost']
-            size = self.format_size(fs['size_bytes'])
+            size = format_size(fs['size_bytes'])
             
             activity_indicator = ""
-            if not fs['metrics'].get('has_activity', False):
+            if self.is_inactive(fs):
                 activity_indicator = f"{Colors.YELLOW}(INACTIVE){Colors.END}"
                 inactive_fs.append(fs['file_system_id'])
             
@@ -524,10 +1057,28 @@ class EFSCleaner:
             
             mount_info = f"{fs['mount_target_count']} MT" if fs['mount_target_count'] > 0 else "No MT"
             
-            print(f"{i:2d}. {fs['name']:<25} | {fs['region']:<12} | {size:<8} | {mount_info:<5} | ${monthly_cost:>6.2f}/mo | {safety_indicator} {activity_indicator}")
+            lines.append(f"{i:2d}. {fs['name']:<25} | {fs['region']:<12} | {size:<8} | {mount_info:<5} | ${monthly_cost:>6.2f}/mo | {safety_indicator} {activity_indicator}")
+        
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
         
+        # A --select choice is answered once, in place of the prompt
+        preset = self.select
         while True:
-            choice = input(f"\n{Colors.YELLOW}Your selection: {Colors.END}").strip().lower()
+            if preset == '':
+                return []
+            elif preset is not None:
+                choice, preset = preset.strip().lower(), ''
+                print(f"\n{Colors.YELLOW}Your selection: {Colors.END}{choice} (--select)")
+            elif not sys.stdin.isatty():
+                print(f"\n{Colors.YELLOW}Your selection: {Colors.END}none (no terminal; use --select to choose)")
+                return []
+            else:
+                try:
+                    choice = input(f"\n{Colors.YELLOW}Your selection: {Colors.END}").strip().lower()
+                except EOFError:
+                    print()
+                    return []
             
             if choice == 'all':
                 return [fs['file_system_id'] for fs in file_systems]
@@ -568,168 +1119,305 @@ class EFSCleaner:
                 except ValueError:
                     print(f"{Colors.RED}Invalid input. Please enter numbers separated by commas, 'all', 'inactive', 'unmounted', or 'safe'{Colors.END}")
     
-    def delete_mount_targets(self, mount_targets: List[Dict[str, Any]], region: str) -> bool:
+    def wait_until_gone(self, describe, description: str, out=None) -> bool:
+        """Poll describe() with exponential backoff until it returns nothing, up to DELETE_WAIT_TIMEOUT"""
+        deadline = time.monotonic() + DELETE_WAIT_TIMEOUT
+        interval = DELETE_POLL_INTERVAL
+        while describe():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                print(f"    {Colors.YELLOW}Timed out waiting for {description} to be deleted{Colors.END}", file=out)
+                return False
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, DELETE_POLL_MAX_INTERVAL)
+        return True
+    
+    def call_with_backoff(self, region: str, operation, **kwargs):
+        """Call an EFS delete operation, retrying throttling and in-use errors with decorrelated jitter"""
+        for attempt in range(DELETE_RETRY_ATTEMPTS):
+            try:
+                response = operation(**kwargs)
+                with self._delete_pace_lock:
+                    self._backoff.pop(region, None)
+                return response
+            except ClientError as e:
+                if e.response['Error']['Code'] not in RETRYABLE_DELETE_ERRORS or attempt == DELETE_RETRY_ATTEMPTS - 1:
+                    raise
+                # Workers in the same region share the backoff, so one throttle slows them all down
+                with self._delete_pace_lock:
+                    previous = self._backoff.get(region, DELETE_RETRY_BASE_DELAY)
+                    delay = min(DELETE_RETRY_MAX_DELAY, random.uniform(DELETE_RETRY_BASE_DELAY, previous * 3))
+                    self._backoff[region] = delay
+                time.sleep(delay)
+    
+    def delete_mount_targets(self, file_system_id: str, mount_targets: List[Dict[str, Any]], region: str, out=None) -> bool:
         """Delete all mount targets for a file system"""
         if not mount_targets:
             return True
         
         try:
-            efs = self.session.client('efs', region_name=region)
+            efs = self._client('efs', region)
             
-            print(f"    Deleting {len(mount_targets)} mount targets...")
+            print(f"    Deleting {len(mount_targets)} mount targets...", file=out)
             for mt in mount_targets:
-                mt_id = mt['MountTargetId']
-                print(f"      Deleting mount target {mt_id}")
-                efs.delete_mount_target(MountTargetId=mt_id)
-            
-            # Wait for mount targets to be deleted
-            print("    Waiting for mount targets to be deleted...")
-            time.sleep(30)  # EFS mount target deletion takes time
+                print(f"      Deleting mount target {mt['MountTargetId']}", file=out)
+            with ThreadPoolExecutor(max_workers=min(DELETE_CONCURRENCY, len(mount_targets))) as executor:
+                list(executor.map(
+                    lambda mt: self.call_with_backoff(region, efs.delete_mount_target, MountTargetId=mt['MountTargetId']),
+                    mount_targets
+                ))
             
-            return True
+            # Wait for mount targets to be deleted (EFS mount target deletion takes time)
+            print("    Waiting for mount targets to be deleted...", file=out)
+            return self.wait_until_gone(
+                lambda: [mt for mt in efs.describe_mount_targets(FileSystemId=file_system_id)['MountTargets']
+                         if mt['LifeCycleState'] != 'deleted'],
+                "mount targets", out
+            )
             
         except ClientError as e:
-            print(f"    {Colors.RED}Error deleting mount targets: {e}{Colors.END}")
+            print(f"    {Colors.RED}Error deleting mount targets: {e}{Colors.END}", file=out)
             return False
     
-    def delete_access_points(self, access_points: List[Dict[str, Any]], region: str) -> bool:
+    def delete_access_points(self, file_system_id: str, access_points: List[Dict[str, Any]], region: str, out=None) -> bool:
         """Delete all access points for a file system"""
         if not access_points:
             return True
         
         try:
-            efs = self.session.client('efs', region_name=region)
+            efs = self._client('efs', region)
             
-            print(f"    Deleting {len(access_points)} access points...")
+            print(f"    Deleting {len(access_points)} access points...", file=out)
             for ap in access_points:
-                ap_id = ap['AccessPointId']
-                print(f"      Deleting access point {ap_id}")
-                efs.delete_access_point(AccessPointId=ap_id)
+                print(f"      Deleting access point {ap['AccessPointId']}", file=out)
+            with ThreadPoolExecutor(max_workers=min(DELETE_CONCURRENCY, len(access_points))) as executor:
+                list(executor.map(
+                    lambda ap: self.call_with_backoff(region, efs.delete_access_point, AccessPointId=ap['AccessPointId']),
+                    access_points
+                ))
             
             # Access points delete faster than mount targets
-            time.sleep(10)
-            
-            return True
+            deleted_ids = {ap['AccessPointId'] for ap in access_points}
+            return self.wait_until_gone(
+                lambda: [ap for ap in efs.describe_access_points(FileSystemId=file_system_id)['AccessPoints']
+                         if ap['AccessPointId'] in deleted_ids and ap['LifeCycleState'] != 'deleted'],
+                "access points", out
+            )
             
         except ClientError as e:
-            print(f"    {Colors.RED}Error deleting access points: {e}{Colors.END}")
+            print(f"    {Colors.RED}Error deleting access points: {e}{Colors.END}", file=out)
             return False
     
-    def delete_file_system(self, fs: Dict[str, Any], dry_run: bool = False) -> bool:
+    def delete_file_system(self, fs: Dict[str, Any], dry_run: bool = False, out=None) -> bool:
         """Delete an EFS file system"""
         fs_id = fs['file_system_id']
         region = fs['region']
         
         if dry_run:
-            print(f"  {Colors.BLUE}[DRY RUN] Would delete file system {fs_id}{Colors.END}")
+            print(f"  {Colors.BLUE}[DRY RUN] Would delete file system {fs_id}{Colors.END}", file=out)
             return True
         
         try:
-            efs = self.session.client('efs', region_name=region)
+            efs = self._client('efs', region)
             
-            # First delete access points
-            if fs['access_points']:
-                if not self.delete_access_points(fs['access_points'], region):
-                    return False
-            
-            # Then delete mount targets
-            if fs['mount_targets']:
-                if not self.delete_mount_targets(fs['mount_targets'], region):
-                    return False
+            # Access points and mount targets don't depend on each other, so both are deleted and
+            # waited on side by side; each phase buffers its own output to keep the log readable
+            ap_out, mt_out = io.StringIO(), io.StringIO()
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                ap_future = executor.submit(self.delete_access_points, fs_id, fs['access_points'], region, ap_out)
+                mt_future = executor.submit(self.delete_mount_targets, fs_id, fs['mount_targets'], region, mt_out)
+                ap_ok, mt_ok = ap_future.result(), mt_future.result()
+            print(ap_out.getvalue() + mt_out.getvalue(), end='', file=out)
+            if not (ap_ok and mt_ok):
+                return False
             
             # Finally delete the file system
-            print(f"    Deleting file system {fs_id}...")
-            efs.delete_file_system(FileSystemId=fs_id)
+            print(f"    Deleting file system {fs_id}...", file=out)
+            self.call_with_backoff(region, efs.delete_file_system, FileSystemId=fs_id)
             
             return True
             
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == 'FileSystemNotFound':
-                print(f"  {Colors.YELLOW}File system {fs_id} not found (already deleted?){Colors.END}")
+                print(f"  {Colors.YELLOW}File system {fs_id} not found (already deleted?){Colors.END}", file=out)
                 return True
             elif error_code == 'FileSystemInUse':
-                print(f"  {Colors.RED}File system {fs_id} is still in use (mount targets may still exist){Colors.END}")
+                print(f"  {Colors.RED}File system {fs_id} is still in use (mount targets may still exist){Colors.END}", file=out)
                 return False
             else:
-                print(f"  {Colors.RED}Error deleting {fs_id}: {e}{Colors.END}")
+                print(f"  {Colors.RED}Error deleting {fs_id}: {e}{Colors.END}", file=out)
                 return False
     
+    def pace_region_delete(self, region: str):
+        """Take a token from the region's deletion bucket, waiting only when the bucket is empty"""
+        with self._delete_pace_lock:
+            now = time.monotonic()
+            tokens, last = self._delete_buckets.get(region, (DELETE_BURST, now))
+            tokens = min(DELETE_BURST, tokens + (now - last) * DELETE_RATE) - 1
+            # A negative balance reserves a future token; the caller sleeps until it is earned
+            self._delete_buckets[region] = (tokens, now)
+        if tokens < 0:
+            time.sleep(-tokens / DELETE_RATE)
+    
+    def delete_and_report(self, index: int, total: int, fs: Dict[str, Any], dry_run: bool = False) -> tuple:
+        """Delete one file system, returning (fs, success, buffered progress output)"""
+        out = io.StringIO()
+        fs_id = fs['file_system_id']
+        
+        print(f"\n[{index}/{total}] Processing file system: {fs['name']} ({fs_id})", file=out)
+        print(f"  Region: {fs['region']}, Size: {format_size(fs['size_bytes'])}, Cost: ${fs['monthly_cost']:.2f}/month", file=out)
+        print(f"  Mount targets: {fs['mount_target_count']}, Access points: {fs['access_point_count']}", file=out)
+        
+        # Show warnings
+        if fs['safety']['warnings']:
+            for warning in fs['safety']['warnings'][:3]:
+                print(f"  {Colors.YELLOW}⚠ {warning}{Colors.END}", file=out)
+        
+        # Anything delete_file_system doesn't handle (e.g. a read timeout) fails just this file system
+        try:
+            if not dry_run:
+                self.pace_region_delete(fs['region'])
+            success = self.delete_file_system(fs, dry_run, out)
+        except Exception as e:
+            print(f"  {Colors.RED}Error deleting {fs_id}: {e}{Colors.END}", file=out)
+            success = False
+        if success:
+            success_text = "Would delete" if dry_run else "Successfully deleted"
+            print(f"  {Colors.GREEN}✓ {success_text} {fs_id}{Colors.END}", file=out)
+        else:
+            print(f"  {Colors.RED}✗ Failed to delete {fs_id}{Colors.END}", file=out)
+        
+        return fs, success, out.getvalue()
+    
+    def read_journal(self, path: str) -> set:
+        """Return the IDs of file systems a deletion journal records as deleted"""
+        deleted = set()
+        try:
+            with open(path) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # A line cut short by an interrupted run
+                    if entry.get('ok'):
+                        deleted.add(entry['fs'])
+        except OSError as e:
+            print(f"{Colors.RED}Error reading journal {path}: {e}{Colors.END}")
+        return deleted
+    
+    def open_journal(self):
+        """Open the deletion journal for appending: the resumed one, or a new timestamped file"""
+        path = self.resume_journal or os.path.join(JOURNAL_DIR, f"efs-journal-{time.strftime('%Y%m%d-%H%M%S')}.jsonl")
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            return open(path, 'a')
+        except OSError as e:
+            print(f"{Colors.YELLOW}Could not open deletion journal {path}: {e}{Colors.END}")
+            return None
+    
     def delete_file_systems(self, file_systems: List[Dict[str, Any]], selected_fs_ids: List[str], dry_run: bool = False):
         """Delete selected file systems"""
+        selected_fs_ids = set(selected_fs_ids)
         fs_to_delete = [fs for fs in file_systems if fs['file_system_id'] in selected_fs_ids]
         
+        # Skip file systems an interrupted run already deleted
+        if self.resume_journal:
+            already_deleted = self.read_journal(self.resume_journal)
+            skipped = [fs for fs in fs_to_delete if fs['file_system_id'] in already_deleted]
+            if skipped:
+                print(f"{Colors.BLUE}Skipping {len(skipped)} file systems already deleted according to {self.resume_journal}{Colors.END}")
+                fs_to_delete = [fs for fs in fs_to_delete if fs['file_system_id'] not in already_deleted]
+        
         if not fs_to_delete:
             print(f"{Colors.YELLOW}No file systems selected for deletion.{Colors.END}")
             return
         
         mode_text = "DRY RUN - " if dry_run else ""
-        print(f"\n{Colors.RED}{'='*80}{Colors.END}")
+        print("\n" + SEP_RED_80)
         print(f"{Colors.RED}{mode_text}DELETING EFS FILE SYSTEMS{Colors.END}")
         if not dry_run:
             print(f"{Colors.RED}THIS WILL DELETE ALL DATA IN THE FILE SYSTEMS!{Colors.END}")
             print(f"{Colors.RED}THIS ACTION CANNOT BE UNDONE!{Colors.END}")
-        print(f"{Colors.RED}{'='*80}{Colors.END}")
+        print(SEP_RED_80)
         
+        # File systems are deleted concurrently; each one's progress is buffered and printed as a block
         deleted_count = 0
         failed_count = 0
         total_savings = 0
         
-        for i, fs in enumerate(fs_to_delete, 1):
-            fs_id = fs['file_system_id']
-            name = fs['name']
-            region = fs['region']
-            size = self.format_size(fs['size_bytes'])
-            monthly_cost = fs['monthly_cost']
-            
-            print(f"\n[{i}/{len(fs_to_delete)}] Processing file system: {name} ({fs_id})")
-            print(f"  Region: {region}, Size: {size}, Cost: ${monthly_cost:.2f}/month")
-            print(f"  Mount targets: {fs['mount_target_count']}, Access points: {fs['access_point_count']}")
-            
-            # Show warnings
-            if fs['safety']['warnings']:
-                for warning in fs['safety']['warnings'][:3]:
-                    print(f"  {Colors.YELLOW}⚠ {warning}{Colors.END}")
-            
-            if self.delete_file_system(fs, dry_run):
-                success_text = "Would delete" if dry_run else "Successfully deleted"
-                print(f"  {Colors.GREEN}✓ {success_text} {fs_id}{Colors.END}")
-                deleted_count += 1
-                total_savings += monthly_cost
-            else:
-                print(f"  {Colors.RED}✗ Failed to delete {fs_id}{Colors.END}")
-                failed_count += 1
-            
-            # Longer delay for EFS operations
-            if not dry_run:
-                time.sleep(5)
+        # Real deletions are journaled as they finish, so an interrupted run can be resumed
+        journal = None if dry_run else self.open_journal()
+        
+        results = []
+        total = len(fs_to_delete)
+        try:
+            with ThreadPoolExecutor(max_workers=min(DELETE_FS_CONCURRENCY, total)) as executor:
+                futures = [executor.submit(self.delete_and_report, i, total, fs, dry_run)
+                           for i, fs in enumerate(fs_to_delete, 1)]
+                for future in as_completed(futures):
+                    fs, success, report = future.result()
+                    sys.stdout.write(report)
+                    sys.stdout.flush()
+                    results.append((fs, success))
+                    if journal:
+                        journal.write(json.dumps({'fs': fs['file_system_id'], 'region': fs['region'],
+                                                  'ok': success, 'ts': time.time()}) + '\n')
+                        journal.flush()
+                    if success:
+                        deleted_count += 1
+                        total_savings += fs['monthly_cost']
+                    else:
+                        failed_count += 1
+        finally:
+            if journal:
+                journal.close()
+                print(f"\n{Colors.BLUE}Deletion journal: {journal.name} (pass it to --resume if interrupted){Colors.END}")
         
         # Final summary
         print(f"\n{Colors.BOLD}{'DRY RUN ' if dry_run else ''}DELETION SUMMARY{Colors.END}")
-        print(f"{Colors.BLUE}{'='*50}{Colors.END}")
-        success_text = "would be deleted" if dry_run else "deleted"
-        print(f"Successfully {success_text}: {Colors.GREEN}{deleted_count} file systems{Colors.END}")
-        print(f"Failed: {Colors.RED}{failed_count} file systems{Colors.END}")
-        print(f"Estimated monthly savings: {Colors.GREEN}${total_savings:.2f}{Colors.END}")
-        print(f"Estimated annual savings: {Colors.GREEN}${total_savings * 12:.2f}{Colors.END}")
+        print(SEP_BLUE_50)
+        print(fmt_deletion_summary(what="would be deleted" if dry_run else "deleted", deleted=deleted_count,
+                                   failed=failed_count, monthly=total_savings, annual=total_savings * 12))
+        
+        # Per file system results as one aligned table, in selection order, written with a single call
+        order = {id(fs): i for i, fs in enumerate(fs_to_delete)}
+        success_status = f"{Colors.BLUE}would delete{Colors.END}" if dry_run else f"{Colors.GREEN}deleted{Colors.END}"
+        failed_status = f"{Colors.RED}failed{Colors.END}"
+        rows = [f"\n{RESULTS_HEADER}", RESULTS_RULE]
+        for fs, success in sorted(results, key=lambda result: order[id(result[0])]):
+            rows.append(f"  {fs['file_system_id']:<21} | {fs['region']:<14} | {format_size(fs['size_bytes']):<9} | "
+                        f"${fs['monthly_cost']:>9.2f} | {success_status if success else failed_status}")
+        sys.stdout.write('\n'.join(rows) + '\n')
+        sys.stdout.flush()
         
         if not dry_run and deleted_count > 0:
             print(f"\n{Colors.RED}Warning: All data in the deleted file systems is permanently lost!{Colors.END}")
             print(f"{Colors.YELLOW}Note: File system deletion may take several minutes to complete.{Colors.END}")
+            self.clear_scan_cache()
     
     def run(self, dry_run: bool = False):
         """Main execution flow"""
         mode_text = " (DRY RUN MODE)" if dry_run else ""
         print(f"{Colors.BOLD}AWS EFS File System Cleanup Tool{mode_text}{Colors.END}")
-        print(f"{Colors.BLUE}{'='*70}{Colors.END}")
+        print(SEP_BLUE_70)
         
         if dry_run:
             print(f"{Colors.BLUE}Running in DRY RUN mode - no actual deletions will be performed{Colors.END}")
+        elif self.assume_yes:
+            print(f"{Colors.RED}{Colors.BOLD}⚠️  --yes WITHOUT --dry-run: confirmations are answered automatically "
+                  f"and selected file systems WILL BE DELETED{Colors.END}")
+        
+        # One reference time for the whole scan
+        self.start_scan_clock()
         
-        # Test region connectivity
-        accessible_regions = self.test_region_connectivity()
+        # Discover enabled regions
+        accessible_regions = self.discover_regions()
         print(f"\n{Colors.GREEN}Accessible regions: {', '.join(accessible_regions)}{Colors.END}")
         
+        # Regional rates for the cost estimates
+        self.load_pricing(accessible_regions)
+        
         # List all file systems
         file_systems = self.list_all_file_systems()
         
@@ -737,20 +1425,21 @@ class EFSCleaner:
             print(f"\n{Colors.GREEN}No EFS file systems found! Nothing to delete.{Colors.END}")
             return
         
-        # Show deletion options
-        total_cost = sum(fs['monthly_cost'] for fs in file_systems)
-        risky_count = sum(1 for fs in file_systems if fs['safety']['is_risky'])
-        inactive_count = sum(1 for fs in file_systems if not fs['metrics'].get('has_activity', False))
-        unmounted_count = sum(1 for fs in file_systems if fs['mount_target_count'] == 0)
+        # Show deletion options, counting everything in a single pass
+        total_cost = 0
+        risky_count = 0
+        inactive_count = 0
+        unmounted_count = 0
+        for fs in file_systems:
+            total_cost += fs['monthly_cost']
+            risky_count += fs['safety']['is_risky']
+            inactive_count += self.is_inactive(fs)
+            unmounted_count += fs['mount_target_count'] == 0
         
         print(f"\n{Colors.YELLOW}⚠️  DELETION OPTIONS{Colors.END}")
-        print(f"{Colors.YELLOW}{'='*50}{Colors.END}")
-        print(f"Total file systems: {Colors.BLUE}{len(file_systems)}{Colors.END}")
-        print(f"File systems with warnings: {Colors.RED}{risky_count}{Colors.END}")
-        print(f"Inactive file systems: {Colors.YELLOW}{inactive_count}{Colors.END}")
-        print(f"Unmounted file systems: {Colors.YELLOW}{unmounted_count}{Colors.END}")
-        print(f"Total estimated monthly cost: {Colors.YELLOW}${total_cost:.2f}{Colors.END}")
-        print(f"Potential annual savings: {Colors.GREEN}${total_cost * 12:.2f}{Colors.END}")
+        print(SEP_YELLOW)
+        print(fmt_deletion_options(total=len(file_systems), risky=risky_count, inactive=inactive_count,
+                                   unmounted=unmounted_count, cost=total_cost, annual=total_cost * 12))
         if not dry_run:
             print(f"{Colors.RED}⚠️  EFS deletion will permanently destroy all data!{Colors.END}")
             print(f"{Colors.RED}⚠️  This action CANNOT be undone!{Colors.END}")
@@ -761,7 +1450,7 @@ class EFSCleaner:
             return
         
         # Let user select file systems
-        selected_fs_ids = self.show_fs_selection_menu(file_systems)
+        selected_fs_ids = set(self.show_fs_selection_menu(file_systems))
         
         if not selected_fs_ids:
             print(f"{Colors.BLUE}No file systems selected. Exiting.{Colors.END}")
@@ -773,9 +1462,7 @@ class EFSCleaner:
         # Final confirmation
         confirmation_text = "DRY RUN CONFIRMATION" if dry_run else "FINAL CONFIRMATION"
         print(f"\n{Colors.RED}{confirmation_text}{Colors.END}")
-        print(f"Selected file systems: {Colors.YELLOW}{len(selected_fs)}{Colors.END}")
-        print(f"Monthly savings: {Colors.GREEN}${selected_cost:.2f}{Colors.END}")
-        print(f"Annual savings: {Colors.GREEN}${selected_cost * 12:.2f}{Colors.END}")
+        print(fmt_selection_summary(count=len(selected_fs), monthly=selected_cost, annual=selected_cost * 12))
         
         final_question = "Proceed with analysis?" if dry_run else "Are you absolutely sure you want to delete these file systems and ALL THEIR DATA?"
         if self.get_user_confirmation(final_question):
@@ -793,6 +1480,14 @@ Examples:
   python3 efs_cleanup.py                          # Use default AWS profile
   python3 efs_cleanup.py --profile dev            # Use specific profile
   python3 efs_cleanup.py --dry-run                # Test mode - no actual deletions
+  python3 efs_cleanup.py --max-workers 8          # Limit concurrent AWS API calls
+  python3 efs_cleanup.py --refresh-pricing        # Ignore the cached Pricing API rates
+  python3 efs_cleanup.py --refresh-regions        # Rediscover enabled regions instead of using the cache
+  python3 efs_cleanup.py --fast                   # Skip CloudWatch activity checks
+  python3 efs_cleanup.py --dry-run --yes          # Answer yes to confirmations (for automation)
+  python3 efs_cleanup.py --dry-run --yes --select unmounted  # Choose file systems without the menu prompt
+  python3 efs_cleanup.py --dry-run --cache        # Reuse scan results for 10 minutes (e.g. dry run, then real run)
+  python3 efs_cleanup.py --resume JOURNAL         # Skip file systems an interrupted run already deleted
   
 Features:
   - Lists all EFS file systems with size and cost analysis
@@ -819,10 +1514,62 @@ Warning:
         help='Dry run mode - show what would be deleted without actually deleting'
     )
     
+    parser.add_argument(
+        '--max-workers', '-w',
+        type=int,
+        default=16,
+        help='Maximum number of concurrent AWS API workers (default: 16)'
+    )
+    
+    parser.add_argument(
+        '--refresh-pricing',
+        action='store_true',
+        help='Reload EFS rates from the Pricing API instead of the cache (refreshed daily)'
+    )
+    
+    parser.add_argument(
+        '--refresh-regions',
+        action='store_true',
+        help='Rediscover enabled regions instead of using the cached list (refreshed daily)'
+    )
+    
+    parser.add_argument(
+        '--fast',
+        action='store_true',
+        help='Skip CloudWatch activity checks; file systems are then never treated as inactive'
+    )
+    
+    parser.add_argument(
+        '--yes', '-y',
+        action='store_true',
+        help='Answer yes to confirmation prompts (without it, prompts are declined when stdin is not a terminal)'
+    )
+    
+    parser.add_argument(
+        '--select',
+        metavar='CHOICE',
+        help="Menu selection to use instead of prompting: numbers (e.g. 1,3,5), 'all', 'inactive', 'unmounted' or 'safe'"
+    )
+    
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Reuse file systems scanned by a run in the last 10 minutes (cleared after deletions)'
+    )
+    
+    parser.add_argument(
+        '--resume',
+        metavar='JOURNAL',
+        help='Deletion journal from an interrupted run; file systems it records as deleted are skipped'
+    )
+    
     args = parser.parse_args()
     
     try:
-        cleaner = EFSCleaner(profile_name=args.profile)
+        cleaner = EFSCleaner(profile_name=args.profile, max_workers=args.max_workers,
+                             refresh_pricing=args.refresh_pricing, refresh_regions=args.refresh_regions,
+                             skip_metrics=args.fast, assume_yes=args.yes, use_cache=args.cache,
+                             resume_journal=args.resume, select=args.select)
         cleaner.run(dry_run=args.dry_run)
     except KeyboardInterrupt:
         print(f"\n{Colors.YELLOW}Operation cancelled by user (Ctrl+C){Colors.END}")
@@ -8,26 +8,154 @@ EKS clusters cost $0.10/hour (~$72/month) plus worker node costs, making cleanup
 import boto3
 import argparse
 import sys
+import io
+import json
+import operator
+import os
+import re
+import threading
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Any
-from botocore.exceptions import ClientError, NoCredentialsError, EndpointConnectionError
+from botocore.config import Config
+from botocore.exceptions import (BotoCoreError, ClientError, NoCredentialsError, EndpointConnectionError, WaiterError,
+                                 ConnectTimeoutError, ReadTimeoutError)
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Colors are only used on a terminal (and not with NO_COLOR set), so redirected output stays plain text
+USE_COLOR = sys.stdout.isatty() and 'NO_COLOR' not in os.environ
 
 class Colors:
-    """ANSI color codes for terminal output"""
-    RED = '\033[0;31m'
-    GREEN = '\033[0;32m'
-    YELLOW = '\033[1;33m'
-    BLUE = '\033[0;34m'
-    BOLD = '\033[1m'
-    END = '\033[0m'
+    """ANSI color codes for terminal output (empty when colors are off)"""
+    RED = '\033[0;31m' if USE_COLOR else ''
+    GREEN = '\033[0;32m' if USE_COLOR else ''
+    YELLOW = '\033[1;33m' if USE_COLOR else ''
+    BLUE = '\033[0;34m' if USE_COLOR else ''
+    BOLD = '\033[1m' if USE_COLOR else ''
+    END = '\033[0m' if USE_COLOR else ''
+
+# Separator bar and table headings, built once instead of on every print
+SEP_BLUE_160 = f"{Colors.BLUE}{'='*160}{Colors.END}"
+DETAILS_HEADER = (f"  {'Cluster Name':<20} | {'Region':<12} | {'Version':<8} | {'Status':<8} | {'NG':<2} | {'Nodes':<3} | "
+                  f"{'FG':<2} | {'Add':<2} | {'Access':<7} | {'Activity':<12} | {'Cost':<8} | {'Age':<4} | Safe")
+DETAILS_RULE = (f"  {'-'*20} | {'-'*12} | {'-'*8} | {'-'*8} | {'-'*2} | {'-'*3} | "
+                f"{'-'*2} | {'-'*2} | {'-'*7} | {'-'*12} | {'-'*8} | {'-'*4} | {'-'*4}")
+# Safety and activity markers shared by the details table and the selection menu
+SAFE_MARK = f"{Colors.GREEN}✓{Colors.END}"
+RISKY_MARK = f"{Colors.RED}⚠{Colors.END}"
+INACTIVE_MARK = f"{Colors.YELLOW}(INACTIVE){Colors.END}"
+# One row of the cluster details table, filled in by format_cluster_info
+fmt_cluster_row = ("  {name:<20} | {region:<12} | {version:<8} | {status:<8} | {node_groups:>2} | {nodes:>3} | "
+                   "{fargate:>2} | {addons:>2} | {access:<7} | {activity:<12} | ${cost:>7.0f} | {days:>3}d | {safety}").format
+
+# Name fragments that suggest a cluster is important, in reporting priority order
+# ('production' always contains 'prod', which takes priority, so it needs no entry)
+IMPORTANT_PATTERNS = ('prod', 'live', 'main', 'primary', 'staging', 'qa', 'test', 'development', 'dev')
+# Zero-width lookahead so overlapping fragments (e.g. 'devprod') are all found in one scan
+IMPORTANT_NAME_RE = re.compile(f"(?=({'|'.join(IMPORTANT_PATTERNS)}))")
+
+# Rough on-demand pricing for common worker instance types (hourly), used when the Pricing API
+# has no price for a type; anything else uses the default
+INSTANCE_PRICING: Dict[str, float] = {
+    't3.micro': 0.0104,
+    't3.small': 0.0208,
+    't3.medium': 0.0416,
+    't3.large': 0.0832,
+    't3.xlarge': 0.1664,
+    'm5.large': 0.096,
+    'm5.xlarge': 0.192,
+    'm5.2xlarge': 0.384,
+    'm5.4xlarge': 0.768,
+    'c5.large': 0.085,
+    'c5.xlarge': 0.17,
+    'r5.large': 0.126,
+    'r5.xlarge': 0.252,
+}
+DEFAULT_INSTANCE_HOURLY_COST = 0.1
+
+def desired_nodes(node_groups: List[Dict[str, Any]]) -> int:
+    """Total desired worker nodes across node groups"""
+    return sum((ng.get('scalingConfig') or {}).get('desiredSize', 0) for ng in node_groups)
+
+# Maximum number of per-cluster describe/list calls in flight across all regions
+API_CONCURRENCY = 32
+# Maximum number of node group, Fargate profile and add-on describes in flight
+DESCRIBE_CONCURRENCY = 16
+# Largest page size accepted by the EKS list operations
+EKS_PAGE_SIZE = 100
+
+# Region probe errors that say nothing about access; the region is scanned anyway
+PROBE_INCONCLUSIVE_ERRORS = frozenset(['ThrottlingException', 'TooManyRequestsException', 'RequestLimitExceeded'])
+
+# On-demand Linux EC2 prices per region and instance type from the Pricing API (only served from
+# us-east-1), reused for 30 days since list prices rarely change
+PRICING_API_REGION = 'us-east-1'
+EC2_PRICING_CACHE_FILE = os.path.expanduser('~/.cache/aws-account-cleanup/eks-ec2-pricing.json')
+EC2_PRICING_CACHE_TTL = 30 * 86400
+
+# Describe fields kept per node group, Fargate profile and add-on
+NODE_GROUP_FIELDS = ('nodegroupName', 'status', 'instanceTypes', 'scalingConfig', 'capacityType')
+FARGATE_PROFILE_FIELDS = ('fargateProfileName', 'status')
+ADDON_FIELDS = ('addonName', 'addonVersion', 'status')
+
+# Clusters torn down at the same time, and node group or add-on deletes in flight per cluster
+DELETE_CLUSTER_CONCURRENCY = 16
+DELETE_CONCURRENCY = 8
+
+# Deletion waiters poll until the resource is gone: node groups usually take 5-10 minutes,
+# Fargate profiles a few minutes each and add-ons well under a minute
+NODEGROUP_WAITER_CONFIG = {'Delay': 15, 'MaxAttempts': 60}
+FARGATE_WAITER_CONFIG = {'Delay': 10, 'MaxAttempts': 60}
+ADDON_WAITER_CONFIG = {'Delay': 5, 'MaxAttempts': 60}
+
+# EKS lets only one Fargate profile per cluster be DELETING at a time and rejects further deletes with
+# ResourceInUseException, so a cluster's profiles are deleted one after another, each waited on before the
+# next; profiles of different clusters are deleted concurrently by the delete_clusters pool
+
+# CloudTrail activity per account, region and cluster, reused for an hour unless --refresh-activity is given
+ACTIVITY_CACHE_FILE = os.path.expanduser('~/.cache/aws-account-cleanup/eks-activity.json')
+ACTIVITY_CACHE_TTL = 3600
+# Upper bound on the EKS CloudTrail events read per region (LookupEvents returns 50 per page)
+ACTIVITY_MAX_EVENTS = 2000
+# EKS calls that count as cluster activity
+ACTIVITY_EVENT_RE = re.compile('create|delete|update|describe', re.IGNORECASE)
 
 class EKSCleaner:
-    def __init__(self, profile_name: str = None):
+    def __init__(self, profile_name: str = None, refresh_activity: bool = False):
         """Initialize the AWS EKS cleaner"""
         self.profile_name = profile_name
+        self.refresh_activity = refresh_activity
         self.session = None
+        self.account_info = None
         self.accessible_regions = []
+        # Guards _clients while the session creates them
+        self._client_lock = threading.Lock()
+        self._clients: Dict[tuple, Any] = {}
+        # Activity read from the disk cache at the start of a scan, and lookups made during it
+        self._cached_activity: Dict[str, Dict[str, Any]] = {}
+        self._new_activity: Dict[str, Dict[str, Any]] = {}
+        # Hourly EC2 prices by 'region/instance type' (None when the Pricing API had no price),
+        # from the disk cache and fetched during the scan
+        self._instance_prices: Dict[str, Any] = {}
+        self._new_instance_prices: Dict[str, Dict[str, Any]] = {}
+        # Pool sized for the concurrent scan calls (the default 10 connections would queue them) and
+        # adaptive retries (client-side rate limiting with jittered backoff) so throttled calls don't
+        # drop clusters from the report
+        self._boto_config = Config(
+            max_pool_connections=50,
+            retries={'max_attempts': 10, 'mode': 'adaptive'}
+        )
+        # Region probes fail fast instead of waiting out the scan's retries, but a few standard
+        # retries keep a throttled call from dropping a region
+        self._probe_config = self._boto_config.merge(Config(
+            connect_timeout=3,
+            read_timeout=5,
+            retries={'max_attempts': 3, 'mode': 'standard'}
+        ))
+        # Shared pool for leaf API calls, bounding in-flight requests across all regions
+        self._api_executor = ThreadPoolExecutor(max_workers=API_CONCURRENCY)
+        # Node group, Fargate profile and add-on describes, issued from inside those leaf calls
+        self._describe_executor = ThreadPoolExecutor(max_workers=DESCRIBE_CONCURRENCY)
         self.setup_aws_session()
         
     def setup_aws_session(self):
@@ -41,11 +169,11 @@ class EKSCleaner:
                 print(f"{Colors.BLUE}Using default AWS profile{Colors.END}")
             
             # Test credentials
-            sts = self.session.client('sts')
-            identity = sts.get_caller_identity()
+            sts = self._client('sts')
+            self.account_info = sts.get_caller_identity()
             
-            print(f"{Colors.GREEN}✓ Connected to AWS Account: {identity['Account']}{Colors.END}")
-            print(f"{Colors.GREEN}✓ User/Role: {identity['Arn']}{Colors.END}")
+            print(f"{Colors.GREEN}✓ Connected to AWS Account: {self.account_info['Account']}{Colors.END}")
+            print(f"{Colors.GREEN}✓ User/Role: {self.account_info['Arn']}{Colors.END}")
             
         except NoCredentialsError:
             print(f"{Colors.RED}Error: AWS credentials not found!{Colors.END}")
@@ -55,6 +183,17 @@ class EKSCleaner:
             print(f"{Colors.RED}Error: {e}{Colors.END}")
             sys.exit(1)
     
+    def _client(self, service: str, region: str = None, probe: bool = False):
+        """Get a cached boto3 client for a service, region and timeout profile"""
+        key = (service, region, probe)
+        with self._client_lock:
+            client = self._clients.get(key)
+            if client is None:
+                config = self._probe_config if probe else self._boto_config
+                client = self.session.client(service, region_name=region, config=config)
+                self._clients[key] = client
+            return client
+    
     def test_region_connectivity(self) -> List[str]:
         """Test connectivity to different AWS regions"""
         test_regions = [
@@ -62,19 +201,48 @@ class EKSCleaner:
             'ap-southeast-1', 'eu-west-1', 'eu-central-1'
         ]
         
-        accessible_regions = []
         print(f"\n{Colors.BLUE}Testing region connectivity...{Colors.END}")
         
-        for region in test_regions:
+        # Regions the installed service model doesn't list for EKS are skipped without a call
+        eks_regions = set(self.session.get_available_regions('eks'))
+        
+        def probe_region(region: str):
+            if eks_regions and region not in eks_regions:
+                return False, "EKS not available in this region"
             try:
-                eks = self.session.client('eks', region_name=region)
+                # An authenticated one-item listing also confirms the credentials work in the region
+                eks = self._client('eks', region, probe=True)
                 eks.list_clusters(maxResults=1)
+                return True, None
+            except ClientError as e:
+                error = e.response.get('Error', {}).get('Code')
+                if error in PROBE_INCONCLUSIVE_ERRORS or e.response.get('ResponseMetadata', {}).get('HTTPStatusCode', 0) >= 500:
+                    return True, error
+                return False, None
+            except EndpointConnectionError:
+                return False, None
+            except (ConnectTimeoutError, ReadTimeoutError):
+                return True, "timed out"
+            except Exception as e:
+                return False, str(e)
+        
+        # Probe all regions at once, then report in the original region order
+        with ThreadPoolExecutor(max_workers=len(test_regions)) as executor:
+            probe_results = dict(zip(test_regions, executor.map(probe_region, test_regions)))
+        
+        accessible_regions = []
+        for region in test_regions:
+            ok, error = probe_results[region]
+            if ok and error:
+                print(f"{Colors.YELLOW}? {region} - probe failed ({error}), scanning anyway{Colors.END}")
+                accessible_regions.append(region)
+            elif ok:
                 print(f"{Colors.GREEN}✓ {region} - accessible{Colors.END}")
                 accessible_regions.append(region)
-            except (EndpointConnectionError, ClientError) as e:
+            elif error is None:
                 print(f"{Colors.RED}✗ {region} - not accessible{Colors.END}")
-            except Exception as e:
-                print(f"{Colors.RED}✗ {region} - error: {str(e)[:50]}...{Colors.END}")
+            else:
+                print(f"{Colors.RED}✗ {region} - error: {error[:50]}...{Colors.END}")
         
         if not accessible_regions:
             print(f"{Colors.RED}Error: No accessible regions found!{Colors.END}")
@@ -90,63 +258,121 @@ class EKSCleaner:
         monthly_cost = hourly_cost * cluster_hours
         return monthly_cost
     
+    def fetch_instance_price(self, instance_type: str, region: str):
+        """Fetch the on-demand Linux hourly price of an instance type from the Pricing API, or None"""
+        pricing = self._client('pricing', PRICING_API_REGION)
+        filters = {
+            'instanceType': instance_type,
+            'regionCode': region,
+            'operatingSystem': 'Linux',
+            'tenancy': 'Shared',
+            'preInstalledSw': 'NA',
+            'capacitystatus': 'Used'
+        }
+        response = pricing.get_products(
+            ServiceCode='AmazonEC2',
+            Filters=[{'Type': 'TERM_MATCH', 'Field': field, 'Value': value} for field, value in filters.items()]
+        )
+        
+        for price_item in response['PriceList']:
+            product = json.loads(price_item)
+            for term in product.get('terms', {}).get('OnDemand', {}).values():
+                for dimension in term['priceDimensions'].values():
+                    price = float(dimension['pricePerUnit'].get('USD', 0))
+                    if price > 0:
+                        return price
+        return None
+    
+    def read_ec2_pricing_cache(self) -> Dict[str, Any]:
+        """Return prices saved within the TTL, or {} if missing or unreadable"""
+        try:
+            with open(EC2_PRICING_CACHE_FILE) as f:
+                cached = json.load(f)
+            now = time.time()
+            return {key: entry for key, entry in cached['prices'].items() if now - entry['ts'] < EC2_PRICING_CACHE_TTL}
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+    
+    def write_ec2_pricing_cache(self):
+        """Save prices fetched during this scan, keeping other unexpired entries"""
+        entries = self.read_ec2_pricing_cache()
+        entries.update(self._new_instance_prices)
+        try:
+            os.makedirs(os.path.dirname(EC2_PRICING_CACHE_FILE), exist_ok=True)
+            tmp_path = f"{EC2_PRICING_CACHE_FILE}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({'prices': entries}, f)
+            os.replace(tmp_path, EC2_PRICING_CACHE_FILE)
+        except OSError:
+            pass
+    
+    def get_instance_hourly_cost(self, instance_type: str, region: str) -> float:
+        """Hourly on-demand price of an instance type, from the Pricing API when available"""
+        key = f"{region}/{instance_type}"
+        if key not in self._instance_prices:
+            try:
+                price = self.fetch_instance_price(instance_type, region)
+                self._new_instance_prices[key] = {'ts': time.time(), 'price': price}
+            except (ClientError, BotoCoreError, ValueError, KeyError):
+                # Pricing API not reachable, timed out or not permitted; retried on the next run
+                price = None
+            self._instance_prices[key] = price
+        
+        price = self._instance_prices[key]
+        if price is None:
+            price = INSTANCE_PRICING.get(instance_type, DEFAULT_INSTANCE_HOURLY_COST)
+        return price
+    
     def estimate_node_group_cost(self, node_group: Dict[str, Any], region: str) -> float:
         """Estimate cost for an EKS node group"""
         # This is a rough estimation - actual costs depend on instance types and usage
         instance_types = node_group.get('instanceTypes', ['m5.large'])
-        min_size = node_group.get('scalingConfig', {}).get('minSize', 0)
-        desired_capacity = node_group.get('scalingConfig', {}).get('desiredSize', min_size)
-        
-        # Rough pricing for common instance types (hourly)
-        instance_pricing = {
-            't3.micro': 0.0104,
-            't3.small': 0.0208,
-            't3.medium': 0.0416,
-            't3.large': 0.0832,
-            't3.xlarge': 0.1664,
-            'm5.large': 0.096,
-            'm5.xlarge': 0.192,
-            'm5.2xlarge': 0.384,
-            'm5.4xlarge': 0.768,
-            'c5.large': 0.085,
-            'c5.xlarge': 0.17,
-            'r5.large': 0.126,
-            'r5.xlarge': 0.252,
-        }
+        scaling_config = node_group.get('scalingConfig') or {}
+        desired_capacity = scaling_config.get('desiredSize', scaling_config.get('minSize', 0))
         
         # Use first instance type for estimation
         primary_instance_type = instance_types[0] if instance_types else 'm5.large'
-        hourly_cost_per_instance = instance_pricing.get(primary_instance_type, 0.1)
+        hourly_cost_per_instance = self.get_instance_hourly_cost(primary_instance_type, region)
         
         # Calculate monthly cost for desired capacity
         monthly_cost = hourly_cost_per_instance * desired_capacity * 24 * 30
         
         return monthly_cost
     
+    def paginate_names(self, eks, operation: str, result_key: str, **kwargs) -> List[str]:
+        """Collect the names from every page of an EKS list operation"""
+        paginator = eks.get_paginator(operation)
+        pages = paginator.paginate(PaginationConfig={'PageSize': EKS_PAGE_SIZE}, **kwargs)
+        return [name for page in pages for name in page.get(result_key, [])]
+    
+    def describe_each(self, describe, name_param: str, names: List[str], result_key: str, fields: tuple,
+                      **kwargs) -> List[Dict[str, Any]]:
+        """Describe the named resources concurrently, in listing order, skipping any that fail"""
+        # Runs inside the shared executor's leaf calls, so the describes use a pool of their own
+        futures = [self._describe_executor.submit(describe, **{name_param: name}, **kwargs) for name in names]
+        results = []
+        for future in futures:
+            try:
+                resource = future.result()[result_key]
+            except ClientError:
+                continue
+            # Only the fields the report and deletion use are kept for the rest of the run
+            results.append({field: resource[field] for field in fields if field in resource})
+        return results
+    
     def get_node_groups(self, cluster_name: str, region: str) -> List[Dict[str, Any]]:
         """Get all node groups for an EKS cluster"""
         try:
-            eks = self.session.client('eks', region_name=region)
+            eks = self._client('eks', region)
             
-            # List node groups
-            node_groups_response = eks.list_nodegroups(clusterName=cluster_name)
-            node_group_names = node_groups_response.get('nodegroups', [])
+            # List node groups (paginated, a single call stops at the first page)
+            node_group_names = self.paginate_names(eks, 'list_nodegroups', 'nodegroups', clusterName=cluster_name)
             
-            node_groups = []
-            for ng_name in node_group_names:
-                try:
-                    ng_details = eks.describe_nodegroup(
-                        clusterName=cluster_name,
-                        nodegroupName=ng_name
-                    )
-                    node_group = ng_details['nodegroup']
-                    
-                    # Add cost estimation
-                    node_group['estimated_monthly_cost'] = self.estimate_node_group_cost(node_group, region)
-                    
-                    node_groups.append(node_group)
-                except ClientError:
-                    continue
+            node_groups = self.describe_each(eks.describe_nodegroup, 'nodegroupName', node_group_names,
+                                             'nodegroup', NODE_GROUP_FIELDS, clusterName=cluster_name)
+            for node_group in node_groups:
+                # Add cost estimation
+                node_group['estimated_monthly_cost'] = self.estimate_node_group_cost(node_group, region)
             
             return node_groups
             
@@ -156,29 +382,19 @@ class EKSCleaner:
     def get_fargate_profiles(self, cluster_name: str, region: str) -> List[Dict[str, Any]]:
         """Get all Fargate profiles for an EKS cluster"""
         try:
-            eks = self.session.client('eks', region_name=region)
+            eks = self._client('eks', region)
             
             # List Fargate profiles
-            fargate_response = eks.list_fargate_profiles(clusterName=cluster_name)
-            fargate_profile_names = fargate_response.get('fargateProfileNames', [])
+            fargate_profile_names = self.paginate_names(eks, 'list_fargate_profiles', 'fargateProfileNames',
+                                                        clusterName=cluster_name)
             
-            fargate_profiles = []
-            for fp_name in fargate_profile_names:
-                try:
-                    fp_details = eks.describe_fargate_profile(
-                        clusterName=cluster_name,
-                        fargateProfileName=fp_name
-                    )
-                    fargate_profile = fp_details['fargateProfile']
-                    
-                    # Fargate pricing is per vCPU-second and GB-second
-                    # Rough estimate: $0.04048 per vCPU per hour + $0.004445 per GB per hour
-                    # This is difficult to estimate without knowing actual workloads
-                    fargate_profile['estimated_monthly_cost'] = 20.0  # Conservative estimate
-                    
-                    fargate_profiles.append(fargate_profile)
-                except ClientError:
-                    continue
+            fargate_profiles = self.describe_each(eks.describe_fargate_profile, 'fargateProfileName', fargate_profile_names,
+                                                  'fargateProfile', FARGATE_PROFILE_FIELDS, clusterName=cluster_name)
+            for fargate_profile in fargate_profiles:
+                # Fargate pricing is per vCPU-second and GB-second
+                # Rough estimate: $0.04048 per vCPU per hour + $0.004445 per GB per hour
+                # This is difficult to estimate without knowing actual workloads
+                fargate_profile['estimated_monthly_cost'] = 20.0  # Conservative estimate
             
             return fargate_profiles
             
@@ -188,97 +404,162 @@ class EKSCleaner:
     def get_cluster_addons(self, cluster_name: str, region: str) -> List[Dict[str, Any]]:
         """Get all add-ons for an EKS cluster"""
         try:
-            eks = self.session.client('eks', region_name=region)
+            eks = self._client('eks', region)
             
             # List add-ons
-            addons_response = eks.list_addons(clusterName=cluster_name)
-            addon_names = addons_response.get('addons', [])
-            
-            addons = []
-            for addon_name in addon_names:
-                try:
-                    addon_details = eks.describe_addon(
-                        clusterName=cluster_name,
-                        addonName=addon_name
-                    )
-                    addons.append(addon_details['addon'])
-                except ClientError:
-                    continue
+            addon_names = self.paginate_names(eks, 'list_addons', 'addons', clusterName=cluster_name)
             
-            return addons
+            return self.describe_each(eks.describe_addon, 'addonName', addon_names, 'addon', ADDON_FIELDS,
+                                      clusterName=cluster_name)
             
         except ClientError:
             return []
     
-    def check_cluster_activity(self, cluster_name: str, region: str) -> Dict[str, Any]:
-        """Check for cluster activity indicators"""
+    def activity_cache_key(self, cluster_name: str, region: str) -> str:
+        """Activity cache entry for a cluster in the current account"""
+        return f"{self.account_info['Account']}/{region}/{cluster_name}"
+    
+    def read_activity_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Return activity entries saved within the TTL, or {} if missing or unreadable"""
         try:
-            # We can't easily check for running pods without kubectl access
-            # But we can check for recent API activity via CloudTrail
-            cloudtrail = self.session.client('cloudtrail', region_name=region)
-            
-            # Look for EKS API activity in the last 7 days
-            end_time = datetime.now(timezone.utc)
-            start_time = end_time - timedelta(days=7)
-            
-            events = cloudtrail.lookup_events(
-                LookupAttributes=[
-                    {
-                        'AttributeKey': 'ResourceName',
-                        'AttributeValue': cluster_name
-                    }
-                ],
-                StartTime=start_time,
-                EndTime=end_time,
-                MaxItems=20
-            )
-            
-            api_calls = []
-            for event in events.get('Events', []):
-                event_name = event.get('EventName', '')
-                if any(api in event_name.lower() for api in ['create', 'delete', 'update', 'describe']):
-                    api_calls.append({
-                        'event_name': event_name,
-                        'event_time': event['EventTime']
-                    })
-            
+            with open(ACTIVITY_CACHE_FILE) as f:
+                cached = json.load(f)
+            now = time.time()
+            return {key: entry for key, entry in cached['entries'].items() if now - entry['ts'] < ACTIVITY_CACHE_TTL}
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+    
+    def write_activity_cache(self):
+        """Save this scan's activity lookups to disk, keeping other clusters' unexpired entries"""
+        entries = self.read_activity_cache()
+        entries.update(self._new_activity)
+        try:
+            os.makedirs(os.path.dirname(ACTIVITY_CACHE_FILE), exist_ok=True)
+            tmp_path = f"{ACTIVITY_CACHE_FILE}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({'entries': entries}, f)
+            os.replace(tmp_path, ACTIVITY_CACHE_FILE)
+        except OSError:
+            pass
+    
+    def lookup_eks_activity(self, region: str, attribute_key: str, attribute_value: str):
+        """Run one 7-day CloudTrail lookup, returning ({resource name: [count, last time]}, truncated)"""
+        # We can't easily check for running pods without kubectl access
+        # But we can check for recent API activity via CloudTrail
+        cloudtrail = self._client('cloudtrail', region)
+        
+        end_time = datetime.now(timezone.utc)
+        start_time = end_time - timedelta(days=7)
+        
+        paginator = cloudtrail.get_paginator('lookup_events')
+        pages = paginator.paginate(
+            LookupAttributes=[
+                {
+                    'AttributeKey': attribute_key,
+                    'AttributeValue': attribute_value
+                }
+            ],
+            StartTime=start_time,
+            EndTime=end_time,
+            PaginationConfig={'MaxItems': ACTIVITY_MAX_EVENTS}
+        )
+        
+        # Only a running count and the latest time are kept per resource, and events that name
+        # no resource are skipped before the event name is matched
+        activity = {}
+        for page in pages:
+            for event in page.get('Events', []):
+                resources = event.get('Resources')
+                if not resources or not ACTIVITY_EVENT_RE.search(event.get('EventName', '')):
+                    continue
+                event_time = event['EventTime']
+                for resource_name in {resource.get('ResourceName') for resource in resources}:
+                    counts = activity.get(resource_name)
+                    if counts is None:
+                        activity[resource_name] = [1, event_time]
+                    else:
+                        counts[0] += 1
+                        if event_time > counts[1]:
+                            counts[1] = event_time
+        
+        # The paginator leaves a resume token behind when MaxItems stopped it short
+        return activity, pages.resume_token is not None
+    
+    def get_region_eks_activity(self, region: str):
+        """Sweep the region's EKS CloudTrail events once, returning (activity, truncated) or None on failure"""
+        # LookupEvents takes a single attribute, so one EventSource query covers every cluster
+        # and is bucketed by resource name instead of querying per cluster
+        try:
+            return self.lookup_eks_activity(region, 'EventSource', 'eks.amazonaws.com')
+        except (ClientError, BotoCoreError):
+            return None
+    
+    def get_cluster_eks_activity(self, cluster_name: str, region: str):
+        """Look up one cluster's CloudTrail events by name, returning [count, last time] or None on failure"""
+        try:
+            activity, _ = self.lookup_eks_activity(region, 'ResourceName', cluster_name)
+        except (ClientError, BotoCoreError):
+            return None
+        return activity.get(cluster_name, [0, None])
+    
+    def check_cluster_activity(self, cluster_name: str, region: str, region_activity) -> Dict[str, Any]:
+        """Check for cluster activity indicators, from the cache or the region's CloudTrail sweep"""
+        cache_key = self.activity_cache_key(cluster_name, region)
+        cached = self._cached_activity.get(cache_key)
+        if cached:
+            last_activity = cached['last_activity']
             return {
-                'recent_api_calls': len(api_calls),
-                'last_activity': max([event['event_time'] for event in api_calls]) if api_calls else None,
-                'has_recent_activity': len(api_calls) > 0
+                'recent_api_calls': cached['recent_api_calls'],
+                'last_activity': datetime.fromisoformat(last_activity) if last_activity else None,
+                'has_recent_activity': cached['recent_api_calls'] > 0,
+                'checked': True
             }
-            
-        except ClientError:
+        
+        counts = region_activity.get(cluster_name, (0, None)) if region_activity is not None else None
+        if counts is None:
+            # CloudTrail could not be queried, so activity is unknown rather than absent; don't cache it
             return {
                 'recent_api_calls': 0,
                 'last_activity': None,
-                'has_recent_activity': False
+                'has_recent_activity': False,
+                'checked': False
             }
+        
+        recent_api_calls, last_activity = counts
+        self._new_activity[cache_key] = {
+            'ts': time.time(),
+            'recent_api_calls': recent_api_calls,
+            'last_activity': last_activity.isoformat() if last_activity else None
+        }
+        
+        return {
+            'recent_api_calls': recent_api_calls,
+            'last_activity': last_activity,
+            'has_recent_activity': recent_api_calls > 0,
+            'checked': True
+        }
+    
+    def is_inactive(self, cluster: Dict[str, Any]) -> bool:
+        """Check whether CloudTrail was read for a cluster and showed no recent activity"""
+        activity = cluster['activity']
+        return activity.get('checked', True) and not activity.get('has_recent_activity', False)
     
     def check_cluster_safety(self, cluster_info: Dict[str, Any]) -> Dict[str, Any]:
         """Check if EKS cluster appears to be important or in use"""
         cluster_name = cluster_info['name']
         safety_warnings = []
         
-        # Check for important patterns in name
-        important_patterns = [
-            'prod', 'production', 'live', 'main', 'primary',
-            'staging', 'qa', 'test', 'development', 'dev'
-        ]
-        
+        # Check for important patterns in name (single regex pass; the highest priority match is reported)
         name_lower = cluster_name.lower()
-        for pattern in important_patterns:
-            if pattern in name_lower:
-                safety_warnings.append(f"Name contains '{pattern}' - might be important")
-                break
+        matches = {m.group(1) for m in IMPORTANT_NAME_RE.finditer(name_lower)}
+        if matches:
+            pattern = min(matches, key=IMPORTANT_PATTERNS.index)
+            safety_warnings.append(f"Name contains '{pattern}' - might be important")
         
         # Check if cluster has node groups
         node_group_count = len(cluster_info.get('node_groups', []))
         if node_group_count > 0:
-            total_nodes = sum(
-                ng.get('scalingConfig', {}).get('desiredSize', 0) 
-                for ng in cluster_info['node_groups']
-            )
+            total_nodes = desired_nodes(cluster_info['node_groups'])
             safety_warnings.append(f"Has {node_group_count} node groups with {total_nodes} total nodes")
         
         # Check if cluster has Fargate profiles
@@ -297,6 +578,8 @@ class EKSCleaner:
         if activity.get('has_recent_activity'):
             api_calls = activity['recent_api_calls']
             safety_warnings.append(f"Recent activity: {api_calls} API calls in 7 days")
+        elif not activity.get('checked', True):
+            safety_warnings.append("Recent activity unknown (CloudTrail not checked)")
         
         # Check cluster status
         if cluster_info['status'] == 'ACTIVE':
@@ -324,34 +607,63 @@ class EKSCleaner:
             'days_since_created': days_since_created
         }
     
-    def list_eks_clusters_in_region(self, region: str) -> List[Dict[str, Any]]:
+    def list_eks_clusters_in_region(self, region: str, out=None) -> List[Dict[str, Any]]:
         """List all EKS clusters in a specific region"""
         try:
-            eks = self.session.client('eks', region_name=region)
+            eks = self._client('eks', region)
             
             clusters = []
             
             # List clusters
-            clusters_response = eks.list_clusters()
-            cluster_names = clusters_response.get('clusters', [])
+            cluster_names = self.paginate_names(eks, 'list_clusters', 'clusters')
             
+            # The describe call, node groups, Fargate profiles and add-ons are independent, so every
+            # cluster's lookups are submitted at once, alongside the region-wide CloudTrail sweep (skipped
+            # when every cluster's activity is cached). The shared executor only runs these leaf calls,
+            # so region workers can safely wait on it
+            executor = self._api_executor
+            activity_future = None
+            if any(self.activity_cache_key(cluster_name, region) not in self._cached_activity
+                   for cluster_name in cluster_names):
+                activity_future = executor.submit(self.get_region_eks_activity, region)
+            futures = {}
             for cluster_name in cluster_names:
+                futures[cluster_name] = (
+                    executor.submit(eks.describe_cluster, name=cluster_name),
+                    executor.submit(self.get_node_groups, cluster_name, region),
+                    executor.submit(self.get_fargate_profiles, cluster_name, region),
+                    executor.submit(self.get_cluster_addons, cluster_name, region)
+                )
+            region_activity = {}
+            if activity_future:
+                sweep = activity_future.result()
+                if sweep is None:
+                    region_activity = None
+                    print(f"    {Colors.YELLOW}Warning: CloudTrail lookup failed; cluster activity is unknown{Colors.END}", file=out)
+                else:
+                    region_activity, truncated = sweep
+                    if truncated:
+                        # The sweep stopped at the event cap, so a cluster it never saw may still be busy;
+                        # those clusters fall back to a lookup by name
+                        unseen = [cluster_name for cluster_name in cluster_names
+                                  if cluster_name not in region_activity
+                                  and self.activity_cache_key(cluster_name, region) not in self._cached_activity]
+                        print(f"    {Colors.YELLOW}Warning: CloudTrail sweep stopped at {ACTIVITY_MAX_EVENTS} events; "
+                              f"checking {len(unseen)} clusters individually{Colors.END}", file=out)
+                        lookups = {cluster_name: executor.submit(self.get_cluster_eks_activity, cluster_name, region)
+                                   for cluster_name in unseen}
+                        for cluster_name, lookup in lookups.items():
+                            region_activity[cluster_name] = lookup.result()
+            
+            for cluster_name, cluster_futures in futures.items():
                 try:
-                    # Get cluster details
-                    cluster_response = eks.describe_cluster(name=cluster_name)
+                    cluster_response, node_groups, fargate_profiles, addons = (
+                        future.result() for future in cluster_futures
+                    )
                     cluster = cluster_response['cluster']
                     
-                    # Get node groups
-                    node_groups = self.get_node_groups(cluster_name, region)
-                    
-                    # Get Fargate profiles
-                    fargate_profiles = self.get_fargate_profiles(cluster_name, region)
-                    
-                    # Get add-ons
-                    addons = self.get_cluster_addons(cluster_name, region)
-                    
                     # Check for recent activity
-                    activity = self.check_cluster_activity(cluster_name, region)
+                    activity = self.check_cluster_activity(cluster_name, region, region_activity)
                     
                     # Calculate total monthly cost
                     control_plane_cost = self.get_eks_pricing()
@@ -390,15 +702,21 @@ class EKSCleaner:
                     clusters.append(cluster_info)
                     
                 except ClientError as e:
-                    print(f"    {Colors.YELLOW}Warning: Cannot access cluster {cluster_name}: {e}{Colors.END}")
+                    print(f"    {Colors.YELLOW}Warning: Cannot access cluster {cluster_name}: {e}{Colors.END}", file=out)
                     continue
             
             return clusters
             
         except ClientError as e:
-            print(f"{Colors.RED}Error listing EKS clusters in {region}: {e}{Colors.END}")
+            print(f"{Colors.RED}Error listing EKS clusters in {region}: {e}{Colors.END}", file=out)
             return []
     
+    def scan_region(self, region: str) -> tuple:
+        """Scan one region, buffering its warnings so parallel scans don't interleave output"""
+        buffer = io.StringIO()
+        clusters = self.list_eks_clusters_in_region(region, out=buffer)
+        return clusters, buffer.getvalue()
+    
     def format_cluster_info(self, cluster: Dict[str, Any]) -> str:
         """Format cluster information for display"""
         name = cluster['name'][:20] if len(cluster['name']) > 20 else cluster['name']
@@ -411,10 +729,7 @@ class EKSCleaner:
         addon_count = len(cluster['addons'])
         
         # Calculate total nodes
-        total_nodes = sum(
-            ng.get('scalingConfig', {}).get('desiredSize', 0) 
-            for ng in cluster['node_groups']
-        )
+        total_nodes = desired_nodes(cluster['node_groups'])
         
         total_monthly_cost = cluster['total_monthly_cost']
         
@@ -422,6 +737,8 @@ class EKSCleaner:
         activity = cluster['activity']
         if activity.get('has_recent_activity'):
             activity_indicator = f"{activity['recent_api_calls']} calls"
+        elif not activity.get('checked', True):
+            activity_indicator = "Unknown"
         else:
             activity_indicator = "No activity"
         
@@ -433,94 +750,127 @@ class EKSCleaner:
         access_type = "Public" if endpoint_config.get('publicAccess', True) else "Private"
         
         # Safety indicator
-        if cluster['safety']['is_risky']:
-            safety_indicator = f"{Colors.RED}⚠{Colors.END}"
-        else:
-            safety_indicator = f"{Colors.GREEN}✓{Colors.END}"
+        safety_indicator = RISKY_MARK if cluster['safety']['is_risky'] else SAFE_MARK
         
-        return f"  {name:<20} | {region:<12} | {version:<8} | {status:<8} | {node_group_count:>2} | {total_nodes:>3} | {fargate_count:>2} | {addon_count:>2} | {access_type:<7} | {activity_indicator:<12} | ${total_monthly_cost:>7.0f} | {days_ago:>3}d | {safety_indicator}"
+        return fmt_cluster_row(name=name, region=region, version=version, status=status, node_groups=node_group_count,
+                               nodes=total_nodes, fargate=fargate_count, addons=addon_count, access=access_type,
+                               activity=activity_indicator, cost=total_monthly_cost, days=days_ago, safety=safety_indicator)
     
     def list_all_clusters(self) -> List[Dict[str, Any]]:
         """List all EKS clusters across accessible regions"""
-        print(f"\n{Colors.BLUE}{'='*160}{Colors.END}")
+        print("\n" + SEP_BLUE_160)
         print(f"{Colors.BLUE}Scanning EKS Clusters across regions...{Colors.END}")
-        print(f"{Colors.BLUE}{'='*160}{Colors.END}")
+        print(SEP_BLUE_160)
         
         all_clusters = []
         total_cost = 0
         total_nodes = 0
+        # Summary counters and the cost breakdown are accumulated in the same pass as the region totals
+        risky_count = 0
+        inactive_count = 0
+        total_control_plane = 0
+        total_node_groups = 0
+        total_fargate = 0
         
-        for region in self.accessible_regions:
-            print(f"\n{Colors.YELLOW}Checking region: {region}{Colors.END}")
-            
-            clusters = self.list_eks_clusters_in_region(region)
+        # Clusters looked up within the last hour reuse their CloudTrail activity
+        self._cached_activity = {} if self.refresh_activity else self.read_activity_cache()
+        self._new_activity = {}
+        # Instance prices looked up within the last 30 days are reused as well
+        self._instance_prices = {key: entry['price'] for key, entry in self.read_ec2_pricing_cache().items()}
+        self._new_instance_prices = {}
+        
+        # Regions are scanned in parallel; each region's block is printed, in region order, as soon as
+        # that region and the ones before it are done, instead of after the slowest region
+        with ThreadPoolExecutor(max_workers=len(self.accessible_regions) or 1) as executor:
+            future_by_region = {region: executor.submit(self.scan_region, region) for region in self.accessible_regions}
             
-            if clusters:
-                region_cost = sum(cluster['total_monthly_cost'] for cluster in clusters)
-                region_nodes = sum(
-                    sum(ng.get('scalingConfig', {}).get('desiredSize', 0) for ng in cluster['node_groups'])
-                    for cluster in clusters
-                )
-                region_fargate = sum(len(cluster['fargate_profiles']) for cluster in clusters)
+            for region in self.accessible_regions:
+                try:
+                    clusters, region_output = future_by_region[region].result()
+                except Exception as e:
+                    clusters, region_output = [], f"{Colors.RED}Error scanning {region}: {e}{Colors.END}\n"
                 
-                print(f"{Colors.GREEN}Found {len(clusters)} clusters{Colors.END}")
-                print(f"  Total nodes: {region_nodes}")
-                print(f"  Fargate profiles: {region_fargate}")
-                print(f"  Estimated monthly cost: ${region_cost:.2f}")
+                out = io.StringIO()
+                print(f"\n{Colors.YELLOW}Checking region: {region}{Colors.END}", file=out)
+                out.write(region_output)
                 
-                total_cost += region_cost
-                total_nodes += region_nodes
-                all_clusters.extend(clusters)
-            else:
-                print(f"{Colors.GREEN}No clusters found{Colors.END}")
+                if clusters:
+                    region_cost = 0
+                    region_nodes = 0
+                    region_fargate = 0
+                    for cluster in clusters:
+                        region_cost += cluster['total_monthly_cost']
+                        region_nodes += desired_nodes(cluster['node_groups'])
+                        region_fargate += len(cluster['fargate_profiles'])
+                        if cluster['safety']['is_risky']:
+                            risky_count += 1
+                        if self.is_inactive(cluster):
+                            inactive_count += 1
+                        total_control_plane += cluster['control_plane_cost']
+                        total_node_groups += cluster['node_group_cost']
+                        total_fargate += cluster['fargate_cost']
+                    
+                    print(f"{Colors.GREEN}Found {len(clusters)} clusters{Colors.END}", file=out)
+                    print(f"  Total nodes: {region_nodes}", file=out)
+                    print(f"  Fargate profiles: {region_fargate}", file=out)
+                    print(f"  Estimated monthly cost: ${region_cost:.2f}", file=out)
+                    
+                    total_cost += region_cost
+                    total_nodes += region_nodes
+                    all_clusters.extend(clusters)
+                else:
+                    print(f"{Colors.GREEN}No clusters found{Colors.END}", file=out)
+                
+                sys.stdout.write(out.getvalue())
+                sys.stdout.flush()
         
-        # Display summary
-        risky_count = sum(1 for cluster in all_clusters if cluster['safety']['is_risky'])
-        inactive_count = sum(1 for cluster in all_clusters if not cluster['activity'].get('has_recent_activity', False))
+        if self._new_activity:
+            self.write_activity_cache()
+        if self._new_instance_prices:
+            self.write_ec2_pricing_cache()
         
-        print(f"\n{Colors.BOLD}EKS CLUSTERS SUMMARY{Colors.END}")
-        print(f"{Colors.BLUE}{'='*160}{Colors.END}")
+        # The rest of the report is built in memory and written at once instead of one print per line
+        out = io.StringIO()
         
-        # Get current account info
-        sts = self.session.client('sts')
-        account_info = sts.get_caller_identity()
+        # Display summary
+        print(f"\n{Colors.BOLD}EKS CLUSTERS SUMMARY{Colors.END}", file=out)
+        print(SEP_BLUE_160, file=out)
         
-        print(f"AWS Account ID: {Colors.YELLOW}{account_info['Account']}{Colors.END}")
-        print(f"Total clusters found: {Colors.YELLOW}{len(all_clusters)}{Colors.END}")
-        print(f"Clusters with warnings: {Colors.RED}{risky_count}{Colors.END}")
-        print(f"Inactive clusters: {Colors.YELLOW}{inactive_count}{Colors.END}")
-        print(f"Total worker nodes: {Colors.YELLOW}{total_nodes}{Colors.END}")
-        print(f"Total estimated monthly cost: {Colors.YELLOW}${total_cost:.2f}{Colors.END}")
-        print(f"Total estimated annual cost: {Colors.YELLOW}${total_cost * 12:.2f}{Colors.END}")
-        print(f"Regions scanned: {Colors.YELLOW}{', '.join(self.accessible_regions)}{Colors.END}")
+        print(f"AWS Account ID: {Colors.YELLOW}{self.account_info['Account']}{Colors.END}", file=out)
+        print(f"Total clusters found: {Colors.YELLOW}{len(all_clusters)}{Colors.END}", file=out)
+        print(f"Clusters with warnings: {Colors.RED}{risky_count}{Colors.END}", file=out)
+        print(f"Inactive clusters: {Colors.YELLOW}{inactive_count}{Colors.END}", file=out)
+        print(f"Total worker nodes: {Colors.YELLOW}{total_nodes}{Colors.END}", file=out)
+        print(f"Total estimated monthly cost: {Colors.YELLOW}${total_cost:.2f}{Colors.END}", file=out)
+        print(f"Total estimated annual cost: {Colors.YELLOW}${total_cost * 12:.2f}{Colors.END}", file=out)
+        print(f"Regions scanned: {Colors.YELLOW}{', '.join(self.accessible_regions)}{Colors.END}", file=out)
         
         if all_clusters:
-            print(f"\n{Colors.BOLD}CLUSTER DETAILS{Colors.END}")
-            print(f"{Colors.BLUE}{'='*160}{Colors.END}")
-            print(f"  {'Cluster Name':<20} | {'Region':<12} | {'Version':<8} | {'Status':<8} | {'NG':<2} | {'Nodes':<3} | {'FG':<2} | {'Add':<2} | {'Access':<7} | {'Activity':<12} | {'Cost':<8} | {'Age':<4} | Safe")
-            print(f"  {'-'*20} | {'-'*12} | {'-'*8} | {'-'*8} | {'-'*2} | {'-'*3} | {'-'*2} | {'-'*2} | {'-'*7} | {'-'*12} | {'-'*8} | {'-'*4} | {'-'*4}")
+            print(f"\n{Colors.BOLD}CLUSTER DETAILS{Colors.END}", file=out)
+            print(SEP_BLUE_160, file=out)
+            print(DETAILS_HEADER, file=out)
+            print(DETAILS_RULE, file=out)
             
             # Sort by cost (highest first)
-            sorted_clusters = sorted(all_clusters, key=lambda x: -x['total_monthly_cost'])
+            sorted_clusters = sorted(all_clusters, key=operator.itemgetter('total_monthly_cost'), reverse=True)
             
             for cluster in sorted_clusters:
-                print(self.format_cluster_info(cluster))
+                print(self.format_cluster_info(cluster), file=out)
                 
                 # Show safety warnings
                 if cluster['safety']['warnings']:
                     for warning in cluster['safety']['warnings'][:2]:
-                        print(f"    {Colors.YELLOW}⚠ {warning}{Colors.END}")
+                        print(f"    {Colors.YELLOW}⚠ {warning}{Colors.END}", file=out)
             
             # Show cost breakdown
-            print(f"\n{Colors.BOLD}COST BREAKDOWN{Colors.END}")
-            total_control_plane = sum(c['control_plane_cost'] for c in all_clusters)
-            total_node_groups = sum(c['node_group_cost'] for c in all_clusters)
-            total_fargate = sum(c['fargate_cost'] for c in all_clusters)
-            
-            print(f"  Control Plane: ${total_control_plane:.2f}/month ({len(all_clusters)} clusters × $72/month)")
-            print(f"  Node Groups  : ${total_node_groups:.2f}/month")
-            print(f"  Fargate      : ${total_fargate:.2f}/month")
-            print(f"  Total        : ${total_cost:.2f}/month")
+            print(f"\n{Colors.BOLD}COST BREAKDOWN{Colors.END}", file=out)
+            print(f"  Control Plane: ${total_control_plane:.2f}/month ({len(all_clusters)} clusters × $72/month)", file=out)
+            print(f"  Node Groups  : ${total_node_groups:.2f}/month", file=out)
+            print(f"  Fargate      : ${total_fargate:.2f}/month", file=out)
+            print(f"  Total        : ${total_cost:.2f}/month", file=out)
+        
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
         
         return all_clusters
     
@@ -555,14 +905,14 @@ class EKSCleaner:
         empty_clusters = []
         
         for i, cluster in enumerate(clusters, 1):
-            safety_indicator = f"{Colors.RED}⚠{Colors.END}" if cluster['safety']['is_risky'] else f"{Colors.GREEN}✓{Colors.END}"
+            safety_indicator = RISKY_MARK if cluster['safety']['is_risky'] else SAFE_MARK
             monthly_cost = cluster['total_monthly_cost']
             
-            node_count = sum(ng.get('scalingConfig', {}).get('desiredSize', 0) for ng in cluster['node_groups'])
+            node_count = desired_nodes(cluster['node_groups'])
             
             activity_indicator = ""
-            if not cluster['activity'].get('has_recent_activity', False):
-                activity_indicator = f"{Colors.YELLOW}(INACTIVE){Colors.END}"
+            if self.is_inactive(cluster):
+                activity_indicator = INACTIVE_MARK
                 inactive_clusters.append(cluster['name'])
             
             if len(cluster['node_groups']) == 0:
@@ -617,120 +967,183 @@ class EKSCleaner:
                 except ValueError:
                     print(f"{Colors.RED}Invalid input. Please enter numbers separated by commas, 'all', 'inactive', 'empty', or 'safe'{Colors.END}")
     
-    def delete_node_groups(self, cluster_name: str, node_groups: List[Dict[str, Any]], region: str) -> bool:
+    def delete_and_wait(self, eks, cluster_name: str, delete, name_param: str, waiter_name: str, waiter_config: Dict[str, int],
+                        names: List[str], already_deleting: List[str]):
+        """Issue the deletes concurrently, then wait on every resource at once; raises a delete error before a wait error"""
+        with ThreadPoolExecutor(max_workers=min(DELETE_CONCURRENCY, len(names) + len(already_deleting))) as executor:
+            delete_futures = [executor.submit(delete, clusterName=cluster_name, **{name_param: name}) for name in names]
+            
+            # Resources whose delete was accepted are still waited on if another delete failed
+            errors = []
+            started = list(already_deleting)
+            for name, future in zip(names, delete_futures):
+                try:
+                    future.result()
+                    started.append(name)
+                except ClientError as e:
+                    errors.append(e)
+            
+            waiter = eks.get_waiter(waiter_name)
+            wait_futures = [executor.submit(waiter.wait, clusterName=cluster_name, WaiterConfig=waiter_config,
+                                            **{name_param: name}) for name in started]
+            # Every wait runs to completion, so a timed-out waiter can't hide the delete error
+            wait_errors = []
+            for future in wait_futures:
+                try:
+                    future.result()
+                except (WaiterError, ClientError) as e:
+                    wait_errors.append(e)
+        
+        if errors or wait_errors:
+            raise (errors + wait_errors)[0]
+    
+    def delete_node_groups(self, cluster_name: str, node_groups: List[Dict[str, Any]], region: str, out=None) -> bool:
         """Delete all node groups in a cluster"""
         if not node_groups:
             return True
         
         try:
-            eks = self.session.client('eks', region_name=region)
+            eks = self._client('eks', region)
             
-            print(f"    Deleting {len(node_groups)} node groups...")
+            # EKS accepts concurrent node group deletes, so all are issued at once and then waited on
+            # together; ones already being deleted are only waited on
+            print(f"    Deleting {len(node_groups)} node groups...", file=out)
+            ng_names = []
+            already_deleting = []
             for ng in node_groups:
                 ng_name = ng['nodegroupName']
-                print(f"      Deleting node group {ng_name}")
-                eks.delete_nodegroup(
-                    clusterName=cluster_name,
-                    nodegroupName=ng_name
-                )
+                if ng.get('status') == 'DELETING':
+                    print(f"      Waiting for node group {ng_name} (already deleting)", file=out)
+                    already_deleting.append(ng_name)
+                else:
+                    print(f"      Deleting node group {ng_name}", file=out)
+                    ng_names.append(ng_name)
             
-            # Wait for node groups to start deleting
-            print("    Waiting for node groups to begin deletion...")
-            time.sleep(30)
+            print("    Waiting for node groups to finish deleting...", file=out)
+            self.delete_and_wait(eks, cluster_name, eks.delete_nodegroup, 'nodegroupName', 'nodegroup_deleted',
+                                 NODEGROUP_WAITER_CONFIG, ng_names, already_deleting)
             
             return True
             
         except ClientError as e:
-            print(f"    {Colors.RED}Error deleting node groups: {e}{Colors.END}")
+            print(f"    {Colors.RED}Error deleting node groups: {e}{Colors.END}", file=out)
+            return False
+        except WaiterError as e:
+            print(f"    {Colors.RED}Node groups did not finish deleting: {e}{Colors.END}", file=out)
             return False
     
-    def delete_fargate_profiles(self, cluster_name: str, fargate_profiles: List[Dict[str, Any]], region: str) -> bool:
+    def delete_fargate_profiles(self, cluster_name: str, fargate_profiles: List[Dict[str, Any]], region: str, out=None) -> bool:
         """Delete all Fargate profiles in a cluster"""
         if not fargate_profiles:
             return True
         
         try:
-            eks = self.session.client('eks', region_name=region)
+            eks = self._client('eks', region)
+            
+            print(f"    Deleting {len(fargate_profiles)} Fargate profiles...", file=out)
+            waiter = eks.get_waiter('fargate_profile_deleted')
+            
+            # A profile already being deleted (e.g. by an interrupted run) would block the first new
+            # delete, so those are waited on first instead of being deleted again
+            already_deleting = [fp for fp in fargate_profiles if fp.get('status') == 'DELETING']
+            for fp in already_deleting:
+                fp_name = fp['fargateProfileName']
+                print(f"      Waiting for Fargate profile {fp_name} (already deleting)", file=out)
+                waiter.wait(
+                    clusterName=cluster_name,
+                    fargateProfileName=fp_name,
+                    WaiterConfig=FARGATE_WAITER_CONFIG
+                )
             
-            print(f"    Deleting {len(fargate_profiles)} Fargate profiles...")
             for fp in fargate_profiles:
+                if fp.get('status') == 'DELETING':
+                    continue
                 fp_name = fp['fargateProfileName']
-                print(f"      Deleting Fargate profile {fp_name}")
+                print(f"      Deleting Fargate profile {fp_name}", file=out)
                 eks.delete_fargate_profile(
                     clusterName=cluster_name,
                     fargateProfileName=fp_name
                 )
-            
-            # Wait for Fargate profiles to start deleting
-            print("    Waiting for Fargate profiles to begin deletion...")
-            time.sleep(20)
+                
+                # Only one profile per cluster can be deleting, so wait before issuing the next delete
+                waiter.wait(
+                    clusterName=cluster_name,
+                    fargateProfileName=fp_name,
+                    WaiterConfig=FARGATE_WAITER_CONFIG
+                )
             
             return True
             
         except ClientError as e:
-            print(f"    {Colors.RED}Error deleting Fargate profiles: {e}{Colors.END}")
+            print(f"    {Colors.RED}Error deleting Fargate profiles: {e}{Colors.END}", file=out)
+            return False
+        except WaiterError as e:
+            print(f"    {Colors.RED}Fargate profiles did not finish deleting: {e}{Colors.END}", file=out)
             return False
     
-    def delete_addons(self, cluster_name: str, addons: List[Dict[str, Any]], region: str) -> bool:
+    def delete_addons(self, cluster_name: str, addons: List[Dict[str, Any]], region: str, out=None) -> bool:
         """Delete all add-ons in a cluster"""
         if not addons:
             return True
         
         try:
-            eks = self.session.client('eks', region_name=region)
+            eks = self._client('eks', region)
             
-            print(f"    Deleting {len(addons)} add-ons...")
+            # Add-ons delete relatively quickly and independently: issue every delete at once, then poll
+            # until all are gone instead of a fixed pause
+            print(f"    Deleting {len(addons)} add-ons...", file=out)
+            addon_names = []
+            already_deleting = []
             for addon in addons:
                 addon_name = addon['addonName']
-                print(f"      Deleting add-on {addon_name}")
-                eks.delete_addon(
-                    clusterName=cluster_name,
-                    addonName=addon_name
-                )
+                if addon.get('status') == 'DELETING':
+                    print(f"      Waiting for add-on {addon_name} (already deleting)", file=out)
+                    already_deleting.append(addon_name)
+                else:
+                    print(f"      Deleting add-on {addon_name}", file=out)
+                    addon_names.append(addon_name)
             
-            # Add-ons delete relatively quickly
-            time.sleep(10)
+            self.delete_and_wait(eks, cluster_name, eks.delete_addon, 'addonName', 'addon_deleted',
+                                 ADDON_WAITER_CONFIG, addon_names, already_deleting)
             
             return True
             
         except ClientError as e:
-            print(f"    {Colors.RED}Error deleting add-ons: {e}{Colors.END}")
+            print(f"    {Colors.RED}Error deleting add-ons: {e}{Colors.END}", file=out)
+            return False
+        except WaiterError as e:
+            print(f"    {Colors.RED}Add-ons did not finish deleting: {e}{Colors.END}", file=out)
             return False
     
-    def delete_cluster(self, cluster: Dict[str, Any], dry_run: bool = False) -> bool:
+    def delete_cluster(self, cluster: Dict[str, Any], dry_run: bool = False, out=None) -> bool:
         """Delete an EKS cluster"""
         cluster_name = cluster['name']
         region = cluster['region']
         
         if dry_run:
-            print(f"  {Colors.BLUE}[DRY RUN] Would delete cluster {cluster_name} and all its resources{Colors.END}")
+            print(f"  {Colors.BLUE}[DRY RUN] Would delete cluster {cluster_name} and all its resources{Colors.END}", file=out)
             return True
         
         try:
-            eks = self.session.client('eks', region_name=region)
+            eks = self._client('eks', region)
             
             # Delete add-ons first
             if cluster['addons']:
-                if not self.delete_addons(cluster_name, cluster['addons'], region):
+                if not self.delete_addons(cluster_name, cluster['addons'], region, out):
                     return False
             
             # Delete Fargate profiles
             if cluster['fargate_profiles']:
-                if not self.delete_fargate_profiles(cluster_name, cluster['fargate_profiles'], region):
+                if not self.delete_fargate_profiles(cluster_name, cluster['fargate_profiles'], region, out):
                     return False
             
             # Delete node groups
             if cluster['node_groups']:
-                if not self.delete_node_groups(cluster_name, cluster['node_groups'], region):
+                if not self.delete_node_groups(cluster_name, cluster['node_groups'], region, out):
                     return False
             
-            # Wait longer for resources to finish deleting
-            if cluster['node_groups'] or cluster['fargate_profiles']:
-                print(f"    Waiting for cluster resources to finish deleting...")
-                time.sleep(60)  # EKS resources take time to delete
-            
-            # Finally delete the cluster
-            print(f"    Deleting cluster {cluster_name}...")
+            # Finally delete the cluster (the helpers above return once their resources are gone)
+            print(f"    Deleting cluster {cluster_name}...", file=out)
             eks.delete_cluster(name=cluster_name)
             
             return True
@@ -738,15 +1151,45 @@ class EKSCleaner:
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == 'ResourceNotFoundException':
-                print(f"  {Colors.YELLOW}Cluster {cluster_name} not found (already deleted?){Colors.END}")
+                print(f"  {Colors.YELLOW}Cluster {cluster_name} not found (already deleted?){Colors.END}", file=out)
                 return True
             elif error_code == 'ResourceInUseException':
-                print(f"  {Colors.RED}Cluster {cluster_name} still has resources that need to be deleted{Colors.END}")
+                print(f"  {Colors.RED}Cluster {cluster_name} still has resources that need to be deleted{Colors.END}", file=out)
                 return False
             else:
-                print(f"  {Colors.RED}Error deleting {cluster_name}: {e}{Colors.END}")
+                print(f"  {Colors.RED}Error deleting {cluster_name}: {e}{Colors.END}", file=out)
                 return False
     
+    def delete_and_report(self, index: int, total: int, cluster: Dict[str, Any], dry_run: bool = False) -> tuple:
+        """Delete one cluster, returning (cluster, success, buffered progress output)"""
+        out = io.StringIO()
+        cluster_name = cluster['name']
+        
+        node_count = desired_nodes(cluster['node_groups'])
+        
+        print(f"\n[{index}/{total}] Processing cluster: {cluster_name}", file=out)
+        print(f"  Region: {cluster['region']}, Nodes: {node_count}, Cost: ${cluster['total_monthly_cost']:.2f}/month", file=out)
+        print(f"  Node groups: {len(cluster['node_groups'])}, Fargate profiles: {len(cluster['fargate_profiles'])}", file=out)
+        
+        # Show warnings
+        if cluster['safety']['warnings']:
+            for warning in cluster['safety']['warnings'][:3]:
+                print(f"  {Colors.YELLOW}⚠ {warning}{Colors.END}", file=out)
+        
+        # Anything delete_cluster doesn't handle (e.g. a read timeout) fails just this cluster
+        try:
+            success = self.delete_cluster(cluster, dry_run, out)
+        except Exception as e:
+            print(f"  {Colors.RED}Error deleting {cluster_name}: {e}{Colors.END}", file=out)
+            success = False
+        if success:
+            success_text = "Would delete" if dry_run else "Successfully started deletion of"
+            print(f"  {Colors.GREEN}✓ {success_text} {cluster_name}{Colors.END}", file=out)
+        else:
+            print(f"  {Colors.RED}✗ Failed to delete {cluster_name}{Colors.END}", file=out)
+        
+        return cluster, success, out.getvalue()
+    
     def delete_clusters(self, clusters: List[Dict[str, Any]], selected_cluster_names: List[str], dry_run: bool = False):
         """Delete selected clusters"""
         clusters_to_delete = [cluster for cluster in clusters if cluster['name'] in selected_cluster_names]
@@ -763,38 +1206,27 @@ class EKSCleaner:
             print(f"{Colors.RED}THIS ACTION CANNOT BE UNDONE!{Colors.END}")
         print(f"{Colors.RED}{'='*80}{Colors.END}")
         
+        # Clusters are torn down concurrently (each mostly waits on EKS); each one's progress is
+        # buffered and printed as a block when it finishes
         deleted_count = 0
         failed_count = 0
         total_savings = 0
         
-        for i, cluster in enumerate(clusters_to_delete, 1):
-            cluster_name = cluster['name']
-            region = cluster['region']
-            monthly_cost = cluster['total_monthly_cost']
-            
-            node_count = sum(ng.get('scalingConfig', {}).get('desiredSize', 0) for ng in cluster['node_groups'])
-            
-            print(f"\n[{i}/{len(clusters_to_delete)}] Processing cluster: {cluster_name}")
-            print(f"  Region: {region}, Nodes: {node_count}, Cost: ${monthly_cost:.2f}/month")
-            print(f"  Node groups: {len(cluster['node_groups'])}, Fargate profiles: {len(cluster['fargate_profiles'])}")
-            
-            # Show warnings
-            if cluster['safety']['warnings']:
-                for warning in cluster['safety']['warnings'][:3]:
-                    print(f"  {Colors.YELLOW}⚠ {warning}{Colors.END}")
-            
-            if self.delete_cluster(cluster, dry_run):
-                success_text = "Would delete" if dry_run else "Successfully started deletion of"
-                print(f"  {Colors.GREEN}✓ {success_text} {cluster_name}{Colors.END}")
-                deleted_count += 1
-                total_savings += monthly_cost
-            else:
-                print(f"  {Colors.RED}✗ Failed to delete {cluster_name}{Colors.END}")
-                failed_count += 1
-            
-            # Longer delay for EKS operations
-            if not dry_run:
-                time.sleep(10)
+        total = len(clusters_to_delete)
+        if total > 1 and not dry_run:
+            print(f"\n{Colors.BLUE}Processing {total} clusters in parallel; each cluster's progress is shown when it finishes{Colors.END}")
+        with ThreadPoolExecutor(max_workers=min(DELETE_CLUSTER_CONCURRENCY, total)) as executor:
+            futures = [executor.submit(self.delete_and_report, i, total, cluster, dry_run)
+                       for i, cluster in enumerate(clusters_to_delete, 1)]
+            for future in as_completed(futures):
+                cluster, success, report = future.result()
+                sys.stdout.write(report)
+                sys.stdout.flush()
+                if success:
+                    deleted_count += 1
+                    total_savings += cluster['total_monthly_cost']
+                else:
+                    failed_count += 1
         
         # Final summary
         print(f"\n{Colors.BOLD}{'DRY RUN ' if dry_run else ''}DELETION SUMMARY{Colors.END}")
@@ -833,7 +1265,7 @@ class EKSCleaner:
         # Show deletion options
         total_cost = sum(cluster['total_monthly_cost'] for cluster in clusters)
         risky_count = sum(1 for cluster in clusters if cluster['safety']['is_risky'])
-        inactive_count = sum(1 for cluster in clusters if not cluster['activity'].get('has_recent_activity', False))
+        inactive_count = sum(1 for cluster in clusters if self.is_inactive(cluster))
         empty_count = sum(1 for cluster in clusters if len(cluster['node_groups']) == 0)
         
         print(f"\n{Colors.YELLOW}⚠️  DELETION OPTIONS{Colors.END}")
@@ -886,6 +1318,7 @@ Examples:
   python3 eks_cleanup.py                          # Use default AWS profile
   python3 eks_cleanup.py --profile dev            # Use specific profile
   python3 eks_cleanup.py --dry-run                # Test mode - no actual deletions
+  python3 eks_cleanup.py --refresh-activity       # Ignore CloudTrail activity cached within the last hour
   
 Features:
   - Lists all EKS clusters with detailed cost analysis
@@ -912,10 +1345,16 @@ Warning:
         help='Dry run mode - show what would be deleted without actually deleting'
     )
     
+    parser.add_argument(
+        '--refresh-activity',
+        action='store_true',
+        help='Look up CloudTrail activity again instead of using the cache (kept for an hour)'
+    )
+    
     args = parser.parse_args()
     
     try:
-        cleaner = EKSCleaner(profile_name=args.profile)
+        cleaner = EKSCleaner(profile_name=args.profile, refresh_activity=args.refresh_activity)
         cleaner.run(dry_run=args.dry_run)
     except KeyboardInterrupt:
         print(f"\n{Colors.YELLOW}Operation cancelled by user (Ctrl+C){Colors.END}")